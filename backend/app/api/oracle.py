@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
 from oracle.pipeline import evaluate_oracle_request
+from oracle.telemetry import get_telemetry
 
 router = APIRouter(prefix="/api/oracle", tags=["Oracle"])
 
@@ -24,6 +25,20 @@ async def evaluate(request: Dict[str, Any]):
             
         result = evaluate_oracle_request(request)
         return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # Invalid request fields (e.g. seed)
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         # In production, we'd log the traceback
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/telemetry")
+async def telemetry():
+    """
+    Aggregated Oracle telemetry since process start: request and cache-hit
+    counts, risk-zone counts, timing histogram (ms) and dropped events.
+    """
+    return get_telemetry().snapshot()
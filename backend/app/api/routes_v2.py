@@ -6,68 +6,24 @@ Implements:
 - /api/v2/tokens/balance
 - /api/v2/tokens/ledger
 - /api/v2/tokens/topup
+- /api/v2/admin/tokens/audit
 - /api/v2/health
 """
 
-from fastapi import APIRouter, HTTPException, Header, status
-from typing import Optional, Dict, Any
+import logging
+import os
+import random
+
+from fastapi import APIRouter, HTTPException, Header, Query, status
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
 
-# --- SIM_KERNEL_SERVICES (autogen) ---
-from app.core.engine import simulate_event_v2 as _simulate_event_v2_orig
-from app.core.explain import explain as _explain_orig
-
-def _mc_engine_service(request, features, rating, seed, depth, max_runs):
-    """Wrapper around existing simulate_event_v2. Must honor max_runs."""
-    # Map request dict to EventInput + SimulationConfig as existing code does
-    from app.api.schemas import EventInput, SimulationConfig as SimConfig
-    
-    event = EventInput(
-        home_team=request.get("home_team", "Home"),
-        away_team=request.get("away_team", "Away"),
-        sport=request.get("sport", "FOOTBALL"),
-        event_id=request.get("event_id", ""),
-        home_rating=request.get("home_rating", 1500.0),
-        away_rating=request.get("away_rating", 1500.0),
-        home_advantage=request.get("home_advantage", 0.0)
-    )
-    
-    # Honor max_runs budget
-    config_dict = request.get("config", {})
-    config_dict["n_simulations"] = min(max_runs, config_dict.get("n_simulations", 1000))
-    if seed:
-        config_dict["seed"] = seed
-    config = SimConfig(**config_dict)
-    
-    # Call existing engine
-    dist = _simulate_event_v2_orig(event, config)
-    
-    # Return distribution object wrapped for kernel
-    return {"distribution": dist, "seed": config.seed, "n_simulations": config.n_simulations}
-
-def _explainer_service(request, features, rating, mc_result, max_chars):
-    """Wrapper around existing explain(). Must honor max_chars."""
-    # The explain function in app.core.explain expects different args
-    # Since we're in a kernel wrapper context, we skip explanation for now
-    # TODO: Wire proper explain call when needed
-    return {"summary": "Explanation placeholder", "max_chars": max_chars}
-
-def _response_mapper_service(state):
-    """
-    Map SimulationState -> EXISTING /api/v2/simulate response shape.
-    CRITICAL: This must produce the exact same dict structure as before kernel integration.
-    The only permitted additions are optional keys inside response['meta'].
-    """
-    # Return the pre-kernel response stashed during endpoint execution
-    # This ensures 100% backward compatibility
-    return state.artifacts.get('pre_kernel_response') or {}
-# --- /SIM_KERNEL_SERVICES (autogen) ---
-
-
-from app.api.schemas import EventInput, SimulationConfig
+from app.api.schemas import EventInput, SimulationConfig, SensitivityFactor
+from app.core.engine import simulate_event_v2, simulate_outcomes_batch, simulate_outcomes_stream
 from app.core.distribution import DistributionObject
 from app.core.uncertainty import compute_all_uncertainty_metrics, UncertaintyMetrics
+from app.core.explain import calculate_sensitivity
 from app.core.tokens import (
     get_ledger,
     require_tokens,
@@ -80,15 +36,25 @@ from app.core.tokens import (
 
 from app.sim_kernel.kernel import TricksterKernel
 from app.sim_kernel.state import SimulationState
-from app.sim_kernel.config import SimulationConfig as KernelSimulationConfig
-from app.sim_kernel.actions.ingest import IngestAction
-from app.sim_kernel.actions.mc_run import MonteCarloAction
-from app.sim_kernel.actions.explain import ExplainAction
-from app.sim_kernel.actions.emit import EmitAction
+from app.sim_kernel.store import get_journal_store
+from app.sim_kernel.profiling import profiler_for_request
+from app.sim_kernel.config import Budget, SimulationConfig as KernelSimulationConfig
+from app.sim_kernel.actions import build_pipeline
 
 
 router = APIRouter(prefix="/api/v2", tags=["v2"])
 
+logger = logging.getLogger(__name__)
+
+# Fraction of seeded requests re-simulated outside the kernel to check parity
+SIM_KERNEL_SHADOW_RATE = float(os.getenv("SIM_KERNEL_SHADOW_RATE", "0.01"))
+# Fraction of requests profiled per kernel step when no X-Sim-Profile header is honoured
+SIM_KERNEL_PROFILE_RATE = float(os.getenv("SIM_KERNEL_PROFILE_RATE", "0"))
+# The X-Sim-Profile header is ignored unless this is enabled server-side
+SIM_KERNEL_PROFILE_HEADER = os.getenv("SIM_KERNEL_PROFILE_HEADER", "0").lower() in ("1", "true", "yes")
+# /admin/tokens/audit exposes every user's transactions; it answers 403 unless enabled server-side
+TOKEN_AUDIT_ENABLED = os.getenv("TOKEN_AUDIT_ENABLED", "0").lower() in ("1", "true", "yes")
+
 
 # --------------------
 # Request/Response Models
@@ -133,6 +99,7 @@ class FullDistributionResponse(BaseModel):
     transaction_id: str
     user_status: UserStatus
     notes: str
+    sensitivity: Optional[List[SensitivityFactor]] = None
 
 
 class TokenBalanceResponse(BaseModel):
@@ -148,6 +115,18 @@ class TokenLedgerResponse(BaseModel):
     transactions: list[TokenTransaction]
 
 
+class TokenAuditEntry(BaseModel):
+    """One entry of the global token audit stream"""
+    entry_id: str
+    transaction: TokenTransaction
+
+
+class TokenAuditPageResponse(BaseModel):
+    """Cursor-paginated page of the global token audit stream"""
+    entries: list[TokenAuditEntry]
+    next_cursor: Optional[str] = None
+
+
 class TopUpRequest(BaseModel):
     """Top-up request"""
     user_id: str
@@ -176,6 +155,141 @@ DEPTH_TO_TIER = {
 }
 
 
+# --------------------
+# Kernel Execution
+# --------------------
+
+def _event_from_request(request: Dict[str, Any]) -> EventInput:
+    return EventInput(
+        home_team=request.get("home_team", "Home"),
+        away_team=request.get("away_team", "Away"),
+        sport=request.get("sport", "FOOTBALL"),
+        event_id=request.get("event_id", ""),
+        home_rating=request.get("home_rating", 1500.0),
+        away_rating=request.get("away_rating", 1500.0),
+        home_advantage=request.get("home_advantage", 0.0)
+    )
+
+
+def _mc_engine_service(request, features, rating, seed, depth, max_runs, deadline=None):
+    """
+    Kernel mc_engine service: runs simulate_event_v2 once, honoring max_runs.
+
+    Given a step deadline, the engine samples in chunks and stops early;
+    ``n_simulations`` is then the runs achieved.
+    """
+    event = _event_from_request(request)
+
+    config_dict = dict(request.get("config") or {})
+    config_dict["n_simulations"] = min(max_runs, config_dict.get("n_simulations", 1000))
+    # An explicit seed in the request (even None) wins over the kernel seed
+    if "seed" not in config_dict:
+        config_dict["seed"] = seed
+    config = SimulationConfig(**config_dict)
+
+    dist = simulate_event_v2(event, config, deadline=deadline)
+    return {"distribution": dist, "seed": config.seed, "n_simulations": dist.n_sims}
+
+
+def _mc_engine_stream_service(request, features, rating, seed, depth, max_runs, chunk_runs):
+    """
+    Kernel mc_engine_stream service: base-scenario runs in chunks of ``chunk_runs``.
+
+    Yields cumulative summaries (see simulate_outcomes_stream), so the
+    round-robin scheduler can pause the step between chunks; the last one is
+    final. Runs and seed follow the request config like ``mc_engine``.
+    """
+    config_dict = dict(request.get("config") or {})
+    n_simulations = min(max_runs, config_dict.get("n_simulations", 1000))
+    run_seed = config_dict["seed"] if "seed" in config_dict else seed
+    for partial in simulate_outcomes_stream(_event_from_request(request), n_simulations, chunk_runs, seed=run_seed):
+        yield {**partial, "seed": run_seed}
+
+
+def _mc_engine_batch_service(requests, features, ratings, seed, depth, max_runs):
+    """
+    Kernel mc_engine_batch service: simulates a slate in one simulate_outcomes_batch call.
+
+    Every request gets ``max_runs`` base-scenario runs from the kernel seed;
+    results carry the outcome probabilities and summary stats, not a full
+    DistributionObject (use ``mc_engine`` per request for that).
+    """
+    cols = simulate_outcomes_batch([_event_from_request(r) for r in requests], n_simulations=max_runs, seed=seed)
+    return [
+        {**{name: float(values[i]) for name, values in cols.items()}, "seed": seed, "n_simulations": max_runs}
+        for i in range(len(requests))
+    ]
+
+
+_SIM_ACTIONS = ("ingest", "monte_carlo")
+
+
+def _shadow_check(event: EventInput, config: SimulationConfig, dist: DistributionObject) -> None:
+    """Re-run the engine outside the kernel and log any divergence (seeded runs only)."""
+    try:
+        expected = simulate_event_v2(event, config)
+        if abs(expected.mean - dist.mean) > 1e-9 or abs(expected.stdev - dist.stdev) > 1e-9:
+            logger.warning(
+                f"sim_kernel shadow mismatch for {event.event_id}: "
+                f"kernel mean={dist.mean:.6f} engine mean={expected.mean:.6f}"
+            )
+    except Exception as e:
+        logger.warning(f"sim_kernel shadow check failed: {e}")
+
+
+def run_simulation(event: EventInput, config: SimulationConfig, profile: Optional[str] = None) -> DistributionObject:
+    """
+    Simulate an event through the sim kernel.
+
+    The Monte Carlo step runs exactly once, for the full ``n_simulations``
+    (deadline sizing is off). Its distribution is returned as-is. If the
+    kernel step fails, the engine is called directly so the endpoint keeps
+    working. A ``SIM_KERNEL_SHADOW_RATE`` sample of seeded
+    requests is re-simulated outside the kernel to check parity. Journals
+    are persisted when ``SIM_KERNEL_JOURNAL_DB`` is set.
+
+    ``profile`` is the X-Sim-Profile header value ("1" for timing, "memory"
+    to also trace allocations), honoured only when ``SIM_KERNEL_PROFILE_HEADER``
+    is enabled; otherwise ``SIM_KERNEL_PROFILE_RATE`` of requests are timed.
+    Profiled step counters are logged and persisted.
+    """
+    kernel_config = KernelSimulationConfig(
+        # Callers get exactly the n_simulations they asked for: no deadline sizing
+        budget=Budget(max_mc_runs=config.n_simulations, size_mc_to_deadline=False),
+        **({"seed": config.seed} if config.seed is not None else {}),
+    )
+    state = SimulationState(request={**event.model_dump(), "config": config.model_dump()})
+    kernel = TricksterKernel(
+        services={
+            "mc_engine": _mc_engine_service,
+            "mc_engine_batch": _mc_engine_batch_service,
+            "mc_engine_stream": _mc_engine_stream_service,
+        },
+        sink=get_journal_store(),
+        profiler=profiler_for_request(profile, SIM_KERNEL_PROFILE_RATE, allow_header=SIM_KERNEL_PROFILE_HEADER),
+    )
+    state, journal = kernel.run(build_pipeline(_SIM_ACTIONS), state, kernel_config)
+    if kernel.profiler is not None:
+        logger.info(
+            f"sim_kernel profile run={journal.run_id} "
+            + " ".join(f"{s.name}:wall_ns={s.wall_ns},cpu_ns={s.cpu_ns},alloc_peak={s.alloc_peak_bytes}" for s in journal.steps)
+        )
+
+    dist = (state.mc_result or {}).get("distribution")
+    if not isinstance(dist, DistributionObject):
+        failed = [step for step in journal.steps if step.status == "FAIL"]
+        logger.warning(
+            f"sim_kernel run {journal.run_id} produced no distribution "
+            f"({', '.join(f'{s.name}: {s.error_type}' for s in failed) or 'no mc_result'}); "
+            "falling back to direct engine call"
+        )
+        return simulate_event_v2(event, config)
+
+    if config.seed is not None and random.random() < SIM_KERNEL_SHADOW_RATE:
+        _shadow_check(event, config, dist)
+    return dist
+
+
 # --------------------
 # Endpoints
 # --------------------
@@ -185,7 +299,8 @@ async def simulate_v2(
     request: SimulateRequestV2,
     x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
     x_idempotency_key: Optional[str] = Header(None, alias="X-Idempotency-Key"),
-    authorization: Optional[str] = Header(None)
+    authorization: Optional[str] = Header(None),
+    x_sim_profile: Optional[str] = Header(None, alias="X-Sim-Profile")
 ):
     """
     POST /api/v2/simulate
@@ -248,7 +363,7 @@ async def simulate_v2(
         config = SimulationConfig(**(request.config or {}))
         
         # Run simulation (lightweight)
-        dist = simulate_event_v2(event, config)
+        dist = run_simulation(event, config, profile=x_sim_profile)
         
         # Return headline pick (median + confidence)
         confidence = "high" if dist.stdev < 0.1 else "moderate" if dist.stdev < 0.2 else "low"
@@ -342,7 +457,7 @@ async def simulate_v2(
     config = SimulationConfig(**(request.config or {}))
     
     # Run full simulation
-    dist = simulate_event_v2(event, config)
+    dist = run_simulation(event, config, profile=x_sim_profile)
     
     # Compute uncertainty (requires raw distribution values)
     # For now, use placeholder features
@@ -370,40 +485,14 @@ async def simulate_v2(
         event_horizon_days=7.0
     )
     
+    # What-if factors for the deep-dive tier (analytic model, one vectorized call)
+    sensitivity = None
+    if tier == FeatureTier.DEEP_DIVE_EDUCATIONAL:
+        sensitivity = calculate_sensitivity({}, event.model_dump()) or None
+    
     # Record analysis (increments daily_used and sets cooldown)
     new_status = ledger.record_analysis(x_user_id)
-        # --- SIM_KERNEL_INTEGRATION (autogen) ---
-    # Kernel integration is designed to be non-breaking.
-    # Steps:
-    #  1) Compute the pre-kernel response using existing logic (already done above).
-    #  2) Run kernel pipeline to attach observability meta only.
-    #
-    # REQUIRED: ensure `pre_kernel_response` exists before this block.
-    try:
-        # Build kernel config from request if possible; otherwise default.
-        _kcfg = KernelSimulationConfig(
-            scheduler='FIFO',
-            seed=int(getattr(request, 'seed', 1337)) if hasattr(request, 'seed') else 1337,
-            depth='standard',
-        )
-        _kstate = SimulationState(request=(request.dict() if hasattr(request, 'dict') else request))
-        # Stash the already-built response to guarantee exact response shape.
-        _kstate.artifacts['pre_kernel_response'] = locals().get('response') or locals().get('resp') or locals().get('result')
-        _kernel = TricksterKernel(services={
-            'mc_engine': _mc_engine_service,
-            'explainer': _explainer_service,
-            'response_mapper': _response_mapper_service,
-        })
-        _actions = [IngestAction(), MonteCarloAction(), ExplainAction(), EmitAction()]
-        _kstate2, _journal = _kernel.run(_actions, _kstate, _kcfg)
-        # Replace outgoing response with kernel-emitted response (identical shape, with optional meta additions).
-        _kernel_response = _kstate2.artifacts.get('response')
-        if isinstance(_kernel_response, dict):
-            response = _kernel_response
-    except Exception:
-        # Non-breaking guarantee: if anything fails, keep original response.
-        pass
-    # --- /SIM_KERNEL_INTEGRATION (autogen) ---
+    
 
     return FullDistributionResponse(
         distribution=dist,
@@ -411,7 +500,8 @@ async def simulate_v2(
         cost_tokens=transaction.cost,
         transaction_id=transaction.transaction_id,
         user_status=new_status,
-        notes=f"Full {tier.value} analysis"
+        notes=f"Full {tier.value} analysis",
+        sensitivity=sensitivity
     )
 
 
@@ -445,6 +535,34 @@ async def get_ledger_history(
     )
 
 
+@router.get("/admin/tokens/audit")
+async def get_token_audit(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    authorization: Optional[str] = Header(None, alias="Authorization")
+):
+    """
+    GET /api/v2/admin/tokens/audit
+    
+    Admin endpoint: pages through all token transactions, oldest first.
+    Pass the returned next_cursor to fetch the following page.
+    Disabled (403) unless ``TOKEN_AUDIT_ENABLED`` is set on the server.
+    """
+    # There is no admin authorization yet (see /tokens/topup), so the server flag is the gate
+    if not TOKEN_AUDIT_ENABLED:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Token audit is disabled on this server")
+    ledger = get_ledger()
+    try:
+        page, next_cursor = ledger.get_audit_page(cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return TokenAuditPageResponse(
+        entries=[TokenAuditEntry(entry_id=entry_id, transaction=tx) for entry_id, tx in page],
+        next_cursor=next_cursor
+    )
+
+
 @router.post("/tokens/topup")
 async def topup_tokens(
     request: TopUpRequest,
@@ -0,0 +1,138 @@
+"""
+Token Audit Export
+
+Bulk-exports the global token audit stream (``tokens:audit``) into the SQL
+``LedgerEntry`` table in batches.
+
+With Redis, entries are read through a consumer group, so several exporters
+can share the work. Each batch is acknowledged only after its SQL commit
+succeeds; unacknowledged entries are re-delivered to the same consumer on the
+next run. With the in-memory ledger, the exporter pages with the audit cursor,
+which only advances past a batch once its commit succeeds.
+"""
+
+import logging
+from typing import Any, List, Optional, Tuple
+
+from app.core.redis_ledger import AUDIT_STREAM_KEY
+from app.core.token_types import AUDIT_PAGE_MAX, TokenTransaction
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPE = "TOKEN_TRANSACTION"
+
+
+class AuditStreamExporter:
+    """
+    Moves audit stream entries into SQL ``LedgerEntry`` rows.
+
+    Args:
+        ledger: TokenLedger or RedisTokenLedger exposing get_audit_page()
+        session: SQLAlchemy session
+        model: ORM class with (timestamp, event_type, data) columns;
+               defaults to core.db.models.LedgerEntry
+        group: Redis consumer group name
+        consumer: Consumer name within the group
+        batch_size: Entries per SQL commit
+    """
+
+    def __init__(
+        self,
+        ledger: Any,
+        session: Any,
+        model: Any = None,
+        group: str = "sql-export",
+        consumer: str = "exporter-1",
+        batch_size: int = 500,
+    ):
+        if model is None:
+            from core.db.models import LedgerEntry as model
+        self.ledger = ledger
+        self.session = session
+        self.model = model
+        self.group = group
+        self.consumer = consumer
+        self.batch_size = max(1, min(int(batch_size), AUDIT_PAGE_MAX))
+        self._cursor: Optional[str] = None
+        self._group_ready = False
+        self._pending_checked = False
+
+    @property
+    def _use_redis(self) -> bool:
+        return bool(getattr(self.ledger, "use_redis", False))
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.ledger.client.xgroup_create(AUDIT_STREAM_KEY, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def _read_batch(self) -> Tuple[List[Tuple[str, TokenTransaction]], Optional[str]]:
+        """Next batch and, on the in-memory path, the cursor to resume from once it is committed."""
+        if not self._use_redis:
+            page, _ = self.ledger.get_audit_page(cursor=self._cursor, limit=self.batch_size)
+            return page, (page[-1][0] if page else self._cursor)
+
+        self._ensure_group()
+        # Re-deliver our own unacknowledged entries first (crash between commit and XACK)
+        stream_id = ">" if self._pending_checked else "0"
+        response = self.ledger.client.xreadgroup(
+            self.group, self.consumer, {AUDIT_STREAM_KEY: stream_id}, count=self.batch_size
+        )
+        entries = response[0][1] if response else []
+        if not entries and not self._pending_checked:
+            self._pending_checked = True
+            return self._read_batch()
+        return [
+            (entry_id, TokenTransaction.model_validate_json(fields["tx"]))
+            for entry_id, fields in entries
+        ], None
+
+    def run_once(self) -> int:
+        """Export one batch. Returns the number of rows written."""
+        batch, next_cursor = self._read_batch()
+        if not batch:
+            return 0
+
+        rows = [
+            self.model(
+                timestamp=tx.timestamp,
+                event_type=EVENT_TYPE,
+                data={**tx.model_dump(mode="json"), "stream_id": entry_id},
+            )
+            for entry_id, tx in batch
+        ]
+        try:
+            self.session.add_all(rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            # The batch stays pending in the group; read it again on the next run
+            self._pending_checked = False
+            raise
+
+        # Advance only after the commit, so a failed batch is read again
+        if self._use_redis:
+            self.ledger.client.xack(AUDIT_STREAM_KEY, self.group, *[entry_id for entry_id, _ in batch])
+        else:
+            self._cursor = next_cursor
+        return len(rows)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """Export batches until the stream is caught up (or max_batches is reached)."""
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            written = self.run_once()
+            if not written:
+                break
+            total += written
+            batches += 1
+        if total:
+            logger.info(f"Exported {total} token audit entries to SQL")
+        return total
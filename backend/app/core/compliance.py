@@ -0,0 +1,19 @@
+"""
+Compliance Scanner - backend entry point
+
+TermScanner and iter_strings live in the repository's root core/compliance.py,
+shared with the oracle and exporter packages. The repository root is
+appended to sys.path (as app.api.oracle does) so the backend imports that
+one implementation.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from core.compliance import TermScanner, iter_strings
+
+__all__ = ["TermScanner", "iter_strings"]
@@ -13,7 +13,7 @@ CRITICAL ENHANCEMENTS:
 import time
 import numpy as np
 import math
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from scipy import stats
 
 # Import distribution classes directly
@@ -28,10 +28,17 @@ from app.core.distribution import (
 )
 from app.core.spectral import analyze_mc_spectral_quality
 
+# Samples drawn per deadline check when simulate_event_v2() is given a deadline
+DEADLINE_CHUNK_RUNS = 100
+# Logistic draws of n_simulations samples per simulate_event_v2() call (3 scenarios x 2, plus the base re-run)
+_DRAWS_PER_EVENT = 7
+
 def simulate_event_v2(
     event, 
-    config
-) -> DistributionObject:
+    config,
+    return_samples: bool = False,
+    deadline: Optional[float] = None
+) -> Union[DistributionObject, Tuple[DistributionObject, np.ndarray]]:
     """
     Run Monte Carlo simulation V2 with full distribution output.
     
@@ -45,6 +52,15 @@ def simulate_event_v2(
     - 3 scenarios (conservative, base, aggressive)
     - Reproducibility guarantee (deterministic seed)
     
+    With return_samples=True, returns (DistributionObject, samples), where
+    samples is the base-scenario value array the stats were computed from.
+    
+    With a deadline (a time.perf_counter() value), runs are sized live: the
+    first scenario is sampled in chunks of DEADLINE_CHUNK_RUNS, stopping once
+    the measured pace would overrun the deadline, and the rest of the
+    simulation uses the runs achieved (reported as n_sims, at least one
+    chunk). Runs that fit are drawn exactly as without a deadline.
+    
     BACKWARDS COMPATIBILITY:
     - simulate_event() (V1) remains for existing endpoints
     - New endpoints use simulate_event_v2()
@@ -58,13 +74,22 @@ def simulate_event_v2(
     if config.seed is not None:
         np.random.seed(config.seed)
     
+    first_values = None
+    if deadline is not None:
+        first_values = _sample_to_deadline(event, config, SCENARIO_DEFINITIONS["conservative"], deadline)
+        if first_values.size < config.n_simulations:
+            config = config.model_copy(update={"n_simulations": int(first_values.size)})
+    
     # Generate all 3 scenarios
     scenarios: List[Scenario] = []
     all_scenario_values = []
     
     for scenario_name in ["conservative", "base", "aggressive"]:
         scenario_params = SCENARIO_DEFINITIONS[scenario_name]
-        scenario_result = _run_single_scenario(event, config, scenario_params)
+        scenario_result = _run_single_scenario(
+            event, config, scenario_params,
+            mapped_values=first_values if scenario_name == "conservative" else None
+        )
         scenarios.append(scenario_result)
         
         # Collect values from base scenario for overall stats
@@ -118,17 +143,119 @@ def simulate_event_v2(
         execution_time_ms=execution_time
     )
     
+    if return_samples:
+        return distribution_obj, raw_values
     return distribution_obj
 
 
+def simulate_outcomes_batch(
+    events: Sequence,
+    n_simulations: int,
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized base-scenario simulation for a slate of events.
+
+    Draws every event in one (n_events, n_simulations) logistic sample
+    instead of one simulate_event_v2() call per event. Scenarios, spectral
+    calibration and zeta entropy are not applied; use simulate_event_v2()
+    when a full DistributionObject is needed.
+
+    Args:
+        events: EventInput-like objects (home_rating, away_rating, home_advantage)
+        n_simulations: Samples per event
+        seed: Seed for a local Generator (global numpy state is untouched)
+
+    Returns:
+        Columnar dict, one entry per event: prob_home, prob_draw, prob_away,
+        mean, stdev, p5, p25, p50, p75, p95 (of the mapped [0,1] values)
+    """
+    params = SCENARIO_DEFINITIONS["base"]
+    SCALE = 400.0 / math.log(10.0) * params.scale_multiplier
+    DRAW_BASE_PROB = 0.25
+    threshold = -SCALE * math.log((1 - DRAW_BASE_PROB) / (1 + DRAW_BASE_PROB))
+
+    expected_diff = np.array(
+        [e.home_rating + (e.home_advantage or 0.0) - e.away_rating for e in events],
+        dtype=np.float64
+    )
+    rng = np.random.default_rng(seed)
+    simulated_diffs = rng.logistic(
+        loc=expected_diff[:, None],
+        scale=SCALE * math.sqrt(params.variance_multiplier),
+        size=(expected_diff.size, int(n_simulations))
+    )
+    return _summarize_outcomes(simulated_diffs, threshold)
+
+
+def simulate_outcomes_stream(
+    event,
+    n_simulations: int,
+    chunk_size: int,
+    seed: Optional[int] = None
+) -> Iterator[Dict[str, float]]:
+    """
+    Chunked base-scenario simulation for one event, for resumable callers.
+
+    Draws chunk_size samples at a time and yields the summary over all
+    samples drawn so far (the same fields as simulate_outcomes_batch, plus
+    n_simulations). The draws come from one local Generator, so the last
+    summary equals simulate_outcomes_batch([event], n_simulations, seed).
+    """
+    params = SCENARIO_DEFINITIONS["base"]
+    SCALE = 400.0 / math.log(10.0) * params.scale_multiplier
+    DRAW_BASE_PROB = 0.25
+    threshold = -SCALE * math.log((1 - DRAW_BASE_PROB) / (1 + DRAW_BASE_PROB))
+
+    expected_diff = event.home_rating + (event.home_advantage or 0.0) - event.away_rating
+    rng = np.random.default_rng(seed)
+    simulated_diffs = np.empty(int(n_simulations), dtype=np.float64)
+    drawn = 0
+    while drawn < simulated_diffs.size:
+        n = min(int(chunk_size), simulated_diffs.size - drawn)
+        simulated_diffs[drawn:drawn + n] = rng.logistic(
+            loc=expected_diff,
+            scale=SCALE * math.sqrt(params.variance_multiplier),
+            size=n
+        )
+        drawn += n
+        summary = _summarize_outcomes(simulated_diffs[:drawn], threshold)
+        yield {**{name: float(value) for name, value in summary.items()}, "n_simulations": drawn}
+
+
+def _summarize_outcomes(simulated_diffs: np.ndarray, threshold: float) -> Dict[str, np.ndarray]:
+    """Outcome probabilities and mapped-value stats along the last axis."""
+    mapped_values = 1.0 / (1.0 + np.power(10.0, -simulated_diffs / 400.0))
+
+    prob_home = np.mean(simulated_diffs > threshold, axis=-1)
+    prob_away = np.mean(simulated_diffs < -threshold, axis=-1)
+    p5, p25, p50, p75, p95 = np.percentile(mapped_values, [5, 25, 50, 75, 95], axis=-1)
+
+    return {
+        "prob_home": prob_home,
+        "prob_draw": 1.0 - prob_home - prob_away,
+        "prob_away": prob_away,
+        "mean": mapped_values.mean(axis=-1),
+        "stdev": mapped_values.std(axis=-1, ddof=1),
+        "p5": p5,
+        "p25": p25,
+        "p50": p50,
+        "p75": p75,
+        "p95": p95,
+    }
+
+
 def _generate_distribution_values(
     event,
     config,
-    scenario_params: ScenarioParams
+    scenario_params: ScenarioParams,
+    n: Optional[int] = None
 ) -> np.ndarray:
     """
     Generate raw distribution values for a single scenario.
     
+    n overrides config.n_simulations (used for chunked draws).
+    
     Returns:
         np.ndarray of mapped values in [0, 1] range
     """
@@ -149,7 +276,7 @@ def _generate_distribution_values(
     simulated_diffs = np.random.logistic(
         loc=expected_diff, 
         scale=scale_adjusted, 
-        size=config.n_simulations
+        size=config.n_simulations if n is None else n
     )
     
     # Map to [0,1] control values
@@ -158,19 +285,55 @@ def _generate_distribution_values(
     return mapped_values
 
 
+def _sample_to_deadline(
+    event,
+    config,
+    scenario_params: ScenarioParams,
+    deadline: float
+) -> np.ndarray:
+    """
+    Draw a scenario's distribution values in chunks until the deadline.
+    
+    Chunks come from the same global stream as one full draw, so the values
+    are a prefix of _generate_distribution_values(). Sampling stops when one
+    more chunk, at the pace so far and across all _DRAWS_PER_EVENT draws,
+    would push the simulation past the deadline.
+    
+    Returns:
+        np.ndarray of mapped values, between one chunk and n_simulations long
+    """
+    started = time.perf_counter()
+    budget_s = deadline - started
+    chunks = []
+    drawn = 0
+    while drawn < config.n_simulations:
+        n = min(DEADLINE_CHUNK_RUNS, config.n_simulations - drawn)
+        chunks.append(_generate_distribution_values(event, config, scenario_params, n=n))
+        drawn += n
+        # Projected cost of the whole simulation if one more chunk is drawn
+        elapsed = time.perf_counter() - started
+        if elapsed / drawn * (drawn + DEADLINE_CHUNK_RUNS) * _DRAWS_PER_EVENT >= budget_s:
+            break
+    return np.concatenate(chunks)
+
+
 def _run_single_scenario(
     event,
     config,
-    scenario_params: ScenarioParams
+    scenario_params: ScenarioParams,
+    mapped_values: Optional[np.ndarray] = None
 ) -> Scenario:
     """
     Execute a single scenario (conservative/base/aggressive).
     
+    mapped_values, when given, are the scenario's already drawn values.
+    
     Returns:
         Scenario object with probabilities and percentiles
     """
     # Generate distribution
-    mapped_values = _generate_distribution_values(event, config, scenario_params)
+    if mapped_values is None:
+        mapped_values = _generate_distribution_values(event, config, scenario_params)
     
     # Constants for outcome classification
     SCALE_BASE = 400.0 / math.log(10.0)
@@ -9,7 +9,13 @@ This module transforms technical simulation outputs into narratives that:
 - Help users understand probability, risk, and uncertainty
 """
 
-from typing import Dict, List
+from functools import lru_cache
+from itertools import product
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.compliance import TermScanner
+from app.core.model import DRAW_BASE_PROB, calculate_win_probabilities
 from app.api.schemas import (
     ExplanationOutput,
     ScenarioInfo,
@@ -26,8 +32,12 @@ FORBIDDEN_TERMS = {
     "can't lose", "profit", "sure thing", "investment"
 }
 
+# Compiled once: one pass over the text finds every forbidden term
+FORBIDDEN_SCANNER = TermScanner(sorted(FORBIDDEN_TERMS), whole_words=True)
+
+# Explanation text is cached on probabilities rounded to the 0.1% it shows
+PROBABILITY_DECIMALS = 3
 
-import re
 
 def validate_text_compliance(text: str) -> List[str]:
     """
@@ -39,17 +49,173 @@ def validate_text_compliance(text: str) -> List[str]:
     Returns:
         List of forbidden terms found (empty if compliant)
     """
-    text_lower = text.lower()
-    found_terms = []
-    
-    for term in FORBIDDEN_TERMS:
-        # Use regex to find whole words only
-        # \b is a word boundary
-        pattern = rf"\b{re.escape(term.lower())}\b"
-        if re.search(pattern, text_lower):
-            found_terms.append(term)
-    
-    return found_terms
+    return FORBIDDEN_SCANNER.findall(text)
+
+
+class NarrativeTemplate:
+    """
+    A str.format template whose literal text is checked once, at import.
+
+    Validation renders the template with every placeholder set to "", a
+    word character and a punctuation mark (the three kinds of neighbour a
+    value can give the literal text), so render() only needs to scan the
+    interpolated values and the characters around them.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._parts = list(Formatter().parse(text))
+        self.fields = [field for _, field, _, _ in self._parts if field is not None]
+        for fillers in product(("", "X", "."), repeat=len(self.fields)):
+            rendered, _ = self._join(iter(fillers))
+            violations = validate_text_compliance(rendered)
+            if violations:
+                raise ValueError(f"Narrative template contains forbidden terms {violations}: {text!r}")
+
+    def _join(self, values) -> Tuple[str, List[Tuple[int, int]]]:
+        out: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        pos = 0
+        for literal, field, _, _ in self._parts:
+            out.append(literal)
+            pos += len(literal)
+            if field is not None:
+                value = next(values)
+                out.append(value)
+                spans.append((pos, pos + len(value)))
+                pos += len(value)
+        return "".join(out), spans
+
+    def render(self, **values) -> Tuple[str, List[Tuple[int, int]]]:
+        """Rendered text and the (start, end) span of each interpolated value."""
+        return self._join(
+            format(values[field], spec) for _, field, spec, _ in self._parts if field is not None
+        )
+
+
+def _static(*texts: str) -> Tuple[str, ...]:
+    """Fixed narrative text, validated once at import."""
+    for text in texts:
+        violations = validate_text_compliance(text)
+        if violations:
+            raise ValueError(f"Static narrative contains forbidden terms {violations}: {text!r}")
+    return texts
+
+
+_SUMMARY_FAVORITE = NarrativeTemplate(
+    "The simulation estimates a {prob:.1f}% probability that "
+    "{outcome} will be the outcome, based on the provided ratings and model parameters."
+)
+_SUMMARY_BALANCED = NarrativeTemplate(
+    "The simulation shows relatively balanced probabilities: "
+    "{home_team} ({prob_home:.1f}%), Draw ({prob_draw:.1f}%), {away_team} ({prob_away:.1f}%). "
+    "This suggests a highly competitive scenario."
+)
+_SUMMARY_RISK = NarrativeTemplate("The risk assessment is {band} ({score:.0f}/100), {context}.")
+RISK_CONTEXT = {
+    "LOW": "with high confidence and narrow uncertainty range",
+    "MEDIUM": "with moderate uncertainty",
+    "HIGH": "with significant uncertainty and wide confidence intervals"
+}
+_RISK_CONTEXT_DEFAULT = "with typical uncertainty"
+_static(*RISK_CONTEXT.values(), _RISK_CONTEXT_DEFAULT)
+(_SUMMARY_CAVEAT,) = _static(
+    "These are statistical estimates based on limited historical data and "
+    "a simplified model—not predictions of the actual outcome."
+)
+
+_SCENARIO_MOST_PROBABLE = NarrativeTemplate(
+    "{label} is the most likely result according to the model, "
+    "with an estimated probability of {pct:.1f}%. "
+    "This is based on the rating differential and home advantage parameters."
+)
+_SCENARIO_SURPRISE = NarrativeTemplate(
+    "{label} has the lowest estimated probability ({pct:.1f}%), "
+    "but remains a plausible outcome. Unexpected factors not captured by the model "
+    "could shift this scenario's likelihood."
+)
+(_SCENARIO_COMPETITIVE,) = _static(
+    "With no outcome exceeding 50% probability, this event is highly competitive. "
+    "Small changes in form, tactics, or external factors could significantly "
+    "influence the result."
+)
+
+_CAVEAT_MODEL, _CAVEAT_ESTIMATE, _CAVEAT_RATINGS, _CAVEAT_EDUCATIONAL = _static(
+    "This analysis uses a simplified ELO-based model and does not account for "
+    "injuries, team news, weather conditions, tactical changes, or motivation factors.",
+
+    "Probabilities represent the model's estimate given the input parameters, "
+    "not a forecast of what will actually happen. Real-world events are influenced "
+    "by countless variables beyond this model's scope.",
+
+    "Historical ratings may not reflect current team form, recent transfers, "
+    "or other dynamic factors. Use this analysis as one input among many, "
+    "not as a definitive assessment.",
+
+    "This is an educational tool for understanding probability and risk analysis. "
+    "It is not designed for, and should not be used for, gambling or betting decisions."
+)
+_CAVEAT_SIMULATION = NarrativeTemplate(
+    "The simulation is based on {n_simulations:,} Monte Carlo iterations. "
+    "While this provides statistical robustness, the underlying model (v{model_version}) "
+    "has inherent limitations and assumptions."
+)
+
+# Rendered text plus the spans of its interpolated values (the only parts left to scan)
+_Rendered = Tuple[str, List[Tuple[int, int]]]
+
+
+def _check_compliance(rendered: List[_Rendered]) -> None:
+    violations: List[str] = []
+    for text, spans in rendered:
+        violations.extend(t for t in FORBIDDEN_SCANNER.findall(text, spans) if t not in violations)
+    if violations:
+        raise ValueError(
+            f"Generated explanation contains forbidden terms: {violations}. "
+            f"This violates the project's anti-gambling policy (see GLOSSARY.md)."
+        )
+
+
+def _favorite(probabilities: Dict[str, float]) -> Optional[str]:
+    """The outcome ("home", "away" or "draw") above 50%, if any; decided on exact probabilities."""
+    key = max(("prob_home", "prob_away", "prob_draw"), key=lambda k: probabilities.get(k, 0))
+    return key[len("prob_"):] if probabilities.get(key, 0) > 0.5 else None
+
+
+def _render_summary(
+    probabilities: Dict[str, float],
+    risk: RiskInfo,
+    home_team: str,
+    away_team: str,
+    favorite: Optional[str]
+) -> _Rendered:
+    prob_home = probabilities.get("prob_home", 0) * 100
+    prob_away = probabilities.get("prob_away", 0) * 100
+    prob_draw = probabilities.get("prob_draw", 0) * 100
+
+    # Main probability statement
+    if favorite is not None:
+        prob, outcome = {
+            "home": (prob_home, home_team),
+            "away": (prob_away, away_team),
+            "draw": (prob_draw, "Draw"),
+        }[favorite]
+        main, main_spans = _SUMMARY_FAVORITE.render(prob=prob, outcome=outcome)
+    else:
+        main, main_spans = _SUMMARY_BALANCED.render(
+            home_team=home_team, away_team=away_team,
+            prob_home=prob_home, prob_draw=prob_draw, prob_away=prob_away
+        )
+
+    # Risk context
+    risk_text, risk_spans = _SUMMARY_RISK.render(
+        band=risk.band, score=risk.score, context=RISK_CONTEXT.get(risk.band, _RISK_CONTEXT_DEFAULT)
+    )
+
+    # Caveat
+    offset = len(main) + 1
+    spans = main_spans + [(a + offset, b + offset) for a, b in risk_spans]
+    return " ".join((main, risk_text, _SUMMARY_CAVEAT)), spans
 
 
 def generate_summary(
@@ -70,53 +236,56 @@ def generate_summary(
     """
     home_team = event_context.get("home_team", "Home Team")
     away_team = event_context.get("away_team", "Away Team")
-    
-    prob_home = probabilities.get("prob_home", 0) * 100
-    prob_away = probabilities.get("prob_away", 0) * 100
-    prob_draw = probabilities.get("prob_draw", 0) * 100
-    
-    # Determine most likely outcome
+    return _render_summary(probabilities, risk, home_team, away_team, _favorite(probabilities))[0]
+
+
+@lru_cache(maxsize=4096)
+def _scenario_description(name: str, label: str, pct: float) -> str:
+    # Descriptions only interpolate outcome labels and numbers, which are
+    # covered by the template validation.
+    if name == "Most Probable Outcome":
+        return _SCENARIO_MOST_PROBABLE.render(label=label, pct=pct)[0]
+    if name == "Surprise Scenario":
+        return _SCENARIO_SURPRISE.render(label=label, pct=pct)[0]
+    return _SCENARIO_COMPETITIVE
+
+
+def _scenario_rows(prob_home: float, prob_draw: float, prob_away: float) -> Tuple[Tuple[str, float, str], ...]:
+    # (name, probability, description) rows; plain tuples so nothing mutable
+    # is shared between responses (see _scenario_models). Which scenarios
+    # apply and their probabilities come from the exact inputs; only the
+    # descriptions are cached, on the 0.1% they display.
+    rows = []
+
+    # Most probable scenario
     outcomes = [
-        ("home", prob_home, home_team),
-        ("away", prob_away, away_team),
-        ("draw", prob_draw, "Draw")
+        ("Home Win", prob_home),
+        ("Away Win", prob_away),
+        ("Draw", prob_draw)
     ]
     most_likely = max(outcomes, key=lambda x: x[1])
-    
-    # Build summary with caveats
-    summary_parts = []
-    
-    # Main probability statement
-    if most_likely[1] > 50:
-        summary_parts.append(
-            f"The simulation estimates a {most_likely[1]:.1f}% probability that "
-            f"{most_likely[2]} will be the outcome, based on the provided ratings and model parameters."
-        )
-    else:
-        summary_parts.append(
-            f"The simulation shows relatively balanced probabilities: "
-            f"{home_team} ({prob_home:.1f}%), Draw ({prob_draw:.1f}%), {away_team} ({prob_away:.1f}%). "
-            f"This suggests a highly competitive scenario."
-        )
-    
-    # Risk context
-    risk_context = {
-        "LOW": "with high confidence and narrow uncertainty range",
-        "MEDIUM": "with moderate uncertainty",
-        "HIGH": "with significant uncertainty and wide confidence intervals"
-    }
-    summary_parts.append(
-        f"The risk assessment is {risk.band} ({risk.score:.0f}/100), "
-        f"{risk_context.get(risk.band, 'with typical uncertainty')}."
-    )
-    
-    # Caveat
-    summary_parts.append(
-        "These are statistical estimates based on limited historical data and "
-        "a simplified model—not predictions of the actual outcome."
+    rows.append(("Most Probable Outcome", most_likely[1], most_likely[0]))
+
+    # Surprise/underdog scenario
+    least_likely = min(outcomes, key=lambda x: x[1])
+    if least_likely[1] > 0.05:  # Only if non-negligible
+        rows.append(("Surprise Scenario", least_likely[1], least_likely[0]))
+
+    # Competitive scenario (if probabilities are close)
+    max_prob = max(prob_home, prob_away, prob_draw)
+    if max_prob < 0.5:  # No clear favorite
+        rows.append(("Highly Competitive", 1.0 - max_prob, ""))
+
+    return tuple(
+        (name, probability, _scenario_description(name, label, round(probability, PROBABILITY_DECIMALS) * 100))
+        for name, probability, label in rows
     )
-    
-    return " ".join(summary_parts)
+
+
+def _scenario_models(rows: Tuple[Tuple[str, float, str], ...]) -> List[ScenarioInfo]:
+    """Fresh ScenarioInfo models for scenario rows."""
+    return [ScenarioInfo(name=name, probability=probability, description=description)
+            for name, probability, description in rows]
 
 
 def generate_scenarios(
@@ -135,60 +304,18 @@ def generate_scenarios(
     Returns:
         List of ScenarioInfo objects
     """
-    home_team = event_context.get("home_team", "Home Team")
-    away_team = event_context.get("away_team", "Away Team")
-    
-    prob_home = probabilities.get("prob_home", 0)
-    prob_away = probabilities.get("prob_away", 0)
-    prob_draw = probabilities.get("prob_draw", 0)
-    
-    scenarios = []
-    
-    # Most probable scenario
-    outcomes = [
-        ("Home Win", prob_home, home_team),
-        ("Away Win", prob_away, away_team),
-        ("Draw", prob_draw, "Draw")
-    ]
-    most_likely = max(outcomes, key=lambda x: x[1])
-    
-    scenarios.append(ScenarioInfo(
-        name="Most Probable Outcome",
-        probability=most_likely[1],
-        description=(
-            f"{most_likely[0]} is the most likely result according to the model, "
-            f"with an estimated probability of {most_likely[1]*100:.1f}%. "
-            f"This is based on the rating differential and home advantage parameters."
-        )
+    return _scenario_models(_scenario_rows(
+        probabilities.get("prob_home", 0),
+        probabilities.get("prob_draw", 0),
+        probabilities.get("prob_away", 0)
     ))
-    
-    # Surprise/underdog scenario
-    least_likely = min(outcomes, key=lambda x: x[1])
-    if least_likely[1] > 0.05:  # Only if non-negligible
-        scenarios.append(ScenarioInfo(
-            name="Surprise Scenario",
-            probability=least_likely[1],
-            description=(
-                f"{least_likely[0]} has the lowest estimated probability ({least_likely[1]*100:.1f}%), "
-                f"but remains a plausible outcome. Unexpected factors not captured by the model "
-                f"could shift this scenario's likelihood."
-            )
-        ))
-    
-    # Competitive scenario (if probabilities are close)
-    max_prob = max(prob_home, prob_away, prob_draw)
-    if max_prob < 0.5:  # No clear favorite
-        scenarios.append(ScenarioInfo(
-            name="Highly Competitive",
-            probability=1.0 - max_prob,
-            description=(
-                "With no outcome exceeding 50% probability, this event is highly competitive. "
-                "Small changes in form, tactics, or external factors could significantly "
-                "influence the result."
-            )
-        ))
-    
-    return scenarios
+
+
+@lru_cache(maxsize=256)
+def _cached_caveats(model_version: str, n_simulations: int) -> Tuple[str, ...]:
+    simulation, spans = _CAVEAT_SIMULATION.render(n_simulations=n_simulations, model_version=model_version)
+    _check_compliance([(simulation, spans)])
+    return (_CAVEAT_MODEL, simulation, _CAVEAT_ESTIMATE, _CAVEAT_RATINGS, _CAVEAT_EDUCATIONAL)
 
 
 def generate_caveats(
@@ -207,109 +334,103 @@ def generate_caveats(
     Returns:
         List of caveat strings
     """
-    caveats = [
-        "This analysis uses a simplified ELO-based model and does not account for "
-        "injuries, team news, weather conditions, tactical changes, or motivation factors.",
-        
-        f"The simulation is based on {n_simulations:,} Monte Carlo iterations. "
-        f"While this provides statistical robustness, the underlying model (v{model_version}) "
-        f"has inherent limitations and assumptions.",
-        
-        "Probabilities represent the model's estimate given the input parameters, "
-        "not a forecast of what will actually happen. Real-world events are influenced "
-        "by countless variables beyond this model's scope.",
-        
-        "Historical ratings may not reflect current team form, recent transfers, "
-        "or other dynamic factors. Use this analysis as one input among many, "
-        "not as a definitive assessment.",
-        
-        "This is an educational tool for understanding probability and risk analysis. "
-        "It is not designed for, and should not be used for, gambling or betting decisions."
-    ]
-    
-    return caveats
+    return list(_cached_caveats(str(model_version), int(n_simulations)))
+
+
+@lru_cache(maxsize=4096)
+def _cached_narrative(
+    probs: Tuple[float, float, float],
+    favorite: Optional[str],
+    band: str,
+    score: int,
+    model_version: str,
+    n_simulations: int,
+    home_team: str,
+    away_team: str
+) -> Tuple[str, Tuple[str, ...]]:
+    """Summary and caveats for one explanation key (compliance-checked once)."""
+    prob_home, prob_draw, prob_away = probs
+    probabilities = {"prob_home": prob_home, "prob_draw": prob_draw, "prob_away": prob_away}
+    risk = RiskInfo(score=score, band=band, rationale="")
+    summary = _render_summary(probabilities, risk, home_team, away_team, favorite)
+    _check_compliance([summary])
+    return summary[0], _cached_caveats(model_version, n_simulations)
+
+
+# What-if grid: (factor name, home rating delta, home advantage delta, draw rate).
+# Rows come in +/- pairs; each pair is reported once, in its stronger direction.
+SENSITIVITY_GRID = [
+    ("Home Team Rating (+50 ELO)", 50, 0, None),
+    ("Home Team Rating (-50 ELO)", -50, 0, None),
+    ("Home Advantage (+50 points)", 0, 50, None),
+    ("Home Advantage (-50 points)", 0, -50, None),
+    ("Draw Rate Assumption (20%)", 0, 0, 0.20),
+    ("Draw Rate Assumption (30%)", 0, 0, 0.30),
+]
+_GRID_NAMES = [row[0] for row in SENSITIVITY_GRID]
+_GRID_DELTAS = np.array([row[1:3] for row in SENSITIVITY_GRID], dtype=np.float64)
+_GRID_DRAW = np.array([DRAW_BASE_PROB if row[3] is None else row[3] for row in SENSITIVITY_GRID])
 
 
 def calculate_sensitivity(
     base_probabilities: Dict[str, float],
     event_input: Dict,
-    model_func: callable = None
+    model_func: callable = None,
+    top_n: int = 3
 ) -> List[SensitivityFactor]:
     """
     Perform lightweight sensitivity analysis (what-if scenarios).
     
-    Tests how changes in key variables affect probabilities.
+    Evaluates every SENSITIVITY_GRID perturbation of the event inputs in
+    one vectorized model call and reports the change in the home win
+    probability (percentage points) against the unperturbed model, one
+    factor per perturbed input.
     
     Args:
         base_probabilities: Baseline probabilities
-        event_input: Original event parameters
-        model_func: Function to recalculate probabilities (from model.py)
+        event_input: Original event parameters (home_rating, away_rating, home_advantage)
+        model_func: Vectorized model with the signature of
+            model.calculate_win_probabilities (default)
+        top_n: Number of factors returned
         
     Returns:
         List of SensitivityFactor objects, ordered by impact
+        (empty when the event has no ratings)
     """
+    home_rating = event_input.get("home_rating")
+    away_rating = event_input.get("away_rating")
+    if home_rating is None or away_rating is None:
+        return []
     if model_func is None:
-        # Placeholder: will be replaced when model.py is available
-        # For now, return mock sensitivity data
-        return _mock_sensitivity(base_probabilities, event_input)
-    
-    sensitivity_factors = []
-    base_prob_home = base_probabilities.get("prob_home", 0)
-    
-    # Test 1: Increase home advantage by 50
-    modified_input = event_input.copy()
-    modified_input["home_advantage"] = event_input.get("home_advantage", 100) + 50
-    new_probs = model_func(**modified_input)
-    delta_home_adv = (new_probs["prob_home"] - base_prob_home) * 100
-    
-    sensitivity_factors.append(SensitivityFactor(
-        factor_name="Home Advantage (+50 points)",
-        delta_probability=round(delta_home_adv, 2),
-        impact_level="HIGH" if abs(delta_home_adv) > 5 else 
-                     "MEDIUM" if abs(delta_home_adv) > 2 else "LOW"
-    ))
-    
-    # Test 2: Improve home team rating by 50 points
-    modified_input = event_input.copy()
-    modified_input["home_rating"] = event_input.get("home_rating", 1500) + 50
-    new_probs = model_func(**modified_input)
-    delta_rating = (new_probs["prob_home"] - base_prob_home) * 100
-    
-    sensitivity_factors.append(SensitivityFactor(
-        factor_name="Home Team Rating (+50 ELO)",
-        delta_probability=round(delta_rating, 2),
-        impact_level="HIGH" if abs(delta_rating) > 5 else 
-                     "MEDIUM" if abs(delta_rating) > 2 else "LOW"
-    ))
-    
-    # Sort by absolute impact
-    sensitivity_factors.sort(key=lambda x: abs(x.delta_probability), reverse=True)
-    
-    return sensitivity_factors[:3]  # Return top 3 factors
+        model_func = calculate_win_probabilities
+    home_advantage = event_input.get("home_advantage")
+    if home_advantage is None:
+        home_advantage = 100
 
+    # Row 0 is the unperturbed model, so deltas are pure finite differences
+    # (base_probabilities are simulation estimates and carry sampling noise)
+    deltas = np.vstack([np.zeros(2), _GRID_DELTAS])
+    probs = np.asarray(model_func(
+        home_rating=home_rating + deltas[:, 0],
+        away_rating=away_rating,
+        home_advantage=home_advantage + deltas[:, 1],
+        draw_base_prob=np.concatenate([[DRAW_BASE_PROB], _GRID_DRAW])
+    ))
+    delta_home = np.round((probs[1:, 0] - probs[0, 0]) * 100, 2).reshape(-1, 2)
+    stronger = np.argmax(np.abs(delta_home), axis=1)
+    delta_home = delta_home[np.arange(len(delta_home)), stronger]
+    names = [_GRID_NAMES[2 * i + j] for i, j in enumerate(stronger)]
 
-def _mock_sensitivity(base_probs: Dict, event_input: Dict) -> List[SensitivityFactor]:
-    """Mock sensitivity data for testing before model.py is available."""
-    factors = [
-        SensitivityFactor(
-            factor_name="Home Advantage (+50 points)",
-            delta_probability=3.2,
-            impact_level="MEDIUM"
-        ),
-        SensitivityFactor(
-            factor_name="Home Team Rating (+50 ELO)",
-            delta_probability=4.8,
-            impact_level="MEDIUM"
-        ),
+    order = np.argsort(-np.abs(delta_home), kind="stable")[:top_n]
+    return [
         SensitivityFactor(
-            factor_name="Recent Form Adjustment",
-            delta_probability=2.1,
-            impact_level="LOW"
-        ),
+            factor_name=names[i],
+            delta_probability=float(delta_home[i]),
+            impact_level="HIGH" if abs(delta_home[i]) > 5 else
+                         "MEDIUM" if abs(delta_home[i]) > 2 else "LOW"
+        )
+        for i in order
     ]
-    # Sort by absolute impact
-    factors.sort(key=lambda x: abs(x.delta_probability), reverse=True)
-    return factors
 
 
 def explain(
@@ -323,7 +444,8 @@ def explain(
     Args:
         simulation_result: Dict with probabilities, CI, distribution, risk
         event_context: Event metadata (teams, ratings, etc.)
-        model_func: Optional model function for sensitivity analysis
+        model_func: Optional vectorized model for sensitivity analysis
+            (defaults to model.calculate_win_probabilities)
         
     Returns:
         ExplanationOutput with summary, scenarios, caveats, sensitivity
@@ -336,42 +458,40 @@ def explain(
         "prob_away": simulation_result.get("prob_away", 0),
         "prob_draw": simulation_result.get("prob_draw", 0),
     }
+    # Rounded to the 0.1% shown in the text, so equal-looking results share a cache entry
+    probs = tuple(
+        round(float(probabilities[key]), PROBABILITY_DECIMALS)
+        for key in ("prob_home", "prob_draw", "prob_away")
+    )
     
     risk = simulation_result.get("risk")
-    confidence_intervals = simulation_result.get("confidence_intervals", {})
     model_version = simulation_result.get("model_version", "0.1.0")
     n_sims = simulation_result.get("config", {}).get("n_simulations", 1000)
     
-    # Generate components
-    summary = generate_summary(probabilities, risk, event_context)
-    scenarios = generate_scenarios(probabilities, confidence_intervals, event_context)
-    caveats = generate_caveats(model_version, n_sims, event_context)
+    # Generate components (templates are pre-validated; text cached per explanation key,
+    # branches and reported probabilities from the exact values)
+    summary, caveats = _cached_narrative(
+        probs,
+        _favorite(probabilities),
+        risk.band,
+        round(risk.score),
+        str(model_version),
+        int(n_sims),
+        str(event_context.get("home_team", "Home Team")),
+        str(event_context.get("away_team", "Away Team"))
+    )
     
-    # Sensitivity analysis (optional, depends on model availability)
-    sensitivity = None
-    if model_func:
-        event_input = {
-            "home_rating": event_context.get("home_rating"),
-            "away_rating": event_context.get("away_rating"),
-            "home_advantage": event_context.get("home_advantage", 100)
-        }
-        sensitivity = calculate_sensitivity(probabilities, event_input, model_func)
+    # Sensitivity analysis (needs the ratings the model was run with)
+    sensitivity = calculate_sensitivity(probabilities, event_context, model_func) or None
     
     # Create explanation output
     explanation = ExplanationOutput(
         summary=summary,
-        scenarios=scenarios,
-        caveats=caveats,
+        scenarios=_scenario_models(_scenario_rows(
+            probabilities["prob_home"], probabilities["prob_draw"], probabilities["prob_away"]
+        )),
+        caveats=list(caveats),
         sensitivity=sensitivity
     )
     
-    # Validate compliance with anti-gambling terminology
-    all_text = summary + " ".join([s.description for s in scenarios])
-    violations = validate_text_compliance(all_text)
-    if violations:
-        raise ValueError(
-            f"Generated explanation contains forbidden terms: {violations}. "
-            f"This violates the project's anti-gambling policy (see GLOSSARY.md)."
-        )
-    
     return explanation
@@ -1,5 +1,11 @@
 import math
 
+import numpy as np
+
+# Constants for Elo and Draw model
+SCALE = 400.0
+DRAW_BASE_PROB = 0.25 # Probability of draw when ratings are equal
+
 def calculate_win_probability(
     home_rating: float,
     away_rating: float,
@@ -12,10 +18,6 @@ def calculate_win_probability(
         (prob_home, prob_draw, prob_away) - All probabilities sum to 1.0
     """
     
-    # Constants for Elo and Draw model
-    SCALE = 400.0
-    DRAW_BASE_PROB = 0.25 # Probability of draw when ratings are equal
-    
     # Calculate expected rating difference
     diff = home_rating + home_advantage - away_rating
     
@@ -57,3 +59,37 @@ def calculate_win_probability(
     total = prob_home + prob_draw + prob_away
     
     return (prob_home / total, prob_draw / total, prob_away / total)
+
+
+def calculate_win_probabilities(
+    home_rating,
+    away_rating,
+    home_advantage=100,
+    draw_base_prob=DRAW_BASE_PROB
+) -> np.ndarray:
+    """
+    calculate_win_probability() over numpy arrays, in one call.
+
+    All arguments broadcast against each other, so a grid of what-if
+    inputs (ratings, home advantage, draw-rate assumption) is evaluated
+    without a Python loop.
+
+    Returns:
+        Array of shape (..., 3): prob_home, prob_draw, prob_away per input
+    """
+    s = SCALE / math.log(10)
+    diff = (
+        np.asarray(home_rating, dtype=np.float64)
+        + np.asarray(home_advantage, dtype=np.float64)
+        - np.asarray(away_rating, dtype=np.float64)
+    )
+    p_draw = np.asarray(draw_base_prob, dtype=np.float64)
+    threshold = -s * np.log((1 - p_draw) / (1 + p_draw))
+
+    # Same logistic thresholds as the scalar model
+    prob_away = 1 / (1 + np.exp((threshold + diff) / s))
+    prob_home = 1 - 1 / (1 + np.exp(-(threshold - diff) / s))
+    prob_draw = np.maximum(0.0, 1.0 - prob_home - prob_away)
+
+    probs = np.stack(np.broadcast_arrays(prob_home, prob_draw, prob_away), axis=-1)
+    return probs / probs.sum(axis=-1, keepdims=True)
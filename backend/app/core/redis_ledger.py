@@ -1,23 +1,90 @@
 import json
 import logging
-from typing import Dict, Optional, List
+import re
+import threading
+import warnings
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
 import redis
-from app.core.token_types import TokenTransaction, FeatureTier, UserStatus
+from app.core.token_types import AUDIT_PAGE_MAX, TokenTransaction, FeatureTier, UserStatus
 
 
 logger = logging.getLogger(__name__)
 
+# Global append-only audit stream (all users), trimmed approximately
+AUDIT_STREAM_KEY = "tokens:audit"
+AUDIT_STREAM_MAXLEN = 1_000_000
+# Stream entry ID ("<ms>-<seq>"), the only valid Redis audit cursor
+_STREAM_ID_RE = re.compile(r"^\d+(-\d+)?$")
+
+# Atomic consume. Denied attempts are recorded too, like the in-memory ledger.
+# KEYS = balance, per-user tx list, audit stream[, idempotency key]
+# ARGV = cost, transaction JSON (balances and status filled in here), audit maxlen
+# Returns {0, balance} when denied, {1, tx_json} when charged, {2, tx_json} on replay.
+_CONSUME_LUA = """
+if #KEYS == 4 then
+    local cached = redis.call('GET', KEYS[4])
+    if cached then
+        return {2, cached}
+    end
+end
+local required = tonumber(ARGV[1])
+local balance = tonumber(redis.call('GET', KEYS[1]) or '0')
+local tx = cjson.decode(ARGV[2])
+tx['balance_before'] = balance
+if balance < required then
+    tx['balance_after'] = balance
+    tx['status'] = 'denied'
+else
+    tx['balance_after'] = redis.call('DECRBY', KEYS[1], required)
+end
+local tx_json = cjson.encode(tx)
+redis.call('LPUSH', KEYS[2], tx_json)
+redis.call('LTRIM', KEYS[2], 0, 99)
+redis.call('XADD', KEYS[3], 'MAXLEN', '~', ARGV[3], '*', 'tx', tx_json)
+if balance < required then
+    return {0, tostring(balance)}
+end
+if #KEYS == 4 then
+    redis.call('SETEX', KEYS[4], 86400, tx_json)
+end
+return {1, tx_json}
+"""
+
+# Atomic top-up, recorded in the per-user history and the audit stream.
+# KEYS = balance, per-user tx list, audit stream
+# ARGV = amount, transaction JSON (balances filled in here), audit maxlen
+# Returns the new balance.
+_TOPUP_LUA = """
+local amount = tonumber(ARGV[1])
+local new_balance = redis.call('INCRBY', KEYS[1], amount)
+local tx = cjson.decode(ARGV[2])
+tx['balance_before'] = new_balance - amount
+tx['balance_after'] = new_balance
+local tx_json = cjson.encode(tx)
+redis.call('LPUSH', KEYS[2], tx_json)
+redis.call('LTRIM', KEYS[2], 0, 99)
+redis.call('XADD', KEYS[3], 'MAXLEN', '~', ARGV[3], '*', 'tx', tx_json)
+return new_balance
+"""
+
+
 class RedisTokenLedger:
     """
     Redis-backed token ledger for production persistence.
-    Uses Redis hashes for balances and lists for transaction history.
+    Uses Redis hashes for balances and lists for per-user transaction history.
+    Every transaction is also appended to a global Redis Stream (``tokens:audit``)
+    so audits can page through all users without scanning keys.
     """
     
-    def __init__(self, host='localhost', port=6379, db=0, password=None, url=None):
+    def __init__(self, host='localhost', port=6379, db=0, password=None, url=None,
+                 client=None, audit_maxlen: int = AUDIT_STREAM_MAXLEN):
         self.use_redis = False
+        self.audit_maxlen = audit_maxlen
         try:
-            if url:
+            if client is not None:
+                self.client = client
+            elif url:
                 self.client = redis.from_url(url, decode_responses=True, socket_connect_timeout=2)
             else:
                 self.client = redis.Redis(
@@ -29,6 +96,8 @@ class RedisTokenLedger:
                     socket_connect_timeout=2
                 )
             self.client.ping()
+            self._consume_script = self.client.register_script(_CONSUME_LUA)
+            self._topup_script = self.client.register_script(_TOPUP_LUA)
             self.use_redis = True
             logger.info(f"Connected to Redis for TokenLedger at {host}:{port}")
         except Exception as e:
@@ -38,6 +107,7 @@ class RedisTokenLedger:
             self._transactions = []
             self._idempotency_cache = {}
             self._user_statuses = {}
+            self._lock = threading.Lock()
 
     def _get_balance_key(self, user_id: str) -> str:
         return f"tokens:balance:{user_id}"
@@ -69,15 +139,23 @@ class RedisTokenLedger:
 
     def add_tokens(self, user_id: str, amount: int) -> int:
         if not self.use_redis:
-            current = self.get_balance(user_id)
-            self._balances[user_id] = current + amount
-            return self._balances[user_id]
+            with self._lock:
+                current = self.get_balance(user_id)
+                self._balances[user_id] = current + amount
+                self._transactions.append(TokenTransaction(
+                    user_id=user_id, cost=-amount, balance_before=current,
+                    balance_after=current + amount, status="topup"
+                ))
+                return self._balances[user_id]
         
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        new_balance = self.client.incrby(self._get_balance_key(user_id), amount)
-        return new_balance
+        template = TokenTransaction(user_id=user_id, cost=-amount, balance_before=0, balance_after=0, status="topup")
+        return int(self._topup_script(
+            keys=[self._get_balance_key(user_id), self._get_tx_key(user_id), AUDIT_STREAM_KEY],
+            args=[amount, template.model_dump_json(), self.audit_maxlen],
+        ))
 
     def check_access(self, user_id: str, feature: FeatureTier) -> bool:
         from app.core.token_types import FEATURE_COSTS
@@ -93,61 +171,59 @@ class RedisTokenLedger:
         idempotency_key: Optional[str] = None
     ) -> TokenTransaction:
         if not self.use_redis:
-            # Simple in-memory logic
-            if idempotency_key and idempotency_key in self._idempotency_cache:
-                tx_id = self._idempotency_cache[idempotency_key]
-                for tx in self._transactions:
-                    if tx.transaction_id == tx_id: return tx
-            
+            # Simple in-memory logic, under a lock so threads cannot overdraw or double-charge
             from app.core.token_types import FEATURE_COSTS, AccessDeniedError
-            required = FEATURE_COSTS[feature]
-            available = self.get_balance(user_id)
-            
-            if available < required:
-                raise AccessDeniedError(feature, required, available)
-            
-            new_balance = available - required
-            self._balances[user_id] = new_balance
-            tx = TokenTransaction(user_id=user_id, feature=feature, cost=required, balance_before=available, balance_after=new_balance, event_id=event_id, idempotency_key=idempotency_key)
-            self._transactions.append(tx)
-            if idempotency_key: self._idempotency_cache[idempotency_key] = tx.transaction_id
-            return tx
-
-        # Redis logic
-        if idempotency_key:
-            cached_tx = self.client.get(self._get_idempotency_key(idempotency_key))
-            if cached_tx:
-                return TokenTransaction.model_validate_json(cached_tx)
+            with self._lock:
+                if idempotency_key and idempotency_key in self._idempotency_cache:
+                    tx_id = self._idempotency_cache[idempotency_key]
+                    for tx in self._transactions:
+                        if tx.transaction_id == tx_id: return tx
+
+                required = FEATURE_COSTS[feature]
+                available = self.get_balance(user_id)
+
+                if available < required:
+                    self._transactions.append(TokenTransaction(
+                        user_id=user_id, feature=feature, cost=required, balance_before=available,
+                        balance_after=available, event_id=event_id, idempotency_key=idempotency_key,
+                        status="denied"
+                    ))
+                    raise AccessDeniedError(feature, required, available)
 
+                new_balance = available - required
+                self._balances[user_id] = new_balance
+                tx = TokenTransaction(user_id=user_id, feature=feature, cost=required, balance_before=available, balance_after=new_balance, event_id=event_id, idempotency_key=idempotency_key)
+                self._transactions.append(tx)
+                if idempotency_key: self._idempotency_cache[idempotency_key] = tx.transaction_id
+                return tx
+
+        # Redis logic: idempotency check, balance check, debit and history writes
+        # run in one script so concurrent requests cannot overdraw or double-charge.
         from app.core.token_types import FEATURE_COSTS
         required = FEATURE_COSTS[feature]
         
-        current = self.get_balance(user_id)
-        if current < required:
-            from app.core.token_types import AccessDeniedError
-            raise AccessDeniedError(feature, required, current)
-
-        new_balance = self.client.decrby(self._get_balance_key(user_id), required)
-        
-        transaction = TokenTransaction(
+        template = TokenTransaction(
             user_id=user_id,
             feature=feature,
             cost=required,
-            balance_before=current,
-            balance_after=new_balance,
+            balance_before=0,
+            balance_after=0,
             event_id=event_id,
             idempotency_key=idempotency_key,
             status="success"
         )
-        
-        tx_json = transaction.model_dump_json()
-        self.client.lpush(self._get_tx_key(user_id), tx_json)
-        self.client.ltrim(self._get_tx_key(user_id), 0, 99)
-        
+        keys = [self._get_balance_key(user_id), self._get_tx_key(user_id), AUDIT_STREAM_KEY]
         if idempotency_key:
-            self.client.setex(self._get_idempotency_key(idempotency_key), 86400, tx_json)
+            keys.append(self._get_idempotency_key(idempotency_key))
+        
+        outcome, payload = self._consume_script(
+            keys=keys, args=[required, template.model_dump_json(), self.audit_maxlen]
+        )
+        if int(outcome) == 0:
+            from app.core.token_types import AccessDeniedError
+            raise AccessDeniedError(feature, required, int(payload))
 
-        return transaction
+        return TokenTransaction.model_validate_json(payload)
 
     def get_transaction_history(self, user_id: str, limit: int = 100) -> List[TokenTransaction]:
         if not self.use_redis:
@@ -157,13 +233,58 @@ class RedisTokenLedger:
         return [TokenTransaction.model_validate_json(tx) for tx in txs_json]
 
     def get_all_transactions(self) -> List[TokenTransaction]:
+        """Deprecated: materializes the whole audit stream; use iter_transactions() or get_audit_page()."""
+        warnings.warn(
+            "RedisTokenLedger.get_all_transactions() loads the whole audit stream; "
+            "use iter_transactions() or get_audit_page()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return list(self.iter_transactions())
+
+    def iter_transactions(self, page_size: int = AUDIT_PAGE_MAX) -> Iterator[TokenTransaction]:
+        """Every audit transaction, oldest first, read one get_audit_page() at a time."""
+        cursor = None
+        while True:
+            page, cursor = self.get_audit_page(cursor=cursor, limit=page_size)
+            for _, tx in page:
+                yield tx
+            if cursor is None:
+                return
+
+    def get_audit_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Tuple[str, TokenTransaction]], Optional[str]]:
+        """
+        Read one page of the global audit stream, oldest first.
+
+        Args:
+            cursor: Stream ID returned by the previous page (exclusive), or None to start
+            limit: Page size (capped at AUDIT_PAGE_MAX)
+
+        Returns:
+            ([(entry_id, transaction), ...], next_cursor); next_cursor is None at the end
+
+        Raises:
+            ValueError: If cursor is not one this ledger returned
+        """
+        limit = max(1, min(int(limit), AUDIT_PAGE_MAX))
         if not self.use_redis:
-            return self._transactions
-        
-        # NOTE: In production with Redis, getting ALL transactions across ALL users
-        # is expensive. This is a simplified version for small scale.
-        # Ideally would use a separate global audit key.
-        return self._transactions if hasattr(self, "_transactions") else []
+            if cursor and not cursor.isdigit():
+                raise ValueError(f"Invalid audit cursor '{cursor}'")
+            start = int(cursor) if cursor else 0
+            chunk = self._transactions[start:start + limit]
+            page = [(str(start + i + 1), tx) for i, tx in enumerate(chunk)]
+            return page, (page[-1][0] if len(page) == limit else None)
+
+        if cursor and not _STREAM_ID_RE.match(cursor):
+            raise ValueError(f"Invalid audit cursor '{cursor}'")
+        start = f"({cursor}" if cursor else "-"
+        entries = self.client.xrange(AUDIT_STREAM_KEY, min=start, max="+", count=limit)
+        page = [(entry_id, TokenTransaction.model_validate_json(fields["tx"])) for entry_id, fields in entries]
+        return page, (page[-1][0] if len(page) == limit else None)
 
     def get_user_status(self, user_id: str) -> UserStatus:
         if not self.use_redis:
@@ -1,6 +1,93 @@
 import math
+from typing import Optional
+
+import numpy as np
+
 from app.api.schemas import RiskInfo
 
+MAX_ENTROPY = math.log(3)
+MAX_STD = 0.2887  # Uniform dist
+DEFAULT_BINS = np.linspace(0.0, 1.0, 21)
+
+# Combined score weights: Entropy 40%, Std 30%, CI Width 30%
+_W_ENTROPY, _W_STD, _W_WIDTH = 0.4, 0.3, 0.3
+_BAND_EDGES = (33.0, 67.0)
+_BANDS = np.array(["LOW", "MEDIUM", "HIGH"])
+
+
+def risk_components(
+    probabilities: np.ndarray,
+    frequencies: np.ndarray,
+    bins: np.ndarray,
+    ci_lower: np.ndarray,
+    ci_upper: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Array-native risk computation; every input may carry leading batch axes.
+
+    Args:
+        probabilities: (..., n_outcomes) outcome probabilities (non-positive entries ignored)
+        frequencies: (..., n_bins) histogram counts
+        bins: (n_bins + 1,) edges shared by all rows, or (..., n_bins + 1)
+        ci_lower, ci_upper: (...) 95% interval bounds
+
+    Returns:
+        Dict of arrays with shape (...): entropy, std, ci_width, score
+    """
+    p = np.asarray(probabilities, dtype=np.float64)
+    f = np.asarray(frequencies, dtype=np.float64)
+    edges = np.asarray(bins, dtype=np.float64)
+
+    # 1. Entropy (Outcomes)
+    positive = p > 0
+    entropy = -np.sum(np.where(positive, p * np.log(np.where(positive, p, 1.0)), 0.0), axis=-1)
+
+    # 2. Variance (Distribution): histogram-weighted std around bin centers
+    centers = 0.5 * (edges[..., :-1] + edges[..., 1:])
+    total = f.sum(axis=-1)
+    safe_total = np.where(total > 0, total, 1.0)
+    mean = np.sum(centers * f, axis=-1) / safe_total
+    variance = np.sum((centers - mean[..., None]) ** 2 * f, axis=-1) / safe_total
+    std = np.where(total > 0, np.sqrt(variance), 0.0)
+
+    # 3. CI Width (95%)
+    width = np.asarray(ci_upper, dtype=np.float64) - np.asarray(ci_lower, dtype=np.float64)
+
+    score = (
+        _W_ENTROPY * (entropy / MAX_ENTROPY) * 100
+        + _W_STD * np.minimum(100.0, (std / MAX_STD) * 100)
+        + _W_WIDTH * width * 100
+    )
+    return {"entropy": entropy, "std": std, "ci_width": width, "score": np.clip(score, 0.0, 100.0)}
+
+
+def risk_bands(scores: np.ndarray) -> np.ndarray:
+    """LOW (< 33) / MEDIUM (< 67) / HIGH for an array of scores."""
+    return _BANDS[np.searchsorted(_BAND_EDGES, np.asarray(scores), side="right")]
+
+
+def _rationale(band: str, final_score: float) -> str:
+    if band == "LOW":
+        return (
+            f"Low uncertainty detected (Risk Score: {final_score:.1f}). "
+            "The model estimates a distinct outcome pattern with high statistical confidence."
+        )
+    if band == "MEDIUM":
+        return (
+            f"Moderate uncertainty (Risk Score: {final_score:.1f}). "
+            "Analysis shows a likely outcome but with significant variance in simulation results."
+        )
+    return (
+        f"High uncertainty (Risk Score: {final_score:.1f}). "
+        "The probability distribution is wide, indicating multiple plausible scenarios."
+    )
+
+
+def _risk_info(score: float) -> RiskInfo:
+    band = str(risk_bands(score))
+    return RiskInfo(score=score, band=band, rationale=_rationale(band, score))
+
+
 def assess_risk(
     probabilities: dict[str, float],
     distribution_data: dict,
@@ -8,78 +95,87 @@ def assess_risk(
 ) -> RiskInfo:
     """
     Calculate risk score (0-100) and band (LOW/MEDIUM/HIGH).
-    
+
     Returns RiskInfo with:
     - score: float (0-100)
     - band: str ("LOW" | "MEDIUM" | "HIGH")
     - rationale: str (human-readable explanation)
     """
-    # 1. Entropy (Outcomes)
-    probs = [p for p in probabilities.values() if p > 0]
-    if not probs:
-        entropy = 0.0
-    else:
-        entropy = -sum(p * math.log(p) for p in probs)
-    max_entropy = math.log(3)
-    entropy_score = (entropy / max_entropy) * 100
-    
-    # 2. Variance (Distribution)
-    bins = distribution_data["bins"]
-    freqs = distribution_data["frequencies"]
-    total_count = sum(freqs)
-    
-    if total_count == 0:
-        std_dev = 0.0
-    else:
-        bin_centers = [(bins[i] + bins[i+1])/2 for i in range(len(bins)-1)]
-        weighted_sum = sum(c * f for c, f in zip(bin_centers, freqs))
-        mean = weighted_sum / total_count
-        weighted_sq_diff = sum(((c - mean)**2) * f for c, f in zip(bin_centers, freqs))
-        variance = weighted_sq_diff / total_count
-        std_dev = math.sqrt(variance)
-        
-    max_std = 0.2887 # Uniform dist
-    std_score = min(100.0, (std_dev / max_std) * 100)
-    
-    # 3. CI Width (95%)
-    ci_95 = confidence_intervals.get("95", {"upper": 1.0, "lower": 0.0})
-    # Handle dict or list if previous implementation left artifacts, 
+    # Handle dict or list if previous implementation left artifacts,
     # but strictly following new signature it should be dict with upper/lower
-    width = ci_95["upper"] - ci_95["lower"]
-    width_score = width * 100 # 0-100 directly
-    
-    # Combined Score (Weighted)
-    # Entropy: 40%, Std: 30%, CI Width: 30%
-    final_score = 0.4 * entropy_score + 0.3 * std_score + 0.3 * width_score
-    final_score = min(100.0, max(0.0, final_score))
-    
-    # Banding
-    if final_score < 33:
-        band = "LOW"
-    elif final_score < 67:
-        band = "MEDIUM"
-    else:
-        band = "HIGH"
-        
-    # Rationale
-    if band == "LOW":
-        rationale = (
-            f"Low uncertainty detected (Risk Score: {final_score:.1f}). "
-            "The model estimates a distinct outcome pattern with high statistical confidence."
-        )
-    elif band == "MEDIUM":
-        rationale = (
-            f"Moderate uncertainty (Risk Score: {final_score:.1f}). "
-            "Analysis shows a likely outcome but with significant variance in simulation results."
-        )
-    else:
-        rationale = (
-            f"High uncertainty (Risk Score: {final_score:.1f}). "
-            "The probability distribution is wide, indicating multiple plausible scenarios."
-        )
-        
-    return RiskInfo(
-        score=final_score,
-        band=band,
-        rationale=rationale
+    ci_95 = confidence_intervals.get("95", {"upper": 1.0, "lower": 0.0})
+    parts = risk_components(
+        list(probabilities.values()),
+        distribution_data["frequencies"],
+        distribution_data["bins"],
+        ci_95["lower"],
+        ci_95["upper"],
     )
+    return _risk_info(float(parts["score"]))
+
+
+def assess_risk_array(
+    probabilities: np.ndarray,
+    frequencies: Optional[np.ndarray] = None,
+    bins: Optional[np.ndarray] = None,
+    samples: Optional[np.ndarray] = None,
+    ci_95: Optional[tuple[float, float]] = None,
+) -> RiskInfo:
+    """
+    assess_risk() on numpy arrays, without the dict/list round trip.
+
+    Pass either the histogram (``frequencies`` with ``bins``, as returned
+    by np.histogram) or the raw mapped ``samples``. Samples are binned on
+    ``bins`` (default: 20 equal bins on [0, 1], as in simulate_event) so
+    both forms score identically, and the 95% CI is taken from them when
+    ``ci_95`` is not given.
+
+    Args:
+        probabilities: Outcome probabilities, e.g. [home, draw, away]
+        frequencies: Histogram counts
+        bins: Histogram edges
+        samples: Raw simulated values in [0, 1]
+        ci_95: (lower, upper); defaults to (0, 1) for histogram input
+    """
+    edges = DEFAULT_BINS if bins is None else np.asarray(bins, dtype=np.float64)
+    if samples is not None:
+        samples = np.asarray(samples, dtype=np.float64)
+        frequencies, _ = np.histogram(samples, bins=edges)
+        if ci_95 is None:
+            ci_95 = tuple(np.percentile(samples, [2.5, 97.5]))
+    elif frequencies is None:
+        raise ValueError("assess_risk_array needs frequencies or samples")
+    lower, upper = ci_95 if ci_95 is not None else (0.0, 1.0)
+    parts = risk_components(probabilities, frequencies, edges, lower, upper)
+    return _risk_info(float(parts["score"]))
+
+
+def assess_risk_batch(
+    probabilities: np.ndarray,
+    frequencies: np.ndarray,
+    bins: np.ndarray,
+    ci_95: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Score a whole slate of events in one call.
+
+    Args:
+        probabilities: (n_events, n_outcomes)
+        frequencies: (n_events, n_bins)
+        bins: (n_bins + 1,) shared edges, or (n_events, n_bins + 1)
+        ci_95: (n_events, 2) lower/upper bounds
+
+    Returns:
+        Columnar dict of (n_events,) arrays: score, band, entropy, std,
+        ci_width. Use risk_info_at() for a RiskInfo of one row.
+    """
+    ci = np.asarray(ci_95, dtype=np.float64)
+    parts = risk_components(probabilities, frequencies, bins, ci[:, 0], ci[:, 1])
+    parts["band"] = risk_bands(parts["score"])
+    return parts
+
+
+def risk_info_at(batch: dict[str, np.ndarray], index: int) -> RiskInfo:
+    """RiskInfo for one row of an assess_risk_batch() result."""
+    score = float(batch["score"][index])
+    return RiskInfo(score=score, band=str(batch["band"][index]), rationale=_rationale(str(batch["band"][index]), score))
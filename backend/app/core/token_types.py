@@ -22,18 +22,21 @@ FEATURE_COSTS: Dict[FeatureTier, int] = {
     FeatureTier.DEEP_DIVE_EDUCATIONAL: 5,
 }
 
+# Largest audit page either ledger returns from get_audit_page()
+AUDIT_PAGE_MAX = 1000
+
 class TokenTransaction(BaseModel):
     """Record of a token transaction"""
     transaction_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
-    feature: FeatureTier
+    feature: Optional[FeatureTier] = None  # None for top-ups
     cost: int
     balance_before: int
     balance_after: int
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     event_id: Optional[str] = None
     idempotency_key: Optional[str] = None
-    status: str = Field(default="success")  # success | denied | refunded
+    status: str = Field(default="success")  # success | denied | refunded | topup
 
 class TokenBalance(BaseModel):
     """User token balance"""
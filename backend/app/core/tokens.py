@@ -20,9 +20,10 @@ Features:
 - User balance tracking
 """
 
-from typing import Dict, Optional, List
+import threading
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
-from app.core.token_types import FeatureTier, TokenTransaction, UserStatus, AccessDeniedError, FEATURE_COSTS
+from app.core.token_types import FeatureTier, TokenTransaction, UserStatus, AccessDeniedError, FEATURE_COSTS, AUDIT_PAGE_MAX
 
 
 class TokenLedger:
@@ -37,6 +38,8 @@ class TokenLedger:
         self._transactions: List[TokenTransaction] = []
         self._idempotency_cache: Dict[str, str] = {}  # idempotency_key -> transaction_id
         self._user_statuses: Dict[str, UserStatus] = {}
+        # Serializes read-modify-write of balances (check-and-consume, top-ups, refunds)
+        self._lock = threading.Lock()
     
     def get_balance(self, user_id: str) -> int:
         """Get current token balance for user"""
@@ -53,9 +56,18 @@ class TokenLedger:
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        current = self.get_balance(user_id)
-        new_balance = current + amount
-        self._balances[user_id] = new_balance
+        with self._lock:
+            current = self.get_balance(user_id)
+            new_balance = current + amount
+            self._balances[user_id] = new_balance
+            # Top-ups are audited too (negative cost, like refunds)
+            self._transactions.append(TokenTransaction(
+                user_id=user_id,
+                cost=-amount,
+                balance_before=current,
+                balance_after=new_balance,
+                status="topup"
+            ))
         return new_balance
     
     def check_access(
@@ -93,56 +105,57 @@ class TokenLedger:
         Raises:
             AccessDeniedError: If insufficient tokens
         """
-        # Idempotency check: return cached transaction if key exists
-        if idempotency_key and idempotency_key in self._idempotency_cache:
-            cached_tx_id = self._idempotency_cache[idempotency_key]
-            # Find transaction
-            for tx in self._transactions:
-                if tx.transaction_id == cached_tx_id:
-                    return tx
+        with self._lock:
+            # Idempotency check: return cached transaction if key exists
+            if idempotency_key and idempotency_key in self._idempotency_cache:
+                cached_tx_id = self._idempotency_cache[idempotency_key]
+                # Find transaction
+                for tx in self._transactions:
+                    if tx.transaction_id == cached_tx_id:
+                        return tx
         
-        required = FEATURE_COSTS[feature]
-        available = self.get_balance(user_id)
+            required = FEATURE_COSTS[feature]
+            available = self.get_balance(user_id)
         
-        # Check sufficiency
-        if available < required:
-            # Log denied transaction
-            denied_tx = TokenTransaction(
+            # Check sufficiency
+            if available < required:
+                # Log denied transaction
+                denied_tx = TokenTransaction(
+                    user_id=user_id,
+                    feature=feature,
+                    cost=required,
+                    balance_before=available,
+                    balance_after=available,
+                    event_id=event_id,
+                    idempotency_key=idempotency_key,
+                    status="denied"
+                )
+                self._transactions.append(denied_tx)
+                raise AccessDeniedError(feature, required, available)
+        
+            # Deduct tokens
+            new_balance = available - required
+            self._balances[user_id] = new_balance
+        
+            # Record transaction
+            transaction = TokenTransaction(
                 user_id=user_id,
                 feature=feature,
                 cost=required,
                 balance_before=available,
-                balance_after=available,
+                balance_after=new_balance,
                 event_id=event_id,
                 idempotency_key=idempotency_key,
-                status="denied"
+                status="success"
             )
-            self._transactions.append(denied_tx)
-            raise AccessDeniedError(feature, required, available)
-        
-        # Deduct tokens
-        new_balance = available - required
-        self._balances[user_id] = new_balance
-        
-        # Record transaction
-        transaction = TokenTransaction(
-            user_id=user_id,
-            feature=feature,
-            cost=required,
-            balance_before=available,
-            balance_after=new_balance,
-            event_id=event_id,
-            idempotency_key=idempotency_key,
-            status="success"
-        )
         
-        self._transactions.append(transaction)
+            self._transactions.append(transaction)
         
-        # Cache idempotency key
-        if idempotency_key:
-            self._idempotency_cache[idempotency_key] = transaction.transaction_id
+            # Cache idempotency key
+            if idempotency_key:
+                self._idempotency_cache[idempotency_key] = transaction.transaction_id
         
-        return transaction
+            return transaction
     
     def refund_transaction(self, transaction_id: str) -> TokenTransaction:
         """
@@ -157,40 +170,41 @@ class TokenLedger:
         Raises:
             ValueError: If transaction not found or already refunded
         """
-        # Find original transaction
-        original_tx = None
-        for tx in self._transactions:
-            if tx.transaction_id == transaction_id:
-                original_tx = tx
-                break
+        with self._lock:
+            # Find original transaction
+            original_tx = None
+            for tx in self._transactions:
+                if tx.transaction_id == transaction_id:
+                    original_tx = tx
+                    break
         
-        if not original_tx:
-            raise ValueError(f"Transaction {transaction_id} not found")
+            if not original_tx:
+                raise ValueError(f"Transaction {transaction_id} not found")
         
-        if original_tx.status == "refunded":
-            raise ValueError(f"Transaction {transaction_id} already refunded")
+            if original_tx.status == "refunded":
+                raise ValueError(f"Transaction {transaction_id} already refunded")
         
-        # Restore tokens
-        current_balance = self.get_balance(original_tx.user_id)
-        new_balance = current_balance + original_tx.cost
-        self._balances[original_tx.user_id] = new_balance
+            # Restore tokens
+            current_balance = self.get_balance(original_tx.user_id)
+            new_balance = current_balance + original_tx.cost
+            self._balances[original_tx.user_id] = new_balance
         
-        # Mark original as refunded
-        original_tx.status = "refunded"
+            # Mark original as refunded
+            original_tx.status = "refunded"
         
-        # Create refund transaction
-        refund_tx = TokenTransaction(
-            user_id=original_tx.user_id,
-            feature=original_tx.feature,
-            cost=-original_tx.cost,  # Negative cost = refund
-            balance_before=current_balance,
-            balance_after=new_balance,
-            event_id=original_tx.event_id,
-            status="refunded"
-        )
+            # Create refund transaction
+            refund_tx = TokenTransaction(
+                user_id=original_tx.user_id,
+                feature=original_tx.feature,
+                cost=-original_tx.cost,  # Negative cost = refund
+                balance_before=current_balance,
+                balance_after=new_balance,
+                event_id=original_tx.event_id,
+                status="refunded"
+            )
         
-        self._transactions.append(refund_tx)
-        return refund_tx
+            self._transactions.append(refund_tx)
+            return refund_tx
     
     def get_transaction_history(
         self,
@@ -209,6 +223,30 @@ class TokenLedger:
     def get_all_transactions(self) -> List[TokenTransaction]:
         """Get all transactions in the ledger (Admin/Audit)"""
         return self._transactions
+
+    def iter_transactions(self, page_size: int = AUDIT_PAGE_MAX) -> Iterator[TokenTransaction]:
+        """Every audit transaction, oldest first, read one get_audit_page() at a time"""
+        cursor = None
+        while True:
+            page, cursor = self.get_audit_page(cursor=cursor, limit=page_size)
+            for _, tx in page:
+                yield tx
+            if cursor is None:
+                return
+
+    def get_audit_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Tuple[str, TokenTransaction]], Optional[str]]:
+        """Cursor-paginated audit read, oldest first (same contract as RedisTokenLedger)"""
+        limit = max(1, min(int(limit), AUDIT_PAGE_MAX))
+        if cursor and not cursor.isdigit():
+            raise ValueError(f"Invalid audit cursor '{cursor}'")
+        start = int(cursor) if cursor else 0
+        chunk = self._transactions[start:start + limit]
+        page = [(str(start + i + 1), tx) for i, tx in enumerate(chunk)]
+        return page, (page[-1][0] if len(page) == limit else None)
     
     def get_user_status(self, user_id: str) -> UserStatus:
         """Get full status for a user including daily limits and cooldowns"""
@@ -12,12 +12,15 @@ These metrics enable users to understand:
 - How confident should I be in this analysis?
 """
 
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 import numpy as np
 from scipy import stats
 
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
 
 class UncertaintyMetrics(BaseModel):
     """
@@ -302,29 +305,19 @@ def compute_all_uncertainty_metrics(
         UncertaintyMetrics object with all metrics and factors
     """
     
-    # Compute each metric
-    volatility = compute_volatility_score(distribution_values, percentiles)
-    data_quality = compute_data_quality_index(
+    values = np.asarray(distribution_values, dtype=np.float64)
+    batch = compute_uncertainty_batch(
+        values[None, :],
         features_present,
-        data_age_days,
-        sample_size
-    )
-    confidence_decay = compute_confidence_decay(
-        volatility,
-        data_age_days or 0.0,
-        event_horizon_days
+        data_age_days=data_age_days,
+        sample_size=sample_size,
+        event_horizon_days=event_horizon_days,
+        percentiles={k: [v] for k, v in percentiles.items()} if percentiles else None
     )
-    
-    # Build factor breakdown
-    factors = {
-        "distribution_cv": float(np.std(distribution_values, ddof=1) / np.mean(distribution_values)),
-        "data_age_days": data_age_days or 0.0,
-        "feature_coverage": sum(features_present.values()) / len(features_present) if features_present else 0.0,
-        "sample_size": sample_size or 0,
-        "event_horizon_days": event_horizon_days
-    }
-    
-    # Generate notes
+    return batch.metrics(0)
+
+
+def _notes(volatility: float, data_quality: float, confidence_decay: float) -> str:
     notes_parts = []
     if volatility > 70:
         notes_parts.append("High volatility: wide range of possible outcomes")
@@ -332,13 +325,187 @@ def compute_all_uncertainty_metrics(
         notes_parts.append("Limited data quality: missing features or stale data")
     if confidence_decay > 0.15:
         notes_parts.append("Rapid confidence decay: prediction freshness critical")
-    
-    notes = "; ".join(notes_parts) if notes_parts else "Standard uncertainty profile"
-    
-    return UncertaintyMetrics(
-        volatility_score=volatility,
+    return "; ".join(notes_parts) if notes_parts else "Standard uncertainty profile"
+
+
+@dataclass
+class UncertaintyBatch:
+    """
+    Columnar uncertainty metrics for a slate: one array entry per event.
+
+    UncertaintyMetrics objects are only built when asked for, via
+    metrics(i) or to_models().
+    """
+
+    volatility_score: np.ndarray
+    data_quality_index: np.ndarray
+    confidence_decay: np.ndarray
+    # Volatility inputs, per event
+    cv: np.ndarray
+    iqr: np.ndarray
+    tail_weight: np.ndarray
+    kurtosis: np.ndarray
+    # Factor breakdown, per event
+    distribution_cv: np.ndarray
+    data_age_days: np.ndarray
+    feature_coverage: np.ndarray
+    sample_size: np.ndarray
+    event_horizon_days: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.volatility_score.shape[0])
+
+    def metrics(self, i: int) -> UncertaintyMetrics:
+        volatility = float(self.volatility_score[i])
+        data_quality = float(self.data_quality_index[i])
+        decay = float(self.confidence_decay[i])
+        return UncertaintyMetrics(
+            volatility_score=volatility,
+            data_quality_index=data_quality,
+            confidence_decay=decay,
+            factors={
+                "distribution_cv": float(self.distribution_cv[i]),
+                "data_age_days": float(self.data_age_days[i]),
+                "feature_coverage": float(self.feature_coverage[i]),
+                "sample_size": int(self.sample_size[i]),
+                "event_horizon_days": float(self.event_horizon_days[i])
+            },
+            notes=_notes(volatility, data_quality, decay)
+        )
+
+    def to_models(self) -> List[UncertaintyMetrics]:
+        return [self.metrics(i) for i in range(len(self))]
+
+
+def compute_volatility_components(
+    distribution_values: np.ndarray,
+    percentiles: Optional[Dict[str, ArrayLike]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized compute_volatility_score() over a (n_events, n_sims) array.
+
+    One percentile call (p5/p25/p75/p95) and one moment pass along axis 1
+    give CV, IQR, tail weight and excess kurtosis for every row.
+
+    Returns:
+        Dict of (n_events,) arrays: volatility_score, cv, iqr, tail_weight,
+        kurtosis, mean, std (ddof=1)
+    """
+    x = np.asarray(distribution_values, dtype=np.float64)
+    n = x.shape[1]
+
+    mean = x.mean(axis=1)
+    dev = x - mean[:, None]
+    dev2 = dev * dev
+    m2 = dev2.mean(axis=1)
+    m4 = (dev2 * dev2).mean(axis=1)
+    constant = m2 == 0
+    std = np.sqrt(m2 * n / (n - 1)) if n > 1 else np.full_like(m2, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # For distributions centered near zero, use std directly
+        cv = np.where(np.abs(mean) < 1e-10, std * 100, std / np.abs(mean))
+        # Like scipy.stats.kurtosis: undefined (-> 0) when the spread is below float resolution
+        near_constant = m2 <= (np.finfo(np.float64).resolution * mean) ** 2
+        kurt = np.where(near_constant, 0.0, m4 / (m2 * m2) - 3.0)
+    kurt = np.where(np.isfinite(kurt), kurt, 0.0)
+
+    p5, p25, p75, p95 = np.percentile(x, [5, 25, 75, 95], axis=1)
+    if percentiles:
+        p25 = np.asarray(percentiles.get("p25", p25), dtype=np.float64)
+        p75 = np.asarray(percentiles.get("p75", p75), dtype=np.float64)
+    iqr = p75 - p25
+    tail_weight = (p95 - p5) / (iqr + 1e-10)
+
+    # CV contributes up to 50 points, IQR up to 25, tail weight up to 15, kurtosis up to 10
+    score = (
+        np.minimum(cv * 100, 50)
+        + np.minimum(iqr * 50, 25)
+        + np.clip((tail_weight - 2.5) * 7.5, 0, 15)
+        + np.minimum(np.abs(kurt) * 5, 10)
+    )
+    score = np.where(constant, 0.0, np.clip(score, 0.0, 100.0))
+
+    return {
+        "volatility_score": score,
+        "cv": cv,
+        "iqr": iqr,
+        "tail_weight": tail_weight,
+        "kurtosis": kurt,
+        "mean": mean,
+        "std": std,
+    }
+
+
+def compute_uncertainty_batch(
+    distribution_values: np.ndarray,
+    features_present: Union[Dict[str, bool], Sequence[Dict[str, bool]]],
+    data_age_days: Optional[ArrayLike] = None,
+    sample_size: Optional[ArrayLike] = None,
+    event_horizon_days: ArrayLike = 7.0,
+    percentiles: Optional[Dict[str, ArrayLike]] = None
+) -> UncertaintyBatch:
+    """
+    compute_all_uncertainty_metrics() for many events in one call.
+
+    Args:
+        distribution_values: (n_events, n_sims) simulation samples
+        features_present: One feature dict for all events, or one per event
+        data_age_days: Scalar or per-event ages (None = unknown)
+        sample_size: Scalar or per-event sizes (None = unknown)
+        event_horizon_days: Scalar or per-event horizons
+        percentiles: Optional per-event p25/p75 overrides
+
+    Returns:
+        UncertaintyBatch with one array entry per event
+    """
+    vol = compute_volatility_components(distribution_values, percentiles)
+    n_events = vol["volatility_score"].shape[0]
+
+    def column(value, default: float) -> np.ndarray:
+        return np.broadcast_to(np.asarray(default if value is None else value, dtype=np.float64), (n_events,))
+
+    # Data quality index (see compute_data_quality_index)
+    if isinstance(features_present, dict):
+        features_present = [features_present] * n_events
+    coverage_score = np.array(
+        [50.0 * sum(f.values()) / len(f) if f else 50.0 for f in features_present], dtype=np.float64
+    )
+    coverage = np.array(
+        [sum(f.values()) / len(f) if f else 0.0 for f in features_present], dtype=np.float64
+    )
+    age = column(data_age_days, 0.0)
+    if data_age_days is None:
+        recency_score = np.full(n_events, 15.0)  # Neutral if unknown
+    else:
+        recency_score = np.where(age <= 0, 30.0, 30.0 * 0.5 ** (np.maximum(age, 0.0) / 14.0))
+    samples = column(sample_size, 0.0)
+    if sample_size is None:
+        sample_score = np.full(n_events, 10.0)  # Neutral if unknown
+    else:
+        sample_score = np.where(samples <= 0, 0.0, np.minimum(20.0, 5.0 * np.log10(np.maximum(samples, 0.0) + 1)))
+    data_quality = np.clip(coverage_score + recency_score + sample_score, 0.0, 100.0)
+
+    # Confidence decay (see compute_confidence_decay)
+    horizon = column(event_horizon_days, 7.0)
+    staleness = np.select([age <= 2, age <= 7, age <= 30], [1.0, 1.2, 1.5], 2.0)
+    proximity = np.select([horizon > 14, horizon >= 7], [0.8, 1.0], 1.3)
+    decay = np.clip((0.03 + vol["volatility_score"] / 100 * 0.12) * staleness * proximity, 0.0, 1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distribution_cv = vol["std"] / vol["mean"]
+
+    return UncertaintyBatch(
+        volatility_score=vol["volatility_score"],
         data_quality_index=data_quality,
-        confidence_decay=confidence_decay,
-        factors=factors,
-        notes=notes
+        confidence_decay=decay,
+        cv=vol["cv"],
+        iqr=vol["iqr"],
+        tail_weight=vol["tail_weight"],
+        kurtosis=vol["kurtosis"],
+        distribution_cv=distribution_cv,
+        data_age_days=np.array(age),
+        feature_coverage=coverage,
+        sample_size=np.array(samples, dtype=np.int64),
+        event_horizon_days=np.array(horizon)
     )
@@ -16,7 +16,7 @@ from app.api import clean_oracle  # V2 Clean Output Protocol
 from app.middleware.request_id import RequestIDMiddleware
 from app.logging import configure_logging, get_logger
 from app.error_handlers import install_error_handlers
-from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler, RateLimitMiddleware
 from app.middleware.idempotency import IdempotencyMiddleware
 
 # Configure structured logging
@@ -56,6 +56,11 @@ from slowapi.errors import RateLimitExceeded
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+# Shared per-user/per-tier token buckets (Redis when configured, local LRU otherwise)
+rate_limit_enabled = os.environ.get("RATE_LIMIT_ENABLED", str(use_json_logging)).lower() == "true"
+if rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
 # Add Request ID middleware (A1: Observability)
 app.add_middleware(RequestIDMiddleware)
 app.add_middleware(IdempotencyMiddleware)  # P2: Idempotency
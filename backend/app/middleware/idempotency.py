@@ -1,49 +1,105 @@
 from __future__ import annotations
-import hashlib
-import json
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from typing import Dict, List, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # In-memory store (will be Redis in Phase 4)
-_idempotency_store: Dict[str, tuple[Response, datetime]] = {}
 IDEMPOTENCY_TTL = timedelta(hours=24)
+# Responses larger than this are streamed through but never cached
+IDEMPOTENCY_MAX_BODY_BYTES = 256 * 1024
 
-class IdempotencyMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Fully buffered response, safe to replay any number of times."""
+    status_code: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+_idempotency_store: Dict[str, tuple[CachedResponse, datetime]] = {}
+
+
+class IdempotencyMiddleware:
+    """
+    Pure ASGI idempotency middleware.
+
+    The response body is teed into a bytes buffer while it streams to the
+    client, so replays never depend on a consumed body iterator. Bodies over
+    ``max_body_bytes`` are dropped from the buffer as soon as they overflow.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl: timedelta = IDEMPOTENCY_TTL,
+        max_body_bytes: int = IDEMPOTENCY_MAX_BODY_BYTES,
+    ):
+        self.app = app
+        self.ttl = ttl
+        self.max_body_bytes = int(max_body_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Only apply to POST/PUT/PATCH/DELETE
-        if request.method not in ["POST", "PUT", "PATCH", "DELETE"]:
-            return await call_next(request)
+        if scope["type"] != "http" or scope.get("method") not in _MUTATING_METHODS:
+            await self.app(scope, receive, send)
+            return
 
         # Get idempotency key from header
-        idempotency_key = request.headers.get("Idempotency-Key")
+        idempotency_key = ""
+        for name, value in scope.get("headers", []):
+            if name == b"idempotency-key":
+                idempotency_key = value.decode("latin-1")
+                break
         if not idempotency_key:
             # No key provided, proceed normally
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Check if we've seen this key before
-        if idempotency_key in _idempotency_store:
-            cached_response, timestamp = _idempotency_store[idempotency_key]
-            # Check TTL
-            if datetime.now() - timestamp < IDEMPOTENCY_TTL:
-                # Return cached response
-                return Response(
-                    content=cached_response.body,
-                    status_code=cached_response.status_code,
-                    headers=dict(cached_response.headers),
-                    media_type=cached_response.media_type
-                )
-            else:
-                # Expired, remove from cache
-                del _idempotency_store[idempotency_key]
-
-        # Process request
-        response = await call_next(request)
+        entry = _idempotency_store.get(idempotency_key)
+        if entry is not None:
+            cached, timestamp = entry
+            if datetime.now() - timestamp < self.ttl:
+                await _replay(cached, send)
+                return
+            # Expired, remove from cache
+            _idempotency_store.pop(idempotency_key, None)
+
+        status_code = 0
+        headers: List[Tuple[bytes, bytes]] = []
+        buffer = bytearray()
+        overflow = False
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, headers, overflow
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and not overflow:
+                buffer.extend(message.get("body", b""))
+                if len(buffer) > self.max_body_bytes:
+                    overflow = True
+                    buffer.clear()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
         # Cache successful responses (200-299)
-        if 200 <= response.status_code < 300:
-            _idempotency_store[idempotency_key] = (response, datetime.now())
+        if 200 <= status_code < 300 and not overflow:
+            _idempotency_store[idempotency_key] = (
+                CachedResponse(status_code=status_code, headers=headers, body=bytes(buffer)),
+                datetime.now(),
+            )
+
 
-        return response
+async def _replay(cached: CachedResponse, send: Send) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": cached.status_code,
+        "headers": cached.headers,
+    })
+    await send({"type": "http.response.body", "body": cached.body})
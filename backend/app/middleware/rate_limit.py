@@ -5,7 +5,20 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+import json
+import logging
 import os
+import threading
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
 
 # Initialize limiter
 limiter = Limiter(
@@ -14,25 +27,28 @@ limiter = Limiter(
     storage_uri="memory://"  # In-memory (will migrate to Redis in Phase 4)
 )
 
+
+def _error_payload(path: str, request_id: Optional[str], retry_after: float) -> Dict[str, Any]:
+    return {
+        "error_code": "rate_limit_exceeded",
+        "message": f"Rate limit exceeded. Try again in {int(retry_after)} seconds.",
+        "path": path,
+        "request_id": request_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     """
     Handler for 429 Too Many Requests
     Integrates with unified error contract
     """
-    from datetime import datetime, timezone
-
     request_id = request.headers.get("x-request-id")
 
     # Extract rate limit info from exception
     retry_after = getattr(exc, 'retry_after', None) or 60
 
-    payload = {
-        "error_code": "rate_limit_exceeded",
-        "message": f"Rate limit exceeded. Try again in {int(retry_after)} seconds.",
-        "path": str(request.url.path),
-        "request_id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    payload = _error_payload(str(request.url.path), request_id, retry_after)
 
     headers = {
         "Retry-After": str(int(retry_after)),
@@ -51,3 +67,310 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSO
 TIER_SYSTEM = "100/minute"      # /health, /ready, /version
 TIER_MUTATING = "10/minute"     # POST /simulate, DELETE /cache/clear
 TIER_READ = "30/minute"         # GET endpoints (default)
+
+
+# ---------------------------------------------------------------------------
+# Shared token-bucket limiter (Redis, with in-process LRU fallback)
+# ---------------------------------------------------------------------------
+
+# A rate is either a tier string ("10/minute") or an explicit (capacity, refill_per_sec)
+Rate = Union[str, Tuple[float, float]]
+
+_PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+# Bound on each Redis round trip (each one holds a worker thread)
+REDIS_SOCKET_TIMEOUT_S = float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", "0.1"))
+# After a Redis failure, use local buckets for this long before trying Redis again
+REDIS_RETRY_AFTER_S = 5.0
+
+
+@lru_cache(maxsize=64)
+def parse_rate(spec: str) -> Tuple[float, float]:
+    """Parse a tier string like "10/minute" into (capacity, refill tokens per second)."""
+    count, _, period = spec.partition("/")
+    seconds = _PERIODS.get(period.strip().rstrip("s"))
+    if seconds is None or not count.strip().isdigit():
+        raise ValueError(f"Invalid rate spec: {spec!r}")
+    capacity = float(count)
+    return capacity, capacity / seconds
+
+
+def _resolve_rate(rate: Rate) -> Tuple[float, float]:
+    return parse_rate(rate) if isinstance(rate, str) else (float(rate[0]), float(rate[1]))
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+
+
+# Atomic refill + take. Uses the server clock so all workers agree on "now".
+# KEYS[1] = bucket key; ARGV = capacity, refill_per_sec, cost
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+
+class _LocalBucket:
+    __slots__ = ("tokens", "last_refill")
+
+    def __init__(self, tokens: float, last_refill: float):
+        self.tokens = tokens
+        self.last_refill = last_refill
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limiter shared across workers through Redis.
+
+    Each (tier, key) pair gets its own bucket; refill and take happen in a
+    single Lua script so concurrent workers never double-spend a token.
+    If Redis is not configured, unreachable, or fails mid-request, the
+    limiter falls back to in-process buckets held in an LRU map capped at
+    ``max_local_keys`` entries.
+
+    ``hit()`` is synchronous. Async callers such as the ASGI middleware use
+    ``ahit()``, which runs the Redis round trip in a worker thread so the
+    event loop never waits on the network; local buckets are checked inline.
+    A client built from ``url`` gets ``socket_timeout`` on connect and on
+    every command. After a failure, Redis is skipped for ``redis_retry_after``
+    seconds, so a stalled server costs one timeout rather than one per
+    request. Clients passed in directly should set their own timeouts.
+
+    The class only depends on the standard library (plus ``redis`` when a
+    URL or client is given, and ``anyio`` for ``ahit()``), so any ASGI app
+    can use it.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        prefix: str = "ratelimit",
+        max_local_keys: int = 10_000,
+        socket_timeout: float = REDIS_SOCKET_TIMEOUT_S,
+        redis_retry_after: float = REDIS_RETRY_AFTER_S,
+    ):
+        self.prefix = prefix
+        self.max_local_keys = int(max_local_keys)
+        self.redis_retry_after = float(redis_retry_after)
+        self._local: "OrderedDict[str, _LocalBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._script = None
+        self._redis_down_until = 0.0
+
+        if client is None and url:
+            try:
+                import redis
+                client = redis.from_url(url, socket_connect_timeout=socket_timeout, socket_timeout=socket_timeout)
+                client.ping()
+            except Exception as e:
+                logger.warning(f"Could not connect to Redis for rate limiting: {e}. Using local buckets.")
+                client = None
+        if client is not None:
+            self._script = client.register_script(_TOKEN_BUCKET_LUA)
+        self.client = client
+
+    @property
+    def use_redis(self) -> bool:
+        return self._script is not None
+
+    def _bucket_key(self, key: str, rate: Rate) -> str:
+        tier = rate if isinstance(rate, str) else f"{rate[0]}@{rate[1]}"
+        return f"{self.prefix}:{tier}:{key}"
+
+    def _redis_ready(self) -> bool:
+        return self._script is not None and time.monotonic() >= self._redis_down_until
+
+    async def ahit(self, key: str, rate: Rate, cost: float = 1.0) -> RateLimitResult:
+        """``hit()`` for async callers: the Redis round trip runs in a worker thread."""
+        if self._redis_ready():
+            import anyio.to_thread
+
+            return await anyio.to_thread.run_sync(self.hit, key, rate, cost)
+        return self.hit(key, rate, cost)
+
+    def hit(self, key: str, rate: Rate, cost: float = 1.0) -> RateLimitResult:
+        """Take ``cost`` tokens from the bucket for ``key`` under ``rate``."""
+        capacity, per_sec = _resolve_rate(rate)
+        bucket_key = self._bucket_key(key, rate)
+
+        if self._redis_ready():
+            try:
+                allowed, tokens, retry_after = self._script(
+                    keys=[bucket_key], args=[capacity, per_sec, cost]
+                )
+                return RateLimitResult(
+                    allowed=bool(int(allowed)),
+                    limit=int(capacity),
+                    remaining=int(float(tokens)),
+                    retry_after=float(retry_after),
+                )
+            except Exception as e:
+                self._redis_down_until = time.monotonic() + self.redis_retry_after
+                logger.warning(
+                    f"Redis rate limit check failed: {e}. "
+                    f"Using local buckets for {self.redis_retry_after:g}s."
+                )
+
+        return self._hit_local(bucket_key, capacity, per_sec, cost)
+
+    def _hit_local(self, bucket_key: str, capacity: float, per_sec: float, cost: float) -> RateLimitResult:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._local.get(bucket_key)
+            if bucket is None:
+                bucket = _LocalBucket(capacity, now)
+                self._local[bucket_key] = bucket
+                if len(self._local) > self.max_local_keys:
+                    self._local.popitem(last=False)
+            else:
+                self._local.move_to_end(bucket_key)
+                elapsed = max(0.0, now - bucket.last_refill)
+                bucket.tokens = min(capacity, bucket.tokens + elapsed * per_sec)
+                bucket.last_refill = now
+
+            if bucket.tokens >= cost:
+                bucket.tokens -= cost
+                return RateLimitResult(True, int(capacity), int(bucket.tokens), 0.0)
+            retry_after = (cost - bucket.tokens) / per_sec
+            return RateLimitResult(False, int(capacity), int(bucket.tokens), retry_after)
+
+
+SYSTEM_PATHS = ("/health", "/ready", "/version")
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def classify_tier(method: str, path: str) -> str:
+    """Map a request onto TIER_SYSTEM / TIER_MUTATING / TIER_READ."""
+    if path in SYSTEM_PATHS:
+        return TIER_SYSTEM
+    if method in _MUTATING_METHODS:
+        return TIER_MUTATING
+    return TIER_READ
+
+
+def client_keys(scope: Scope) -> Tuple[str, ...]:
+    """
+    Bucket keys for a request: always the remote address, plus X-User-ID when present.
+
+    X-User-ID is not authenticated, so it only ever narrows a client's budget;
+    a caller rotating the header still drains its per-IP bucket.
+    """
+    client = scope.get("client")
+    keys: Tuple[str, ...] = ("ip:" + (client[0] if client else "unknown"),)
+    for name, value in scope.get("headers", []):
+        if name == b"x-user-id" and value:
+            return ("user:" + value.decode("latin-1"),) + keys
+    return keys
+
+
+async def _hit_all(limiter: "TokenBucketLimiter", keys: Tuple[str, ...], tier: str) -> RateLimitResult:
+    # Allowed only if every bucket allows; report the tightest one
+    results = [await limiter.ahit(key, tier) for key in keys]
+    denied = [r for r in results if not r.allowed]
+    if denied:
+        return max(denied, key=lambda r: r.retry_after)
+    return min(results, key=lambda r: r.remaining)
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware enforcing per-tier token buckets for each client IP
+    and, when X-User-ID is sent, for that user too (see ``client_keys``).
+
+    Rejections use the unified error contract (same body as
+    ``rate_limit_exceeded_handler``); allowed responses carry
+    X-RateLimit-Limit / X-RateLimit-Remaining headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[TokenBucketLimiter] = None,
+        exempt_paths: Tuple[str, ...] = ("/docs", "/redoc", "/openapi.json"),
+    ):
+        self.app = app
+        self.limiter = limiter or get_rate_limiter()
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope.get("path", "") in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        tier = classify_tier(scope.get("method", ""), path)
+        result = await _hit_all(self.limiter, client_keys(scope), tier)
+
+        if not result.allowed:
+            request_id = None
+            for name, value in scope.get("headers", []):
+                if name == b"x-request-id":
+                    request_id = value.decode("latin-1")
+                    break
+            retry_after = max(1, int(result.retry_after + 0.999))
+            body = json.dumps(_error_payload(path, request_id, retry_after)).encode("utf-8")
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", str(retry_after).encode("latin-1")),
+                    (b"x-ratelimit-limit", str(result.limit).encode("latin-1")),
+                    (b"x-ratelimit-remaining", b"0"),
+                    (b"x-ratelimit-reset", str(retry_after).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-ratelimit-limit", str(result.limit).encode("latin-1")))
+                headers.append((b"x-ratelimit-remaining", str(result.remaining).encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# Lazy-loaded global limiter instance
+_global_rate_limiter: Optional[TokenBucketLimiter] = None
+
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """Get the process-wide limiter (Redis-backed when REDIS_URL/REDIS_HOST is set)."""
+    global _global_rate_limiter
+    if _global_rate_limiter is None:
+        url = os.getenv("REDIS_URL")
+        if not url and os.getenv("REDIS_HOST"):
+            password = os.getenv("REDIS_PASSWORD")
+            auth = f":{password}@" if password else ""
+            url = f"redis://{auth}{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT', '6379')}/0"
+        _global_rate_limiter = TokenBucketLimiter(url=url)
+    return _global_rate_limiter
@@ -3,40 +3,56 @@ Request ID Middleware
 Generates unique X-Request-ID for each request for observability and tracing.
 """
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-import time
+from time import perf_counter_ns
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
-    Middleware that generates a unique request ID for each incoming request.
+    Pure ASGI middleware that generates a unique request ID for each incoming request.
     If X-Request-ID header exists, it's used; otherwise a new UUID is generated.
-    The request ID is attached to the response headers and made available to downstream handlers.
+    The request ID is attached to the response headers and made available to downstream
+    handlers through ``request.state.request_id``.
     """
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        
+        request_id = ""
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = str(uuid.uuid4())
+
         # Attach request ID to request state for access in route handlers
-        request.state.request_id = request_id
-        
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+
         # Record start time for duration calculation
-        start_time = time.time()
-        
-        # Process request
-        response: Response = await call_next(request)
-        
-        # Calculate duration
-        duration_ms = int((time.time() - start_time) * 1000)
-        
-        # Attach metadata to response
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = str(duration_ms)
-        
-        # Also attach duration to request state for logging
-        request.state.duration_ms = duration_ms
-        
-        return response
+        start_ns = perf_counter_ns()
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                duration_ms = (perf_counter_ns() - start_ns) // 1_000_000
+                # Also attach duration to request state for logging
+                state["duration_ms"] = duration_ms
+
+                # Attach metadata to response
+                headers = [
+                    (k, v) for k, v in message.get("headers", [])
+                    if k not in (b"x-request-id", b"x-process-time")
+                ]
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                headers.append((b"x-process-time", str(duration_ms).encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
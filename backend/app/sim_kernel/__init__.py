@@ -0,0 +1,31 @@
+"""
+Trickster simulation kernel.
+
+The package root stays import-light: the kernel, config and state are
+resolved on first attribute access, and actions load through the registry
+in ``app.sim_kernel.actions``.
+"""
+from __future__ import annotations
+
+import importlib
+
+_EXPORTS = {
+    "TricksterKernel": ".kernel",
+    "SimulationConfig": ".config",
+    "Budget": ".config",
+    "SimulationState": ".state",
+    "RunJournal": ".journal",
+    "build_pipeline": ".actions",
+    "get_action": ".actions",
+    "register_action": ".actions",
+}
+
+
+def __getattr__(attr: str):
+    module = _EXPORTS.get(attr)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    return getattr(importlib.import_module(module, package=__name__), attr)
+
+
+__all__ = list(_EXPORTS)
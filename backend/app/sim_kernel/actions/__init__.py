@@ -0,0 +1,137 @@
+"""
+Action registry for the simulation kernel.
+
+Actions are registered by name and imported on first use, so a service that
+builds a pipeline from names only imports the action modules it runs (the
+matchup graph, for example, pulls in numpy through ``cycles``). Built-ins
+are listed below. Third-party packages can add actions through the
+``trickster.sim_kernel.actions`` entry-point group (``name = "pkg.mod:Class"``);
+those are also resolved lazily.
+
+    >>> from app.sim_kernel.actions import build_pipeline
+    >>> build_pipeline(["ingest", "monte_carlo", "emit"])
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Dict, Iterable, List, Type, Union
+
+from .base import ActionContext, SimulationAction, has_batch
+
+ENTRY_POINT_GROUP = "trickster.sim_kernel.actions"
+
+# name -> "module:Class" (relative modules resolve against this package)
+_BUILTIN: Dict[str, str] = {
+    "ingest": ".ingest:IngestAction",
+    "feature_extract": ".feature_extract:FeatureExtractAction",
+    "rating_baseline": ".rating_baseline:RatingBaselineAction",
+    "matchup_graph": ".matchup_graph:MatchupGraphAction",
+    "monte_carlo": ".mc_run:MonteCarloAction",
+    "explain": ".explain:ExplainAction",
+    "emit": ".emit:EmitAction",
+}
+
+_targets: Dict[str, str] = dict(_BUILTIN)
+_loaded: Dict[str, Type[SimulationAction]] = {}
+_plugins_scanned = False
+_lock = threading.Lock()
+
+
+def register_action(name: str, target: Union[str, Type[SimulationAction], None] = None):
+    """
+    Register an action class under ``name``.
+
+    ``target`` is either the class or a lazy "module:Class" path. Without a
+    target this returns a class decorator. Re-registering a name replaces it.
+    """
+    if target is None:
+        def decorator(cls: Type[SimulationAction]) -> Type[SimulationAction]:
+            register_action(name, cls)
+            return cls
+        return decorator
+    with _lock:
+        _loaded.pop(name, None)
+        if isinstance(target, str):
+            _targets[name] = target
+        else:
+            _targets[name] = f"{target.__module__}:{target.__qualname__}"
+            _loaded[name] = target
+    return target
+
+
+def _scan_plugins() -> None:
+    global _plugins_scanned
+    if _plugins_scanned:
+        return
+    from importlib.metadata import entry_points
+
+    with _lock:
+        if not _plugins_scanned:
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                # Explicit registrations and built-ins win over plugins
+                _targets.setdefault(ep.name, ep.value)
+            _plugins_scanned = True
+
+
+def available_actions() -> List[str]:
+    """Registered action names (nothing is imported)."""
+    _scan_plugins()
+    return sorted(_targets)
+
+
+def _import(target: str) -> Type[SimulationAction]:
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name, package=__name__), attr)
+
+
+def get_action(name: str) -> Type[SimulationAction]:
+    """Action class registered as ``name``, importing its module on first use."""
+    cls = _loaded.get(name)
+    if cls is not None:
+        return cls
+    if name not in _targets:
+        _scan_plugins()
+    try:
+        target = _targets[name]
+    except KeyError:
+        raise KeyError(f"Unknown simulation action: {name!r}") from None
+    cls = _import(target)
+    with _lock:
+        _loaded[name] = cls
+    return cls
+
+
+def build_pipeline(names: Iterable[str]) -> List[SimulationAction]:
+    """Instantiate the named actions in order."""
+    return [get_action(name)() for name in names]
+
+
+_CLASS_NAMES = {target.rpartition(":")[2]: name for name, target in _BUILTIN.items()}
+
+
+def __getattr__(attr: str):
+    # ``from app.sim_kernel.actions import MonteCarloAction`` without eager imports
+    name = _CLASS_NAMES.get(attr)
+    if name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    return _import(_BUILTIN[name])
+
+
+__all__ = [
+    "ActionContext",
+    "SimulationAction",
+    "has_batch",
+    "register_action",
+    "available_actions",
+    "get_action",
+    "build_pipeline",
+    # Built-in action classes, resolved lazily by __getattr__
+    "IngestAction",
+    "FeatureExtractAction",
+    "RatingBaselineAction",
+    "MatchupGraphAction",
+    "MonteCarloAction",
+    "ExplainAction",
+    "EmitAction",
+]
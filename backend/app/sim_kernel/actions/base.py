@@ -1,19 +1,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
 @dataclass(frozen=True)
 class ActionContext:
     # Optional container for shared services (repos, clients, etc)
     services: Dict[str, Any]
+    # time.perf_counter() value the step should finish by; only set for degradable actions
+    deadline: Optional[float] = None
 
 
 class SimulationAction:
     name: str = "base"
     priority: int = 50
     degradable: bool = False
+    # State fields the action reads / writes. Dotted names address artifact
+    # entries ("artifacts.mc"). None means undeclared (treated as "everything").
+    reads: Optional[FrozenSet[str]] = None
+    writes: Optional[FrozenSet[str]] = None
+    # True if run_slice() can pause between chunks (see ROUND_ROBIN scheduling).
+    resumable: bool = False
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         raise NotImplementedError
+
+    def run_slice(self, ctx: ActionContext, state: Any, config: Any, slot: Dict[str, Any]) -> bool:
+        # ROUND_ROBIN calls this once per quantum until it returns True.
+        # Resumable actions do a bounded chunk of work before ctx.deadline and
+        # keep their progress in ``slot`` (private to this state and step);
+        # the default runs the whole action in one slice.
+        slot["state"] = self.run(ctx, state, config)
+        return True
+
+    def run_batch(self, ctx: ActionContext, states: List[Any], config: Any) -> List[Any]:
+        # Override to process a whole slate in one call; the kernel runs
+        # actions that keep this default state by state instead.
+        return [self.run(ctx, state, config) for state in states]
+
+    def can_batch(self, ctx: ActionContext) -> bool:
+        # True if run_batch really handles the slate in one call. Actions whose
+        # batched path depends on a service return False when it is not wired.
+        return type(self).run_batch is not SimulationAction.run_batch
+
+
+def has_batch(action: SimulationAction, ctx: ActionContext) -> bool:
+    """True if the action has a real batched implementation available in ``ctx``."""
+    return action.can_batch(ctx)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 from .base import SimulationAction, ActionContext
+from ..profiling import PROFILE_FIELDS
 
 
 class EmitAction(SimulationAction):
     name = "emit"
     priority = 10
     degradable = False
+    reads = frozenset({"artifacts", "warnings", "degraded", "degrade_reason"})
+    writes = frozenset({"artifacts.response"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         # This action should map internal artifacts to the API response contract.
@@ -21,7 +24,16 @@ class EmitAction(SimulationAction):
 
         # Always allow optional fields without breaking shape.
         resp.setdefault("meta", {})
-        resp["meta"]["run_id"] = ctx.services.get("_run_id") or getattr(ctx.services.get("_journal"), "run_id", None)
+        journal = ctx.services.get("_journal")
+        resp["meta"]["run_id"] = ctx.services.get("_run_id") or getattr(journal, "run_id", None)
+        profile = [
+            {"name": s.name, **{k: getattr(s, k) for k in PROFILE_FIELDS if getattr(s, k) is not None}}
+            for s in getattr(journal, "steps", ())
+            if s.wall_ns is not None
+        ]
+        if profile:
+            # Steps before emit only; emit's own counters are in the journal.
+            resp["meta"]["profile"] = profile
         resp["meta"]["degraded"] = bool(getattr(state, "degraded", False))
         if getattr(state, "degrade_reason", None):
             resp["meta"]["degrade_reason"] = state.degrade_reason
@@ -8,6 +8,8 @@ class ExplainAction(SimulationAction):
     name = "explain"
     priority = 30
     degradable = True
+    reads = frozenset({"request", "features", "rating", "mc_result"})
+    writes = frozenset({"explanation", "artifacts.explanation", "warnings"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         explainer = ctx.services.get("explainer")
@@ -8,6 +8,8 @@ class FeatureExtractAction(SimulationAction):
     name = "feature_extract"
     priority = 90
     degradable = True
+    reads = frozenset({"request"})
+    writes = frozenset({"features", "artifacts.features", "warnings"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         # Wrapper: call existing feature extractor if available via services.
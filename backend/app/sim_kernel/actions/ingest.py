@@ -8,6 +8,8 @@ class IngestAction(SimulationAction):
     name = "ingest"
     priority = 100
     degradable = False
+    reads = frozenset({"request"})
+    writes = frozenset({"artifacts.meta"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         # Minimal validation; do not overreach.
@@ -1,29 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
 from .base import SimulationAction, ActionContext
+from ..cycles import CycleReport, find_non_transitive_cycles
 
 
-def _find_triangle_cycle(nodes: List[str], edge_p: Dict[Tuple[str, str], float], threshold: float = 0.55) -> bool:
-    # Detect a simple directed triangle where p(u>v) and p(v>w) and p(w>u) exceed threshold.
-    n = len(nodes)
-    for i in range(n):
-        for j in range(n):
-            if j == i:
-                continue
-            for k in range(n):
-                if k == i or k == j:
-                    continue
-                u, v, w = nodes[i], nodes[j], nodes[k]
-                if edge_p.get((u, v), 0.0) >= threshold and edge_p.get((v, w), 0.0) >= threshold and edge_p.get((w, u), 0.0) >= threshold:
-                    return True
-    return False
+def _cycle_report(graph: Dict[str, Any]) -> CycleReport:
+    # graph expected: {"nodes":[...], "edges":[{"u":..,"v":..,"p":..}, ...]}
+    return find_non_transitive_cycles(graph.get("nodes") or [], graph.get("edges") or [])
 
 
 class MatchupGraphAction(SimulationAction):
     name = "matchup_graph"
     priority = 70
     degradable = True
+    reads = frozenset({"request", "features", "rating"})
+    writes = frozenset({"matchup_graph", "artifacts.matchup_graph", "artifacts.matchup_cycles", "warnings"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         graph_builder = ctx.services.get("matchup_graph_builder")
@@ -35,19 +27,42 @@ class MatchupGraphAction(SimulationAction):
         max_nodes = int(getattr(budget, "graph_nodes", config.budget.max_graph_nodes))
 
         graph = graph_builder(state.request, state.features, state.rating, max_nodes=max_nodes, seed=int(config.seed))
-        # graph expected: {"nodes":[...], "edges":[{"u":..,"v":..,"p":..}, ...]}
         state.matchup_graph = graph
         state.artifacts["matchup_graph"] = graph
 
-        nodes = list(graph.get("nodes") or [])
-        edge_p: Dict[Tuple[str, str], float] = {}
-        for e in graph.get("edges") or []:
-            u = str(e.get("u"))
-            v = str(e.get("v"))
-            p = float(e.get("p") or 0.0)
-            edge_p[(u, v)] = p
-
-        if len(nodes) >= 3 and _find_triangle_cycle(nodes, edge_p):
+        report = _cycle_report(graph)
+        state.artifacts["matchup_cycles"] = report.to_dict()
+        if report.has_cycle:
             state.warnings.append("non_transitive_cycle_detected")
 
         return state
+
+    def can_batch(self, ctx: ActionContext) -> bool:
+        return ctx.services.get("slate_graph_builder") is not None
+
+    def run_batch(self, ctx: ActionContext, states: List[Any], config: Any) -> List[Any]:
+        # Fixtures of one slate share a graph: build and check it once when a
+        # slate_graph_builder(requests, features, ratings, max_nodes, seed) is wired.
+        slate_builder = ctx.services.get("slate_graph_builder")
+        if slate_builder is None:
+            return [self.run(ctx, state, config) for state in states]
+
+        budget = ctx.services.get("_budget_decision")
+        max_nodes = int(getattr(budget, "graph_nodes", config.budget.max_graph_nodes))
+
+        graph = slate_builder(
+            [s.request for s in states],
+            [s.features for s in states],
+            [s.rating for s in states],
+            max_nodes=max_nodes,
+            seed=int(config.seed),
+        )
+        report = _cycle_report(graph)
+        cycles = report.to_dict()
+        for state in states:
+            state.matchup_graph = graph
+            state.artifacts["matchup_graph"] = graph
+            state.artifacts["matchup_cycles"] = cycles
+            if report.has_cycle:
+                state.warnings.append("non_transitive_cycle_detected")
+        return states
@@ -1,13 +1,52 @@
 from __future__ import annotations
 
-from typing import Any
+import inspect
+import threading
+import time
+import weakref
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
 from .base import SimulationAction, ActionContext
 
+# Smoothed ms per run observed for each mc_engine service; sizes runs to a deadline.
+# Kernels share it across threads (DAG waves, concurrent requests), so access holds the lock.
+_MS_PER_RUN: "weakref.WeakKeyDictionary[Callable[..., Any], float]" = weakref.WeakKeyDictionary()
+_MS_PER_RUN_LOCK = threading.Lock()
+_EWMA_ALPHA = 0.3
+
+
+def _ms_per_run(mc: Callable[..., Any]) -> Optional[float]:
+    try:
+        with _MS_PER_RUN_LOCK:
+            return _MS_PER_RUN.get(mc)
+    except TypeError:  # not weak-referenceable
+        return None
+
+
+def _observe(mc: Callable[..., Any], ms_per_run: float) -> None:
+    try:
+        with _MS_PER_RUN_LOCK:
+            prev = _MS_PER_RUN.get(mc)
+            _MS_PER_RUN[mc] = ms_per_run if prev is None else prev + _EWMA_ALPHA * (ms_per_run - prev)
+    except TypeError:
+        pass
+
+
+def _accepts_deadline(mc: Callable[..., Any]) -> bool:
+    try:
+        params = inspect.signature(mc).parameters
+    except (TypeError, ValueError):
+        return False
+    return "deadline" in params or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+
 
 class MonteCarloAction(SimulationAction):
     name = "monte_carlo"
     priority = 50
     degradable = True
+    resumable = True
+    reads = frozenset({"request", "features", "rating"})
+    writes = frozenset({"mc_result", "artifacts.mc", "warnings", "degraded", "degrade_reason"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         mc = ctx.services.get("mc_engine")
@@ -18,16 +57,107 @@ class MonteCarloAction(SimulationAction):
             return state
 
         budget = ctx.services.get("_budget_decision")
-        max_runs = getattr(budget, "mc_runs", config.budget.max_mc_runs)
+        requested = int(getattr(budget, "mc_runs", config.budget.max_mc_runs))
+        runs = requested
+
+        # Size the run to the step deadline from the service's measured cost per run.
+        kwargs = {}
+        if ctx.deadline is not None and config.budget.size_mc_to_deadline:
+            cost = _ms_per_run(mc)
+            if cost:
+                remaining_ms = (ctx.deadline - time.perf_counter()) * 1000.0
+                floor = min(requested, config.budget.min_mc_runs)
+                runs = max(floor, min(requested, int(remaining_ms / cost)))
+            if _accepts_deadline(mc):
+                kwargs["deadline"] = ctx.deadline
 
         # Pass baseline rating/features if engine supports it; otherwise ignore.
-        state.mc_result = mc(
+        started = time.perf_counter()
+        result = mc(
             request=state.request,
             features=state.features,
             rating=state.rating,
             seed=int(config.seed),
             depth=str(config.depth),
-            max_runs=int(max_runs),
+            max_runs=runs,
+            **kwargs,
         )
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        # Services that stop early (given a deadline) report the runs they achieved.
+        achieved = runs
+        if isinstance(result, dict):
+            achieved = int(result.get("n_runs") or result.get("n_simulations") or runs)
+        _observe(mc, elapsed_ms / max(1, achieved))
+
+        if achieved < requested and (runs < requested or kwargs):
+            reason = f"deadline_mc_runs:{achieved}/{requested}"
+            state.degraded = True
+            state.degrade_reason = f"{state.degrade_reason},{reason}" if state.degrade_reason else reason
+            if isinstance(result, dict):
+                result = {**result, "degraded": True, "achieved_runs": achieved, "requested_runs": requested}
+
+        state.mc_result = result
         state.artifacts["mc"] = state.mc_result
         return state
+
+    def run_slice(self, ctx: ActionContext, state: Any, config: Any, slot: Dict[str, Any]) -> bool:
+        # Chunked sampling when an mc_engine_stream service is wired:
+        # mc_engine_stream(request, features, rating, seed, depth, max_runs, chunk_runs)
+        # yields cumulative results chunk by chunk; the last one is final.
+        stream_fn = ctx.services.get("mc_engine_stream")
+        if stream_fn is None:
+            # Not chunkable: run it whole, without treating the quantum as a run deadline
+            return super().run_slice(replace(ctx, deadline=None), state, config, slot)
+
+        if "stream" not in slot:
+            budget = ctx.services.get("_budget_decision")
+            slot["stream"] = iter(stream_fn(
+                request=state.request,
+                features=state.features,
+                rating=state.rating,
+                seed=int(config.seed),
+                depth=str(config.depth),
+                max_runs=int(getattr(budget, "mc_runs", config.budget.max_mc_runs)),
+                chunk_runs=int(config.chunk_runs),
+            ))
+            slot["chunks"] = 0
+
+        for partial in slot["stream"]:
+            slot["result"] = partial
+            slot["chunks"] += 1
+            if ctx.deadline is not None and time.perf_counter() >= ctx.deadline:
+                return False
+
+        state.mc_result = slot.get("result")
+        state.artifacts["mc"] = state.mc_result
+        slot["state"] = state
+        return True
+
+    def can_batch(self, ctx: ActionContext) -> bool:
+        return ctx.services.get("mc_engine_batch") is not None
+
+    def run_batch(self, ctx: ActionContext, states: List[Any], config: Any) -> List[Any]:
+        # One vectorized call for the slate when an mc_engine_batch service is wired:
+        # mc_engine_batch(requests, features, ratings, seed, depth, max_runs) -> [result, ...]
+        mcb = ctx.services.get("mc_engine_batch")
+        if mcb is None:
+            return [self.run(ctx, state, config) for state in states]
+
+        budget = ctx.services.get("_budget_decision")
+        max_runs = int(getattr(budget, "mc_runs", config.budget.max_mc_runs))
+        results = list(mcb(
+            requests=[s.request for s in states],
+            features=[s.features for s in states],
+            ratings=[s.rating for s in states],
+            seed=int(config.seed),
+            depth=str(config.depth),
+            max_runs=max_runs,
+        ))
+        if len(results) != len(states):
+            raise ValueError(f"mc_engine_batch returned {len(results)} results for {len(states)} states")
+
+        for state, result in zip(states, results):
+            state.mc_result = result
+            state.artifacts["mc"] = result
+        return states
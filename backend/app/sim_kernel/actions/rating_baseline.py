@@ -8,6 +8,8 @@ class RatingBaselineAction(SimulationAction):
     name = "rating_baseline"
     priority = 80
     degradable = True
+    reads = frozenset({"request"})
+    writes = frozenset({"rating", "artifacts.rating", "warnings"})
 
     def run(self, ctx: ActionContext, state: Any, config: Any) -> Any:
         # Wrapper: call rating provider if available via services.
@@ -4,8 +4,9 @@ from pydantic import BaseModel, Field
 from typing import Literal, Optional
 
 
-SchedulerKind = Literal["FIFO", "PRIORITY", "ROUND_ROBIN"]
+SchedulerKind = Literal["FIFO", "PRIORITY", "ROUND_ROBIN", "DAG"]
 DepthKind = Literal["lite", "standard", "full"]
+JournalHashKind = Literal["off", "shallow", "full"]
 
 
 class Budget(BaseModel):
@@ -13,12 +14,21 @@ class Budget(BaseModel):
     max_mc_runs: int = Field(default=500, ge=1)
     max_graph_nodes: int = Field(default=40, ge=0)
     max_explain_chars: int = Field(default=2000, ge=0)
+    # Live deadline: time held back for each later step, and the MC floor when cutting runs
+    reserve_ms_per_step: int = Field(default=10, ge=0)
+    min_mc_runs: int = Field(default=100, ge=1)
+    # Off: the MC step always runs the full max_mc_runs (no deadline sizing or early stop)
+    size_mc_to_deadline: bool = True
 
 
 class SimulationConfig(BaseModel):
     scheduler: SchedulerKind = "FIFO"
     depth: DepthKind = "standard"
     seed: int = 1337
-    quantum_ms: Optional[int] = None  # Only for ROUND_ROBIN
+    quantum_ms: Optional[int] = None  # Only for ROUND_ROBIN (default 10)
+    chunk_runs: int = Field(default=100, ge=1)  # Only for ROUND_ROBIN: MC runs per resumable chunk
+    max_workers: int = Field(default=4, ge=1)  # Only for DAG: threads per wave
     budget: Budget = Budget()
     scenario_id: Optional[str] = None
+    # Step hashing: off = none, shallow = fields the action reads/writes, full = whole state
+    journal_hashing: JournalHashKind = "full"
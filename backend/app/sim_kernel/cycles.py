@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CycleReport:
+    # Directed 3-cycles (u>v, v>w, w>u), each listed once starting at its first node in graph order.
+    triangles: List[Tuple[str, str, str]] = field(default_factory=list)
+    # Strongly connected components with 3+ nodes: every member sits on a cycle of some length.
+    components: List[List[str]] = field(default_factory=list)
+    truncated: bool = False  # triangles capped at max_triangles
+
+    @property
+    def has_cycle(self) -> bool:
+        return bool(self.triangles or self.components)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "triangles": [list(t) for t in self.triangles],
+            "components": [list(c) for c in self.components],
+            "truncated": self.truncated,
+        }
+
+
+def adjacency(nodes: Sequence[Any], edges: Iterable[Dict[str, Any]], threshold: float = 0.55) -> Tuple[List[str], np.ndarray]:
+    """Boolean matrix A[i, j] = p(nodes[i] beats nodes[j]) >= threshold. Edges to unknown nodes are ignored."""
+    names = [str(n) for n in nodes]
+    index = {name: i for i, name in enumerate(names)}
+    A = np.zeros((len(names), len(names)), dtype=bool)
+    for e in edges:
+        i = index.get(str(e.get("u")))
+        j = index.get(str(e.get("v")))
+        if i is None or j is None or i == j:
+            continue
+        # Later duplicates win, as with a dict keyed on (u, v)
+        A[i, j] = float(e.get("p") or 0.0) >= threshold
+    return names, A
+
+
+def has_triangle(A: np.ndarray) -> bool:
+    """trace(A^3) > 0, computed as sum((A @ A) * A.T) with one BLAS matmul."""
+    if A.shape[0] < 3:
+        return False
+    F = A.astype(np.float32)
+    return bool(np.einsum("ij,ji->", F @ F, F) > 0)
+
+
+def triangles(A: np.ndarray, limit: Optional[int] = None) -> Tuple[List[Tuple[int, int, int]], bool]:
+    """
+    All directed 3-cycles as index triples (i, j, k) with i the smallest index.
+
+    For every edge i->j with i < j, the closing nodes k > i are the
+    intersection of row j (j->k) and column i (k->i).
+    """
+    n = A.shape[0]
+    if n < 3:
+        return [], False
+    AT = A.T
+    found: List[Tuple[int, int, int]] = []
+    for i in range(n - 2):
+        js = np.flatnonzero(A[i, i + 1:]) + i + 1
+        if js.size == 0:
+            continue
+        back = AT[i, i + 1:]  # k -> i, for k > i
+        closing = A[js, i + 1:] & back  # (len(js), n - i - 1)
+        rows, cols = np.nonzero(closing)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            found.append((i, int(js[r]), c + i + 1))
+            if limit is not None and len(found) >= limit:
+                return found, True
+    return found, False
+
+
+def strongly_connected_components(A: np.ndarray) -> List[List[int]]:
+    """Kosaraju's algorithm (iterative); components in discovery order, members sorted."""
+    n = A.shape[0]
+    succ = [np.flatnonzero(A[i]).tolist() for i in range(n)]
+    pred = [np.flatnonzero(A[:, i]).tolist() for i in range(n)]
+
+    order: List[int] = []
+    seen = [False] * n
+    for root in range(n):
+        if seen[root]:
+            continue
+        seen[root] = True
+        stack = [(root, 0)]
+        while stack:
+            v, k = stack[-1]
+            if k < len(succ[v]):
+                stack[-1] = (v, k + 1)
+                w = succ[v][k]
+                if not seen[w]:
+                    seen[w] = True
+                    stack.append((w, 0))
+            else:
+                stack.pop()
+                order.append(v)
+
+    comp = [-1] * n
+    components: List[List[int]] = []
+    for root in reversed(order):
+        if comp[root] != -1:
+            continue
+        members = []
+        comp[root] = len(components)
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            members.append(v)
+            for w in pred[v]:
+                if comp[w] == -1:
+                    comp[w] = comp[root]
+                    stack.append(w)
+        components.append(sorted(members))
+    return components
+
+
+def find_non_transitive_cycles(
+    nodes: Sequence[Any],
+    edges: Iterable[Dict[str, Any]],
+    threshold: float = 0.55,
+    max_triangles: Optional[int] = 1000,
+    longer_cycles: bool = True,
+) -> CycleReport:
+    """
+    Non-transitive cycles in a matchup graph.
+
+    Triangles are listed exhaustively (up to ``max_triangles``). With
+    ``longer_cycles``, strongly connected components of 3+ nodes are also
+    reported, which covers cycles of any length. (Two-node components are
+    mutual "wins" above the threshold, a data issue rather than a cycle.)
+    """
+    names, A = adjacency(nodes, edges, threshold)
+    idx, truncated = triangles(A, limit=max_triangles) if has_triangle(A) else ([], False)
+    components: List[List[str]] = []
+    if longer_cycles:
+        components = [[names[i] for i in c] for c in strongly_connected_components(A) if len(c) >= 3]
+    return CycleReport(
+        triangles=[(names[i], names[j], names[k]) for i, j, k in idx],
+        components=components,
+        truncated=truncated,
+    )
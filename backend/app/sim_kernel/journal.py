@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -10,6 +12,38 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _serialize(obj: Any) -> bytes:
+    try:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    except Exception:
+        return str(obj).encode("utf-8")
+
+
+def stable_hash(obj: Any) -> str:
+    return hashlib.sha256(_serialize(obj)).hexdigest()
+
+
+class LazyDigest:
+    """
+    Deferred SHA-256 of a payload.
+
+    The payload is serialized when the digest is created, so later in-place
+    changes to nested state cannot leak into it; only the hashing waits
+    until the digest is first read.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Any):
+        self.payload = _serialize(payload)
+
+    def hexdigest(self) -> str:
+        return hashlib.sha256(self.payload).hexdigest()
+
+
+_HASH_FIELDS = ("inputs_hash", "outputs_hash")
+
+
 @dataclass
 class StepRecord:
     name: str
@@ -17,11 +51,37 @@ class StepRecord:
     started_at_ms: int
     ended_at_ms: int
     duration_ms: int
-    inputs_hash: str
+    inputs_hash: str  # may be passed as a LazyDigest; resolved on first access
     outputs_hash: str
     error_type: Optional[str] = None
     error_message: Optional[str] = None
     warnings: List[str] = field(default_factory=list)
+    budget_remaining_ms: Optional[float] = None  # run budget left when the step finished
+    # Set only when the kernel has a profiler (see profiling.py)
+    wall_ns: Optional[int] = None
+    cpu_ns: Optional[int] = None
+    alloc_peak_bytes: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Park lazy digests outside the instance dict so attribute lookup
+        # falls through to __getattr__, which resolves them once.
+        for name in _HASH_FIELDS:
+            value = self.__dict__.get(name)
+            if isinstance(value, LazyDigest):
+                del self.__dict__[name]
+                self.__dict__.setdefault("_lazy_hashes", {})[name] = value
+
+    def __getattr__(self, name: str) -> Any:
+        lazy = self.__dict__.get("_lazy_hashes")
+        if lazy and name in lazy:
+            value = lazy.pop(name).hexdigest()
+            self.__dict__[name] = value
+            return value
+        raise AttributeError(name)
+
+    @property
+    def hashes_pending(self) -> bool:
+        return bool(self.__dict__.get("_lazy_hashes"))
 
 
 @dataclass
@@ -38,3 +98,7 @@ class RunJournal:
     def close(self) -> None:
         self.ended_at_ms = _now_ms()
         self.duration_ms_total = max(0, self.ended_at_ms - self.started_at_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form for persistence; resolves any pending step hashes."""
+        return asdict(self)
@@ -1,31 +1,371 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
-from .actions.base import ActionContext, SimulationAction
+import copy
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from .actions.base import ActionContext, SimulationAction, has_batch
 from .config import SimulationConfig
-from .journal import RunJournal, StepRecord
-from .memory import first_fit_v1
-from .scheduler import get_scheduler
+from .journal import LazyDigest, RunJournal, StepRecord, stable_hash
+from .memory import DeadlineAllocator, first_fit_v1
+from .profiling import StepProfiler, accumulate
+from .scheduler import QuantumRecord, RoundRobinMetrics, RoundRobinScheduler, get_scheduler
 import time
-import json
-import hashlib
 
+logger = logging.getLogger(__name__)
 
-def _hash(obj: Any) -> str:
-    try:
-        payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
-    except Exception:
-        payload = str(obj).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+_hash = stable_hash
+
+
+def _snapshot(state: Any, fields: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """The state fields to hash (all fields when ``fields`` is None); LazyDigest serializes it at once."""
+    attrs = getattr(state, "__dict__", None)
+    if attrs is None:
+        return {"state": str(state)}
+    if fields is None:
+        return dict(attrs)
+    snap: Dict[str, Any] = {}
+    for name in sorted(fields):
+        head, _, key = name.partition(".")
+        value = attrs.get(head)
+        if key and isinstance(value, dict):
+            value = value.get(key)
+        snap[name] = value
+    return snap
+
+
+def _fork(state: Any) -> Any:
+    """Private copy for a concurrent step: own warnings list and artifacts dict."""
+    clone = copy.copy(state)
+    clone.warnings = list(state.warnings)
+    clone.artifacts = dict(state.artifacts)
+    return clone
+
+
+def _merge(state: Any, fork: Any, writes: FrozenSet[str], n_warnings: int) -> None:
+    """Copy a concurrent step's declared writes back onto the shared state."""
+    for name in sorted(writes):
+        head, _, key = name.partition(".")
+        if head == "warnings":
+            continue
+        if key:
+            if key in fork.artifacts:
+                state.artifacts[key] = fork.artifacts[key]
+        else:
+            setattr(state, head, getattr(fork, head))
+    state.warnings.extend(fork.warnings[n_warnings:])
 
 
 class TricksterKernel:
-    def __init__(self, services: Dict[str, Any] | None = None):
+    def __init__(self, services: Dict[str, Any] | None = None, sink: Any = None,
+                 profiler: Optional[StepProfiler] = None):
         self.services = services or {}
+        # Optional journal sink (e.g. store.JournalStore); submit() must not block.
+        self.sink = sink
+        # Optional per-step profiling hook; its counters land on each StepRecord.
+        self.profiler = profiler
+
+    def _finish(self, state: Any, journal: RunJournal) -> None:
+        journal.degraded = bool(getattr(state, "degraded", False))
+        journal.degrade_reason = getattr(state, "degrade_reason", None)
+        journal.close()
+        if self.sink is not None:
+            try:
+                self.sink.submit(journal)
+            except Exception:
+                pass
+
+    def _input_digest(self, hashing: str, action: SimulationAction, state: Any, journal: RunJournal, config_dump: Dict[str, Any]) -> Any:
+        if hashing == "off":
+            return ""
+        if hashing == "shallow":
+            return LazyDigest({"state": _snapshot(state, getattr(action, "reads", None)), "config": journal.config_hash, "action": action.name})
+        return LazyDigest({"state": _snapshot(state, None), "config": config_dump, "action": action.name})
+
+    def _output_digest(self, hashing: str, action: SimulationAction, state: Any) -> Any:
+        if hashing == "off":
+            return ""
+        return LazyDigest(_snapshot(state, getattr(action, "writes", None) if hashing == "shallow" else None))
+
+    def _step(self, action: SimulationAction, ctx: ActionContext, state: Any, config: SimulationConfig,
+              allocator: DeadlineAllocator, steps_after: int) -> Tuple[Any, Dict[str, Any]]:
+        started = int(time.time() * 1000)
+        status = "OK"
+        err_t = None
+        err_m = None
+        warnings: List[str] = []
+
+        if getattr(action, "degradable", False):
+            ctx = replace(ctx, deadline=allocator.step_deadline(steps_after))
+        before = (getattr(state, "degraded", False), getattr(state, "degrade_reason", None))
+
+        token = self.profiler.start() if self.profiler is not None else None
+        try:
+            state = action.run(ctx, state, config)
+            if (getattr(state, "degraded", False), getattr(state, "degrade_reason", None)) != before:
+                status = "DEGRADED"
+        except Exception as e:
+            status = "FAIL"
+            err_t = type(e).__name__
+            err_m = str(e)[:500]
+            # Do not explode: keep partial state, but record the failure.
+            warnings.append(f"step_failed:{action.name}")
+        profile = self.profiler.stop(token) if self.profiler is not None else {}
+
+        ended = int(time.time() * 1000)
+        return state, dict(
+            name=action.name,
+            status=status,
+            started_at_ms=started,
+            ended_at_ms=ended,
+            duration_ms=max(0, ended - started),
+            error_type=err_t,
+            error_message=err_m,
+            warnings=warnings,
+            budget_remaining_ms=round(allocator.remaining_ms(), 3),
+            **profile,
+        )
+
+    def _step_batch(self, action: SimulationAction, ctx: ActionContext, states: List[Any], config: SimulationConfig,
+                    allocator: DeadlineAllocator, steps_after: int) -> Tuple[List[Any], List[Dict[str, Any]]]:
+        """
+        One run_batch call for all states.
+
+        The action gets forked copies (see ``_fork``), so if it raises
+        part-way the caller's states are untouched and can be retried one
+        by one.
+        """
+        started = int(time.time() * 1000)
+        if getattr(action, "degradable", False):
+            ctx = replace(ctx, deadline=allocator.step_deadline(steps_after))
+        before = [(getattr(s, "degraded", False), getattr(s, "degrade_reason", None)) for s in states]
+
+        token = self.profiler.start() if self.profiler is not None else None
+        try:
+            out = list(action.run_batch(ctx, [_fork(s) for s in states], config))
+            if len(out) != len(states):
+                raise ValueError(f"{action.name}.run_batch returned {len(out)} states for {len(states)}")
+        finally:
+            profile = self.profiler.stop(token) if self.profiler is not None else {}
+
+        ended = int(time.time() * 1000)
+        remaining = round(allocator.remaining_ms(), 3)
+        records = []
+        for s, prev in zip(out, before):
+            changed = (getattr(s, "degraded", False), getattr(s, "degrade_reason", None)) != prev
+            records.append(dict(
+                name=action.name,
+                status="DEGRADED" if changed else "OK",
+                started_at_ms=started,
+                ended_at_ms=ended,
+                duration_ms=max(0, ended - started),
+                error_type=None,
+                error_message=None,
+                warnings=[],
+                budget_remaining_ms=remaining,
+                **profile,
+            ))
+        return out, records
+
+    def run_batch(self, actions: List[SimulationAction], states: List[Any], config: SimulationConfig) -> List[Tuple[Any, RunJournal]]:
+        """
+        Run one pipeline over many states (e.g. a nightly slate of fixtures).
+
+        Actions that can batch (see ``SimulationAction.can_batch``) are called
+        once for the whole batch; the rest run state by state. If a batched
+        call raises, the error is logged and that action is retried per state
+        from the unmodified states, so one bad fixture cannot fail the slate.
+        Every state gets its own journal; a batched step shares its timing
+        across the journals of the states it covered.
+        """
+        states = list(states)
+        config_dump = config.model_dump()
+        config_hash = _hash(config_dump)
+        hashing = getattr(config, "journal_hashing", "full")
+        journals = [RunJournal(config_hash=config_hash) for _ in states]
+
+        budget_decision = first_fit_v1(config)
+        for state in states:
+            if getattr(state, "degraded", False) or budget_decision.degraded:
+                state.degraded = True
+                state.degrade_reason = state.degrade_reason or budget_decision.reason
+
+        # Waves are irrelevant here: each action already covers every state in one call.
+        ordered = get_scheduler(config).order(actions, config)
+        ctx = ActionContext(services={**self.services, "_budget_decision": budget_decision})
+        allocator = DeadlineAllocator(config.budget)
+
+        try:
+            for index, action in enumerate(ordered):
+                steps_after = len(ordered) - 1 - index
+                inputs = [self._input_digest(hashing, action, s, j, config_dump) for s, j in zip(states, journals)]
+
+                records: List[Dict[str, Any]] = []
+                batched = has_batch(action, ctx)
+                batch_error: Optional[Exception] = None
+                if batched:
+                    try:
+                        states, records = self._step_batch(action, ctx, states, config, allocator, steps_after)
+                    except Exception as e:
+                        batched = False
+                        batch_error = e
+                        logger.warning(f"{action.name}.run_batch failed ({type(e).__name__}: {e}); "
+                                       f"retrying {len(states)} states one by one")
+                if not batched:
+                    for i, state in enumerate(states):
+                        state_ctx = replace(ctx, services={**ctx.services, "_journal": journals[i]})
+                        states[i], record = self._step(action, state_ctx, state, config, allocator, steps_after)
+                        if batch_error is not None:
+                            record["warnings"].append(f"batch_fallback:{action.name}")
+                            # A failing per-state retry keeps its own error; otherwise record the batch's.
+                            if record["error_type"] is None:
+                                record["error_type"] = type(batch_error).__name__
+                                record["error_message"] = str(batch_error)[:500]
+                        records.append(record)
+
+                for state, journal, inputs_hash, record in zip(states, journals, inputs, records):
+                    journal.steps.append(StepRecord(
+                        inputs_hash=inputs_hash,
+                        outputs_hash=self._output_digest(hashing, action, state),
+                        **record,
+                    ))
+        finally:
+            if self.profiler is not None:
+                self.profiler.close()
+
+        for state, journal in zip(states, journals):
+            self._finish(state, journal)
+        return list(zip(states, journals))
+
+    def run_round_robin(self, actions: List[SimulationAction], states: List[Any], config: SimulationConfig
+                        ) -> Tuple[List[Tuple[Any, RunJournal]], RoundRobinMetrics]:
+        """
+        Interleave many states through the pipeline in fixed time quanta.
+
+        States take turns in arrival order. In its turn, a state runs steps
+        until its quantum (``config.quantum_ms``) is used up. A resumable
+        action is paused at the quantum deadline via ``run_slice`` and
+        resumes on the state's next turn, so one large simulation cannot
+        starve short ones. Each state keeps its own journal; a sliced step's
+        ``duration_ms`` counts only the time it actually ran.
+        """
+        states = list(states)
+        config_dump = config.model_dump()
+        config_hash = _hash(config_dump)
+        hashing = getattr(config, "journal_hashing", "full")
+        journals = [RunJournal(config_hash=config_hash) for _ in states]
+
+        budget_decision = first_fit_v1(config)
+        for state in states:
+            if getattr(state, "degraded", False) or budget_decision.degraded:
+                state.degraded = True
+                state.degrade_reason = state.degrade_reason or budget_decision.reason
+
+        quantum_ms = RoundRobinScheduler(config.quantum_ms).quantum_ms
+        ordered = get_scheduler(config).order(actions, config)
+        base_services = {**self.services, "_budget_decision": budget_decision}
+        ctxs = [ActionContext(services={**base_services, "_journal": j}) for j in journals]
+        metrics = RoundRobinMetrics(quantum_ms=float(quantum_ms))
+
+        cursor = [0] * len(states)
+        slots: List[Dict[str, Any]] = [{} for _ in states]
+        started_at = time.perf_counter()
+        inflight = deque(range(len(states)) if ordered else [])
+        if not ordered:
+            for i, state in enumerate(states):
+                self._finish(state, journals[i])
+                metrics.completion_ms[i] = 0.0
+
+        rnd = 0
+        while inflight:
+            for _ in range(len(inflight)):
+                i = inflight.popleft()
+                q_start = time.perf_counter()
+                q_deadline = q_start + quantum_ms / 1000.0
+                completed = 0
+
+                while cursor[i] < len(ordered) and time.perf_counter() < q_deadline:
+                    action = ordered[cursor[i]]
+                    slot = slots[i]
+                    if not slot:
+                        slot.update(
+                            _wall_start=int(time.time() * 1000),
+                            _active_s=0.0,
+                            _inputs=self._input_digest(hashing, action, states[i], journals[i], config_dump),
+                            _before=(getattr(states[i], "degraded", False), getattr(states[i], "degrade_reason", None)),
+                        )
+                    # Only resumable actions see the quantum deadline; it is not a run budget.
+                    ctx = replace(ctxs[i], deadline=q_deadline) if getattr(action, "resumable", False) else ctxs[i]
+
+                    t0 = time.perf_counter()
+                    token = self.profiler.start() if self.profiler is not None else None
+                    error: Optional[Exception] = None
+                    try:
+                        done = action.run_slice(ctx, states[i], config, slot)
+                    except Exception as e:
+                        done, error = True, e
+                    if self.profiler is not None:
+                        accumulate(slot.setdefault("_profile", {}), self.profiler.stop(token))
+                    slot["_active_s"] += time.perf_counter() - t0
+                    if not done:
+                        break
+
+                    states[i] = slot.get("state", states[i])
+                    journals[i].steps.append(self._slice_record(action, states[i], slot, error, hashing))
+                    slots[i] = {}
+                    cursor[i] += 1
+                    completed += 1
+
+                used_ms = (time.perf_counter() - q_start) * 1000.0
+                metrics.quanta.append(QuantumRecord(
+                    round=rnd,
+                    state_index=i,
+                    used_ms=used_ms,
+                    overrun_ms=max(0.0, used_ms - quantum_ms),
+                    steps_completed=completed,
+                ))
+                if cursor[i] >= len(ordered):
+                    self._finish(states[i], journals[i])
+                    metrics.completion_ms[i] = (time.perf_counter() - started_at) * 1000.0
+                else:
+                    inflight.append(i)
+            rnd += 1
+
+        if self.profiler is not None:
+            self.profiler.close()
+        return list(zip(states, journals)), metrics
+
+    def _slice_record(self, action: SimulationAction, state: Any, slot: Dict[str, Any],
+                      error: Optional[Exception], hashing: str) -> StepRecord:
+        status = "OK"
+        warnings: List[str] = []
+        if error is not None:
+            status = "FAIL"
+            warnings.append(f"step_failed:{action.name}")
+        elif (getattr(state, "degraded", False), getattr(state, "degrade_reason", None)) != slot["_before"]:
+            status = "DEGRADED"
+        ended = int(time.time() * 1000)
+        return StepRecord(
+            name=action.name,
+            status=status,
+            started_at_ms=slot["_wall_start"],
+            ended_at_ms=ended,
+            duration_ms=int(round(slot["_active_s"] * 1000)),
+            inputs_hash=slot["_inputs"],
+            outputs_hash=self._output_digest(hashing, action, state),
+            error_type=type(error).__name__ if error is not None else None,
+            error_message=str(error)[:500] if error is not None else None,
+            warnings=warnings,
+            **slot.get("_profile", {}),
+        )
 
     def run(self, actions: List[SimulationAction], state: Any, config: SimulationConfig) -> Tuple[Any, RunJournal]:
         journal = RunJournal()
-        journal.config_hash = _hash(config.model_dump())
+        config_dump = config.model_dump()
+        journal.config_hash = _hash(config_dump)
+        hashing = getattr(config, "journal_hashing", "full")
 
         budget_decision = first_fit_v1(config)
         if getattr(state, "degraded", False) or budget_decision.degraded:
@@ -33,50 +373,50 @@ class TricksterKernel:
             state.degrade_reason = state.degrade_reason or budget_decision.reason
 
         scheduler = get_scheduler(config)
-        ordered = scheduler.order(actions, config)
+        if hasattr(scheduler, "levels"):
+            waves = scheduler.levels(actions, config)
+        else:
+            waves = [[action] for action in scheduler.order(actions, config)]
 
-        ctx = ActionContext(services=self.services)
+        # Allow actions to read budget decision via services (simple, low-friction).
+        # Copied per run so a reused kernel never sees a previous run's decision.
+        ctx = ActionContext(services={**self.services, "_budget_decision": budget_decision, "_journal": journal})
+        allocator = DeadlineAllocator(config.budget)
+        steps_left = sum(len(wave) for wave in waves)
 
-        for action in ordered:
-            started = int(time.time() * 1000)
-            inputs_hash = _hash({"state": getattr(state, "__dict__", str(state)), "config": config.model_dump(), "action": action.name})
+        pool: Optional[ThreadPoolExecutor] = None
+        try:
+            for wave in waves:
+                steps_left -= len(wave)
+                inputs = [self._input_digest(hashing, a, state, journal, config_dump) for a in wave]
+                # Undeclared writes cannot be merged back from a fork; run those steps in place.
+                if len(wave) == 1 or any(getattr(a, "writes", None) is None for a in wave) or not hasattr(state, "__dict__"):
+                    results = []
+                    for i, action in enumerate(wave):
+                        state, record = self._step(action, ctx, state, config, allocator, steps_left + len(wave) - 1 - i)
+                        results.append((record, self._output_digest(hashing, action, state)))
+                else:
+                    if pool is None:
+                        pool = ThreadPoolExecutor(max_workers=config.max_workers, thread_name_prefix="sim_kernel")
+                    n_warnings = len(state.warnings)
+                    futures = [pool.submit(self._step, a, ctx, _fork(state), config, allocator, steps_left) for a in wave]
+                    results = []
+                    # Merge in list order, never completion order, so the run is deterministic.
+                    for action, future in zip(wave, futures):
+                        fork, record = future.result()
+                        _merge(state, fork, action.writes, n_warnings)
+                        results.append((record, self._output_digest(hashing, action, state)))
 
-            status = "OK"
-            err_t = None
-            err_m = None
-            warnings: List[str] = []
-
-            try:
-                # Allow actions to read budget decision via services (simple, low-friction)
-                self.services.setdefault("_budget_decision", budget_decision)
-                state = action.run(ctx, state, config)
-            except Exception as e:
-                status = "FAIL"
-                err_t = type(e).__name__
-                err_m = str(e)[:500]
-                # Do not explode: keep partial state, but record the failure.
-                warnings.append(f"step_failed:{action.name}")
-
-            ended = int(time.time() * 1000)
-            outputs_hash = _hash(getattr(state, "__dict__", str(state)))
-
-            journal.steps.append(StepRecord(
-                name=action.name,
-                status=status,
-                started_at_ms=started,
-                ended_at_ms=ended,
-                duration_ms=max(0, ended - started),
-                inputs_hash=inputs_hash,
-                outputs_hash=outputs_hash,
-                error_type=err_t,
-                error_message=err_m,
-                warnings=warnings,
-            ))
+                for inputs_hash, (record, outputs_hash) in zip(inputs, results):
+                    journal.steps.append(StepRecord(inputs_hash=inputs_hash, outputs_hash=outputs_hash, **record))
 
-            # If a critical step fails, keep going unless it blocks emitting a response.
-            # Actions should be coded to tolerate missing upstream artifacts.
+                # If a critical step fails, keep going unless it blocks emitting a response.
+                # Actions should be coded to tolerate missing upstream artifacts.
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+            if self.profiler is not None:
+                self.profiler.close()
 
-        journal.degraded = bool(getattr(state, "degraded", False))
-        journal.degrade_reason = getattr(state, "degrade_reason", None)
-        journal.close()
+        self._finish(state, journal)
         return state, journal
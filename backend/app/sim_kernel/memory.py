@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Optional
-from .config import SimulationConfig
+from typing import Callable, Optional
+from .config import Budget, SimulationConfig
 
 
 @dataclass
@@ -42,3 +43,27 @@ def first_fit_v1(config: SimulationConfig) -> BudgetDecision:
 
     return BudgetDecision(mc_runs=mc_runs, explain_chars=explain_chars, graph_nodes=graph_nodes,
                          degraded=degraded, reason=reason)
+
+
+class DeadlineAllocator:
+    """
+    Live time budget for one kernel run.
+
+    Unlike first_fit_v1, which only applies static caps, this measures
+    elapsed wall time (perf_counter) as steps complete. Each degradable step
+    gets a deadline that holds back ``reserve_ms_per_step`` for every step
+    still scheduled after it.
+    """
+
+    def __init__(self, budget: Budget, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.deadline = self.started + budget.max_ms_total / 1000.0
+        self.reserve_s = budget.reserve_ms_per_step / 1000.0
+
+    def remaining_ms(self) -> float:
+        return (self.deadline - self.clock()) * 1000.0
+
+    def step_deadline(self, steps_after: int) -> float:
+        """Absolute deadline (clock seconds) for a step followed by ``steps_after`` more."""
+        return self.deadline - steps_after * self.reserve_s
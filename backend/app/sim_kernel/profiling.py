@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+# Keys a profiler adds to each StepRecord (and to the emitted meta["profile"])
+PROFILE_FIELDS = ("wall_ns", "cpu_ns", "alloc_peak_bytes")
+
+
+class StepProfiler(ABC):
+    """
+    Per-step profiling hook for TricksterKernel.
+
+    ``start()`` is called right before an action runs and returns an opaque
+    token; ``stop(token)`` returns the counters to record for that step,
+    keyed by names in PROFILE_FIELDS. ``close()`` is called once the run is
+    over to release process-wide state. Subclass to plug in other counters.
+    """
+
+    @abstractmethod
+    def start(self) -> Any:
+        ...
+
+    @abstractmethod
+    def stop(self, token: Any) -> Dict[str, int]:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class PerfProfiler(StepProfiler):
+    """
+    Nanosecond wall (perf_counter_ns) and CPU (process_time_ns) per step,
+    plus the tracemalloc allocation peak when ``trace_memory`` is set.
+
+    CPU time is process-wide, and tracemalloc tracks the whole process, so
+    with the DAG scheduler, steps in the same wave share each other's
+    counters. tracemalloc is started on first use if it is not already
+    running, and stopped again by ``close()`` if this profiler started it;
+    expect it to slow allocation-heavy code noticeably, which is why it is
+    opt-in.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self._started_tracing = False
+
+    def start(self) -> Any:
+        base = 0
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        return time.perf_counter_ns(), time.process_time_ns(), base
+
+    def stop(self, token: Any) -> Dict[str, int]:
+        wall0, cpu0, base = token
+        out = {"wall_ns": time.perf_counter_ns() - wall0, "cpu_ns": time.process_time_ns() - cpu0}
+        if self.trace_memory:
+            out["alloc_peak_bytes"] = max(0, tracemalloc.get_traced_memory()[1] - base)
+        return out
+
+    def close(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def accumulate(total: Dict[str, int], sample: Dict[str, int]) -> Dict[str, int]:
+    """Fold one slice into a step total: times add up, the allocation peak is the max."""
+    for key, value in sample.items():
+        if key == "alloc_peak_bytes":
+            total[key] = max(total.get(key, 0), value)
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def profiler_for_request(
+    header: Optional[str] = None,
+    sample_rate: float = 0.0,
+    rng: Callable[[], float] = random.random,
+    allow_header: bool = False,
+) -> Optional[StepProfiler]:
+    """
+    Profiler for one request, or None.
+
+    The header is only honoured when ``allow_header`` is set (it is caller
+    controlled, and "memory" turns on process-wide allocation tracing).
+    Then an explicit header wins: "memory" also traces allocations,
+    "0"/"off" disables profiling, and any other value turns on timing.
+    Otherwise a ``sample_rate`` fraction of requests gets timing only.
+    """
+    if header is not None and allow_header:
+        value = header.strip().lower()
+        if value in ("", "0", "off", "false", "no"):
+            return None
+        return PerfProfiler(trace_memory=value == "memory")
+    if sample_rate > 0 and rng() < sample_rate:
+        return PerfProfiler()
+    return None
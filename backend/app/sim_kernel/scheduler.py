@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Sequence
 from .actions.base import SimulationAction
 from .config import SimulationConfig
 
+# Fields every action may append to; concurrent appends do not order actions.
+APPEND_ONLY_FIELDS = frozenset({"warnings"})
+
 
 class FIFOScheduler:
     def order(self, actions: List[SimulationAction], config: SimulationConfig) -> List[SimulationAction]:
@@ -15,10 +19,146 @@ class PriorityScheduler:
         return sorted(actions, key=lambda a: getattr(a, "priority", 50), reverse=True)
 
 
+def _overlaps(a: Optional[FrozenSet[str]], b: Optional[FrozenSet[str]], skip: FrozenSet[str] = frozenset()) -> bool:
+    # None = undeclared = touches everything. "artifacts" overlaps "artifacts.mc".
+    if a is None or b is None:
+        return True
+    for x in a:
+        if x in skip:
+            continue
+        for y in b:
+            if y in skip:
+                continue
+            if x == y or x.startswith(y + ".") or y.startswith(x + "."):
+                return True
+    return False
+
+
+def depends_on(later: SimulationAction, earlier: SimulationAction) -> bool:
+    """True if ``later`` must run after ``earlier`` (read-after-write, write-after-read or write-after-write)."""
+    r2, w2 = getattr(later, "reads", None), getattr(later, "writes", None)
+    r1, w1 = getattr(earlier, "reads", None), getattr(earlier, "writes", None)
+    return (
+        _overlaps(r2, w1)
+        or _overlaps(w2, r1)
+        or _overlaps(w2, w1, skip=APPEND_ONLY_FIELDS)
+    )
+
+
+class DAGScheduler:
+    """
+    Orders actions by their declared ``reads``/``writes``.
+
+    The caller's list order is the intended program order: an action depends
+    on every earlier action it conflicts with. ``levels()`` groups actions
+    into waves whose members are independent of each other and may run
+    concurrently; within a wave, actions keep their list order so the journal
+    stays deterministic.
+    """
+
+    def levels(self, actions: List[SimulationAction], config: SimulationConfig) -> List[List[SimulationAction]]:
+        depth: List[int] = []
+        for i, action in enumerate(actions):
+            level = 0
+            for j in range(i):
+                if depth[j] >= level and depends_on(action, actions[j]):
+                    level = depth[j] + 1
+            depth.append(level)
+
+        waves: List[List[SimulationAction]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for action, level in zip(actions, depth):
+            waves[level].append(action)
+        return waves
+
+    def order(self, actions: List[SimulationAction], config: SimulationConfig) -> List[SimulationAction]:
+        return [a for wave in self.levels(actions, config) for a in wave]
+
+
+DEFAULT_QUANTUM_MS = 10
+
+
+def _nearest_rank(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return float(ordered[min(len(ordered), int(rank)) - 1])
+
+
+def jain_index(shares: Sequence[float]) -> float:
+    """Jain's fairness index: 1.0 when every share is equal, 1/n when one party gets everything."""
+    total = sum(shares)
+    if not shares or total <= 0:
+        return 1.0
+    return total * total / (len(shares) * sum(x * x for x in shares))
+
+
+@dataclass(frozen=True)
+class QuantumRecord:
+    round: int
+    state_index: int
+    used_ms: float  # time spent in the quantum
+    overrun_ms: float  # time past the quantum (non-resumable steps cannot yield)
+    steps_completed: int
+
+
+@dataclass
+class RoundRobinMetrics:
+    quantum_ms: float
+    quanta: List[QuantumRecord] = field(default_factory=list)
+    completion_ms: Dict[int, float] = field(default_factory=dict)  # state index -> time to finish
+
+    def fairness_per_round(self) -> List[float]:
+        """Jain's index over the time each in-flight state received, per round."""
+        rounds: Dict[int, List[float]] = {}
+        for q in self.quanta:
+            rounds.setdefault(q.round, []).append(q.used_ms)
+        return [jain_index(rounds[r]) for r in sorted(rounds)]
+
+    def latency_percentiles(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Completion latency percentiles across states, in ms."""
+        values = list(self.completion_ms.values())
+        return {f"p{p:g}": _nearest_rank(values, p) for p in percentiles}
+
+    def summary(self) -> Dict[str, float]:
+        fairness = self.fairness_per_round()
+        overruns = [q.overrun_ms for q in self.quanta]
+        return {
+            "quantum_ms": self.quantum_ms,
+            "quanta": len(self.quanta),
+            "rounds": len(fairness),
+            "fairness_min": min(fairness, default=1.0),
+            "fairness_mean": sum(fairness) / len(fairness) if fairness else 1.0,
+            "overrun_ms_max": max(overruns, default=0.0),
+            **{f"latency_{k}_ms": v for k, v in self.latency_percentiles().items()},
+        }
+
+
+class RoundRobinScheduler:
+    """
+    Time-sliced interleaving of many states (TricksterKernel.run_round_robin).
+
+    Each in-flight state gets ``quantum_ms`` per turn. Resumable actions
+    (``resumable = True``) pause at the quantum deadline and continue on the
+    state's next turn; other actions run to completion and any overrun is
+    recorded. For a single state there is nothing to interleave, so
+    ``order()`` is FIFO.
+    """
+
+    def __init__(self, quantum_ms: Optional[int] = None):
+        self.quantum_ms = quantum_ms or DEFAULT_QUANTUM_MS
+
+    def order(self, actions: List[SimulationAction], config: SimulationConfig) -> List[SimulationAction]:
+        return actions
+
+
 def get_scheduler(config: SimulationConfig):
     if config.scheduler == "FIFO":
         return FIFOScheduler()
     if config.scheduler == "PRIORITY":
         return PriorityScheduler()
-    # ROUND_ROBIN reserved for future batch runs
+    if config.scheduler == "DAG":
+        return DAGScheduler()
+    if config.scheduler == "ROUND_ROBIN":
+        return RoundRobinScheduler(config.quantum_ms)
     return FIFOScheduler()
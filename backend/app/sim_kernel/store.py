@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .journal import RunJournal
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    config_hash TEXT NOT NULL,
+    started_at_ms INTEGER NOT NULL,
+    duration_ms_total INTEGER NOT NULL,
+    degraded INTEGER NOT NULL,
+    degrade_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_config_hash ON runs (config_hash);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at_ms INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    budget_remaining_ms REAL,
+    error_type TEXT,
+    inputs_hash TEXT,
+    outputs_hash TEXT,
+    wall_ns INTEGER,
+    cpu_ns INTEGER,
+    alloc_peak_bytes INTEGER,
+    PRIMARY KEY (run_id, seq)
+);
+"""
+
+_STOP = object()
+
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> float:
+    # Nearest-rank on an already sorted sequence.
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return float(sorted_values[min(len(sorted_values), int(rank)) - 1])
+
+
+class JournalStore:
+    """
+    SQLite sink for kernel run journals.
+
+    ``submit()`` only enqueues the journal. A background thread writes runs
+    and steps in batches of up to ``batch_size`` journals per transaction,
+    so the request path never waits on disk I/O or on lazy step hashes
+    (they are resolved by the writer thread). When the queue is full, new
+    journals are dropped and counted in ``dropped`` rather than blocking.
+
+    Args:
+        path: SQLite file path (":memory:" for an in-process store)
+        batch_size: Journals written per transaction
+        max_queue: Pending journals held before dropping
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 256, max_queue: int = 10_000):
+        self.path = path
+        self.batch_size = max(1, int(batch_size))
+        self.dropped = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._writer: Optional[threading.Thread] = None
+
+    # -- write side -------------------------------------------------------
+
+    def submit(self, journal: RunJournal) -> None:
+        """Queue a closed journal for persistence (non-blocking)."""
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._drain, name="journal-store", daemon=True)
+                    self._writer.start()
+        try:
+            self._queue.put_nowait(journal)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until every submitted journal has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+        with self._lock:
+            self._conn.close()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            journals = [item for item in batch if item is not _STOP]
+            try:
+                if journals:
+                    self.write(journals)
+            except Exception as e:
+                logger.warning(f"Journal store write failed ({len(journals)} runs dropped): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def write(self, journals: Iterable[RunJournal]) -> None:
+        """Write journals synchronously in one transaction."""
+        runs = []
+        steps = []
+        for j in journals:
+            runs.append((j.run_id, j.config_hash, j.started_at_ms, j.duration_ms_total, int(j.degraded), j.degrade_reason))
+            for seq, s in enumerate(j.steps):
+                steps.append((
+                    j.run_id, seq, s.name, s.status, s.started_at_ms, s.duration_ms,
+                    s.budget_remaining_ms, s.error_type, s.inputs_hash, s.outputs_hash,
+                    s.wall_ns, s.cpu_ns, s.alloc_peak_bytes,
+                ))
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)", runs)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO steps (run_id, seq, name, status, started_at_ms, duration_ms,"
+                " budget_remaining_ms, error_type, inputs_hash, outputs_hash, wall_ns, cpu_ns, alloc_peak_bytes)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                steps,
+            )
+
+    # -- query side -------------------------------------------------------
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _where(config_hash: Optional[str], since_ms: Optional[int]) -> tuple:
+        clauses = []
+        params: List[Any] = []
+        if config_hash is not None:
+            clauses.append("runs.config_hash = ?")
+            params.append(config_hash)
+        if since_ms is not None:
+            clauses.append("runs.started_at_ms >= ?")
+            params.append(since_ms)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def step_latency_percentiles(
+        self,
+        config_hash: Optional[str] = None,
+        percentiles: Sequence[float] = (50, 95, 99),
+        since_ms: Optional[int] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """Per-step duration percentiles in ms: {step: {"p50": .., "p95": .., "count": n}}."""
+        where, params = self._where(config_hash, since_ms)
+        rows = self._query(
+            "SELECT steps.name, steps.duration_ms FROM steps JOIN runs USING (run_id)"
+            f"{where} ORDER BY steps.name, steps.duration_ms",
+            params,
+        )
+        by_step: Dict[str, List[float]] = {}
+        for name, duration in rows:
+            by_step.setdefault(name, []).append(duration)
+        return {
+            name: {**{f"p{p:g}": _percentile(values, p) for p in percentiles}, "count": len(values)}
+            for name, values in by_step.items()
+        }
+
+    def hot_actions(self, config_hash: Optional[str] = None, since_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Profiled steps per action, hottest (total CPU) first."""
+        where, params = self._where(config_hash, since_ms)
+        where = (where + " AND" if where else " WHERE") + " steps.wall_ns IS NOT NULL"
+        rows = self._query(
+            "SELECT steps.name, COUNT(*), SUM(steps.cpu_ns), AVG(steps.cpu_ns), AVG(steps.wall_ns),"
+            " MAX(steps.alloc_peak_bytes)"
+            f" FROM steps JOIN runs USING (run_id){where} GROUP BY steps.name ORDER BY SUM(steps.cpu_ns) DESC",
+            params,
+        )
+        return [
+            {"name": n, "profiled": c, "cpu_ns_total": tot, "cpu_ns_mean": cpu, "wall_ns_mean": wall, "alloc_peak_bytes_max": peak}
+            for n, c, tot, cpu, wall, peak in rows
+        ]
+
+    def degraded_rate(self, config_hash: Optional[str] = None, since_ms: Optional[int] = None) -> float:
+        """Fraction of runs that finished degraded."""
+        where, params = self._where(config_hash, since_ms)
+        total, degraded = self._query(f"SELECT COUNT(*), COALESCE(SUM(degraded), 0) FROM runs{where}", params)[0]
+        return degraded / total if total else 0.0
+
+    def failure_counts(self, config_hash: Optional[str] = None, since_ms: Optional[int] = None) -> Dict[str, int]:
+        """FAIL step counts per step name."""
+        where, params = self._where(config_hash, since_ms)
+        where = (where + " AND" if where else " WHERE") + " steps.status = 'FAIL'"
+        rows = self._query(
+            f"SELECT steps.name, COUNT(*) FROM steps JOIN runs USING (run_id){where} GROUP BY steps.name",
+            params,
+        )
+        return dict(rows)
+
+    def summary_by_config(self, since_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Runs, degraded rate and failed steps for each config_hash."""
+        where, params = self._where(None, since_ms)
+        rows = self._query(
+            "SELECT runs.config_hash, COUNT(*), COALESCE(SUM(runs.degraded), 0),"
+            " COALESCE(SUM((SELECT COUNT(*) FROM steps WHERE steps.run_id = runs.run_id AND steps.status = 'FAIL')), 0)"
+            f" FROM runs{where} GROUP BY runs.config_hash ORDER BY COUNT(*) DESC",
+            params,
+        )
+        return [
+            {"config_hash": h, "runs": n, "degraded_rate": d / n if n else 0.0, "failed_steps": f}
+            for h, n, d, f in rows
+        ]
+
+
+_global_store: Optional[JournalStore] = None
+_global_lock = threading.Lock()
+
+
+def get_journal_store() -> Optional[JournalStore]:
+    """Process-wide store at $SIM_KERNEL_JOURNAL_DB, or None when persistence is off."""
+    global _global_store
+    path = os.getenv("SIM_KERNEL_JOURNAL_DB")
+    if not path:
+        return None
+    if _global_store is None:
+        with _global_lock:
+            if _global_store is None:
+                _global_store = JournalStore(path)
+    return _global_store
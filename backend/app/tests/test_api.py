@@ -231,3 +231,13 @@ def test_explanation_included():
     summary_lower = explanation["summary"].lower()
     for term in forbidden:
         assert term not in summary_lower
+
+
+def test_request_id_headers():
+    """Request ID is echoed (or generated) and process time is attached"""
+    response = client.get("/health", headers={"X-Request-ID": "test-rid-echo"})
+    assert response.headers["X-Request-ID"] == "test-rid-echo"
+    assert int(response.headers["X-Process-Time"]) >= 0
+
+    generated = client.get("/health")
+    assert len(generated.headers["X-Request-ID"]) == 36
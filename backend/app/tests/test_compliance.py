@@ -0,0 +1,42 @@
+"""
+Unit tests for the shared compliance scanner (compliance.py)
+"""
+
+from app.core.compliance import TermScanner, iter_strings
+
+
+class TestTermScanner:
+    """One-pass vocabulary matching used by explain, language guard and exporter"""
+
+    def test_whole_words_reports_overlapping_terms(self):
+        """Terms inside longer terms are reported too, like one search per term"""
+        scanner = TermScanner(["bet", "sure bet", "sure", "certain", "certainty", "odd"])
+        found = scanner.findall("A SURE BET? Certainty is odds-free.")
+        assert found == ["sure bet", "sure", "bet", "certainty"]
+
+    def test_whole_words_respects_boundaries(self):
+        scanner = TermScanner(["bet", "unit"])
+        assert scanner.findall("betting on community units") == []
+        assert scanner.search("one unit") == "unit"
+
+    def test_substring_mode(self):
+        scanner = TermScanner(["apuesta", "odds"], whole_words=False)
+        assert scanner.findall("Las APUESTAS y los oddsmakers") == ["apuesta", "odds"]
+
+    def test_sub_maps_or_removes(self):
+        scanner = TermScanner(["odds", "pick", "lock"], whole_words=False)
+        assert scanner.sub({"odds": "precio", "pick": "opción"}, "Odds, pick, lock.") == "precio, opción, ."
+        assert scanner.sub(str.upper, "a pick") == "a PICK"
+
+    def test_iter_strings_visits_keys_and_values_in_order(self):
+        data = {"a": ["x", {"b": "y"}], "c": 3, "d": "z"}
+        assert list(iter_strings(data)) == ["a", "x", "b", "y", "c", "d", "z"]
+
+    def test_findall_within_spans(self):
+        """Only terms touching a span count, including ones completed across its edge"""
+        scanner = TermScanner(["bet", "sure bet", "lock"])
+        text = "a bet on Sure FC, Bet City and lock"
+        sure = text.index("Sure")
+        assert scanner.findall(text, spans=[(sure, sure + 4)]) == []
+        assert scanner.findall("a sure bet", spans=[(2, 6)]) == ["sure bet"]
+        assert scanner.findall(text, spans=[(len(text) - 4, len(text))]) == ["lock"]
@@ -1,6 +1,6 @@
 import pytest
 import time
-from app.core.engine import simulate_event
+from app.core.engine import simulate_event, simulate_outcomes_batch
 from app.api.schemas import EventInput, SimulationConfig
 
 @pytest.fixture
@@ -66,3 +66,16 @@ def test_n_sims_validation(sample_event):
         SimulationConfig(n_simulations=10)
     with pytest.raises(ValueError):
         SimulationConfig(n_simulations=100000)
+
+def test_outcomes_batch_is_columnar_and_deterministic(sample_event):
+    stronger = sample_event.model_copy(update={"home_rating": 1700})
+    events = [sample_event, stronger, sample_event]
+
+    result = simulate_outcomes_batch(events, n_simulations=2000, seed=7)
+    again = simulate_outcomes_batch(events, n_simulations=2000, seed=7)
+
+    assert result["prob_home"].shape == (3,)
+    assert (result["prob_home"] + result["prob_draw"] + result["prob_away"]).round(9).tolist() == [1.0, 1.0, 1.0]
+    assert (result["p5"] <= result["p50"]).all() and (result["p50"] <= result["p95"]).all()
+    assert result["prob_home"][1] > result["prob_home"][0]
+    assert (result["mean"] == again["mean"]).all()
@@ -11,9 +11,11 @@ from app.core.explain import (
     generate_caveats,
     calculate_sensitivity,
     validate_text_compliance,
-    FORBIDDEN_TERMS
+    FORBIDDEN_TERMS,
+    NarrativeTemplate
 )
 from app.api.schemas import RiskInfo, ExplanationOutput
+from app.core.model import calculate_win_probability
 
 
 # Test fixtures
@@ -332,6 +334,24 @@ class TestSensitivityAnalysis:
                 assert abs(factors[i].delta_probability) >= abs(factors[i+1].delta_probability), \
                     "Factors should be ordered by absolute impact"
 
+    
+    def test_sensitivity_matches_scalar_model(self, sample_probabilities):
+        """Vectorized grid agrees with re-running calculate_win_probability"""
+        event_input = {"home_rating": 2100, "away_rating": 2050, "home_advantage": 100}
+        factors = calculate_sensitivity(sample_probabilities, event_input, top_n=10)
+        base = calculate_win_probability(2100, 2050, 100)[0]
+        expected = {
+            "Home Team Rating (-50 ELO)": calculate_win_probability(2050, 2050, 100)[0],
+            "Home Advantage (-50 points)": calculate_win_probability(2100, 2050, 50)[0],
+        }
+        by_name = {f.factor_name: f.delta_probability for f in factors}
+        assert len(factors) == 3, "One factor per perturbed input"
+        for name, prob in expected.items():
+            assert by_name[name] == pytest.approx((prob - base) * 100, abs=0.01)
+        assert any(name.startswith("Draw Rate") for name in by_name)
+    
+    def test_sensitivity_needs_ratings(self, sample_probabilities):
+        assert calculate_sensitivity(sample_probabilities, {"home_rating": 2100}) == []
 
 class TestExplainIntegration:
     """Test complete explain() function (T2.1 + T2.2 integration)"""
@@ -405,6 +425,71 @@ class TestExplainIntegration:
         assert explanation_low.summary != explanation_high.summary
 
 
+
+class TestNarrativeTemplates:
+    """Templates are validated once; explanations are cached per key"""
+    
+    def test_template_rejects_forbidden_literal_text(self):
+        """Forbidden literal text is caught at build time, whatever the values"""
+        with pytest.raises(ValueError, match="forbidden"):
+            NarrativeTemplate("A sure thing for {team}")
+        with pytest.raises(ValueError, match="forbidden"):
+            NarrativeTemplate("The {team} line")
+    
+    def test_template_render_reports_value_spans(self):
+        text, spans = NarrativeTemplate("{team} at {pct:.1f}%").render(team="Alpha", pct=52.13)
+        assert text == "Alpha at 52.1%"
+        assert [text[a:b] for a, b in spans] == ["Alpha", "52.1"]
+    
+    def test_explain_scans_interpolated_values(
+        self,
+        sample_simulation_result,
+        sample_event_context
+    ):
+        """Team names are the only free text left to check at runtime"""
+        context = dict(sample_event_context, away_team="Lock City")
+        result = dict(sample_simulation_result, prob_home=0.30, prob_draw=0.40, prob_away=0.30)
+        with pytest.raises(ValueError, match="lock"):
+            explain(result, context)
+    
+    def test_explain_reuses_cached_narrative(
+        self,
+        sample_simulation_result,
+        sample_event_context
+    ):
+        """Results that round to the same probabilities share one narrative text"""
+        first = explain(sample_simulation_result, sample_event_context)
+        nudged = dict(sample_simulation_result, prob_home=0.55 + 1e-6)
+        second = explain(nudged, sample_event_context)
+        assert second.summary == first.summary
+        assert [s.description for s in second.scenarios] == [s.description for s in first.scenarios]
+        assert second.caveats == first.caveats
+        # Reported probabilities are the exact ones, not the cache key
+        assert second.scenarios[0].probability == 0.55 + 1e-6
+        # Cached content, but each response gets its own models
+        assert second.scenarios[0] is not first.scenarios[0]
+        first.scenarios[0].description = "changed"
+        third = explain(sample_simulation_result, sample_event_context)
+        assert third.scenarios[0].description == second.scenarios[0].description
+    
+    def test_cached_narrative_branches_on_exact_probabilities(
+        self,
+        sample_simulation_result,
+        sample_event_context
+    ):
+        """Thresholds are applied to exact values, even when they round across them"""
+        # Both round to prob_home=0.500
+        above = explain(dict(sample_simulation_result, prob_home=0.5004, prob_draw=0.2496, prob_away=0.25), sample_event_context)
+        below = explain(dict(sample_simulation_result, prob_home=0.4996, prob_draw=0.2504, prob_away=0.25), sample_event_context)
+        assert "relatively balanced" not in above.summary
+        assert "relatively balanced" in below.summary
+        assert "Highly Competitive" not in [s.name for s in above.scenarios]
+        assert "Highly Competitive" in [s.name for s in below.scenarios]
+
+        rare = explain(dict(sample_simulation_result, prob_home=0.7, prob_draw=0.2496, prob_away=0.0504), sample_event_context)
+        assert rare.scenarios[1].name == "Surprise Scenario"
+        assert rare.scenarios[1].probability == 0.0504
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
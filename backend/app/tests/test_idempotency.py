@@ -53,3 +53,48 @@ def test_idempotency_duplicate_key_returns_cached():
     # If successful, bodies should match
     if r1.status_code == 200:
         assert r1.json() == r2.json()
+
+
+def _streaming_app(chunks, counter):
+    from starlette.applications import Starlette
+    from starlette.responses import StreamingResponse
+    from starlette.routing import Route
+    from app.middleware.idempotency import IdempotencyMiddleware
+
+    async def endpoint(request):
+        counter.append(1)
+
+        async def body():
+            for chunk in chunks:
+                yield chunk
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    inner = Starlette(routes=[Route("/stream", endpoint, methods=["POST"])])
+    return IdempotencyMiddleware(inner, max_body_bytes=16)
+
+
+def test_idempotency_replays_streaming_body():
+    """Streaming responses are buffered once and replayed byte-for-byte"""
+    calls = []
+    stream_client = TestClient(_streaming_app([b"abc", b"def"], calls))
+    headers = {"Idempotency-Key": "test-key-stream-003"}
+
+    r1 = stream_client.post("/stream", headers=headers)
+    r2 = stream_client.post("/stream", headers=headers)
+
+    assert r1.text == r2.text == "abcdef"
+    assert len(calls) == 1
+
+
+def test_idempotency_skips_oversized_body():
+    """Bodies over the per-entry cap are served but not cached"""
+    calls = []
+    stream_client = TestClient(_streaming_app([b"x" * 10, b"y" * 10], calls))
+    headers = {"Idempotency-Key": "test-key-oversized-004"}
+
+    r1 = stream_client.post("/stream", headers=headers)
+    r2 = stream_client.post("/stream", headers=headers)
+
+    assert r1.text == r2.text == "x" * 10 + "y" * 10
+    assert len(calls) == 2
@@ -51,3 +51,120 @@ def test_rate_limit_headers_present():
     assert r.status_code == 200
     # Headers may or may not be present depending on slowapi configuration
     # This test documents expected behavior
+
+def test_parse_rate_tiers():
+    from app.middleware.rate_limit import parse_rate, TIER_MUTATING, TIER_READ
+    assert parse_rate(TIER_MUTATING) == (10.0, 10.0 / 60)
+    assert parse_rate(TIER_READ) == (30.0, 0.5)
+
+def test_token_bucket_local_fallback_is_per_user_and_tier():
+    from app.middleware.rate_limit import TokenBucketLimiter, TIER_MUTATING, TIER_READ
+    rl = TokenBucketLimiter(max_local_keys=2)
+    assert not rl.use_redis
+    results = [rl.hit("user:a", TIER_MUTATING) for _ in range(11)]
+    assert [r.allowed for r in results] == [True] * 10 + [False]
+    assert results[-1].retry_after > 0
+    # Other users and tiers have their own buckets
+    assert rl.hit("user:b", TIER_MUTATING).allowed
+    assert rl.hit("user:a", TIER_READ).allowed
+    # LRU keeps at most max_local_keys buckets
+    assert len(rl._local) == 2
+
+def test_token_bucket_redis_script_shared_across_instances():
+    import pytest
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from app.middleware.rate_limit import TokenBucketLimiter
+
+    server = fakeredis.FakeServer()
+    w1 = TokenBucketLimiter(client=fakeredis.FakeRedis(server=server))
+    w2 = TokenBucketLimiter(client=fakeredis.FakeRedis(server=server))
+    assert w1.use_redis and w2.use_redis
+    allowed = [w.hit("user:shared", "4/minute").allowed for w in (w1, w2, w1, w2, w1)]
+    assert allowed == [True, True, True, True, False]
+
+def test_rate_limit_middleware_returns_error_contract():
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from app.middleware.rate_limit import RateLimitMiddleware, TokenBucketLimiter
+
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    inner = Starlette(routes=[Route("/x", endpoint, methods=["POST"])])
+    rl_client = TestClient(RateLimitMiddleware(inner, limiter=TokenBucketLimiter()))
+    headers = {"X-User-ID": "rl-user", "X-Request-ID": "test-rl-mw"}
+    codes = [rl_client.post("/x", headers=headers).status_code for _ in range(11)]
+    assert codes == [200] * 10 + [429]
+
+    r = rl_client.post("/x", headers=headers)
+    assert r.json()["error_code"] == "rate_limit_exceeded"
+    assert r.json()["request_id"] == "test-rl-mw"
+    assert int(r.headers["Retry-After"]) >= 1
+    # X-User-ID is unauthenticated: another user on the same IP shares the IP bucket
+    assert rl_client.post("/x", headers={"X-User-ID": "other"}).status_code == 429
+
+
+def test_rotating_user_id_does_not_bypass_ip_bucket():
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from app.middleware.rate_limit import RateLimitMiddleware, TokenBucketLimiter, client_keys
+
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    inner = Starlette(routes=[Route("/x", endpoint, methods=["POST"])])
+    rl_client = TestClient(RateLimitMiddleware(inner, limiter=TokenBucketLimiter()))
+    codes = [rl_client.post("/x", headers={"X-User-ID": f"u{i}"}).status_code for i in range(11)]
+    assert codes == [200] * 10 + [429]
+
+    scope = {"client": ("10.0.0.1", 1234), "headers": [(b"x-user-id", b"alice")]}
+    assert client_keys(scope) == ("user:alice", "ip:10.0.0.1")
+    assert client_keys({"client": None, "headers": []}) == ("ip:unknown",)
+
+def test_token_bucket_redis_failure_falls_back_then_retries():
+    from app.middleware.rate_limit import TokenBucketLimiter
+
+    class StalledRedis:
+        calls = 0
+
+        def register_script(self, script):
+            def run(keys, args):
+                StalledRedis.calls += 1
+                raise TimeoutError("Timeout reading from socket")
+            return run
+
+    rl = TokenBucketLimiter(client=StalledRedis(), redis_retry_after=60)
+    assert rl.use_redis
+    assert all(rl.hit("user:a", "10/minute").allowed for _ in range(5))
+    # One timed-out call, then local buckets until the retry window ends
+    assert StalledRedis.calls == 1
+    rl._redis_down_until = 0.0
+    rl.hit("user:a", "10/minute")
+    assert StalledRedis.calls == 2
+
+def test_async_hit_runs_redis_call_off_the_event_loop():
+    import threading
+    import anyio
+    from app.middleware.rate_limit import TokenBucketLimiter
+
+    class ThreadRecordingRedis:
+        threads = []
+
+        def register_script(self, script):
+            def run(keys, args):
+                ThreadRecordingRedis.threads.append(threading.get_ident())
+                return [1, "3", "0"]
+            return run
+
+    async def check():
+        loop_thread = threading.get_ident()
+        result = await TokenBucketLimiter(client=ThreadRecordingRedis()).ahit("user:a", "4/minute")
+        assert result.allowed and result.remaining == 3
+        assert ThreadRecordingRedis.threads and ThreadRecordingRedis.threads[0] != loop_thread
+        # Local buckets need no thread hop
+        assert (await TokenBucketLimiter().ahit("user:a", "4/minute")).allowed
+
+    anyio.run(check)
@@ -56,3 +56,34 @@ def test_risk_rationale_no_forbidden_terms():
     
     for term in forbidden_terms:
         assert term not in rationale_lower, f"Found forbidden term: {term}"
+
+
+def test_array_forms_match_assess_risk():
+    import numpy as np
+    from app.core.risk import assess_risk_array, assess_risk_batch, risk_info_at
+
+    rng = np.random.default_rng(7)
+    samples = rng.beta(5, 3, size=2000)
+    bins = np.linspace(0.0, 1.0, 21)
+    hist, _ = np.histogram(samples, bins=bins)
+    lower, upper = np.percentile(samples, [2.5, 97.5])
+    probs = np.array([0.55, 0.2, 0.25])
+
+    expected = assess_risk(
+        dict(zip(["home", "draw", "away"], probs.tolist())),
+        {"bins": bins.tolist(), "frequencies": hist.tolist()},
+        {"95": {"lower": float(lower), "upper": float(upper)}},
+    )
+    assert assess_risk_array(probs, frequencies=hist, bins=bins, ci_95=(lower, upper)) == expected
+    assert assess_risk_array(probs, samples=samples) == expected
+
+    # A slate: the same event next to a near-certain one
+    batch = assess_risk_batch(
+        np.stack([probs, [0.9, 0.05, 0.05]]),
+        np.stack([hist, [0] * 19 + [100]]),
+        bins,
+        np.array([[lower, upper], [0.95, 1.0]]),
+    )
+    assert batch["score"].shape == (2,)
+    assert risk_info_at(batch, 0) == expected
+    assert list(batch["band"]) == [expected.band, "LOW"]
@@ -0,0 +1,177 @@
+"""
+Tests for /api/v2/simulate running through the sim kernel.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import routes_v2
+from app.api.schemas import EventInput, SimulationConfig
+from app.core.tokens import get_ledger
+
+
+@pytest.fixture
+def engine_calls(monkeypatch):
+    """Count simulate_event_v2 calls made by the route module."""
+    calls = []
+    original = routes_v2.simulate_event_v2
+
+    def counting(event, config, **kwargs):
+        calls.append(config.n_simulations)
+        return original(event, config, **kwargs)
+
+    monkeypatch.setattr(routes_v2, "simulate_event_v2", counting)
+    monkeypatch.setattr(routes_v2, "SIM_KERNEL_SHADOW_RATE", 0.0)
+    return calls
+
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "home_rating": 1650,
+    "away_rating": 1600,
+    "home_advantage": 50,
+    "config": {"n_simulations": 1000, "seed": 7},
+}
+
+
+def test_headline_pick_simulates_once(engine_calls):
+    r = client.post("/api/v2/simulate", json=PAYLOAD)
+    assert r.status_code == 200
+    assert r.json()["pick"]["predicted_outcome"] in {"home", "away", "draw"}
+    assert engine_calls == [1000]
+
+
+def test_full_distribution_simulates_once(engine_calls):
+    get_ledger().set_balance("sim_v2_user", 10)
+    r = client.post(
+        "/api/v2/simulate",
+        json={**PAYLOAD, "depth": "full_distribution"},
+        headers={"X-User-ID": "sim_v2_user"},
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["distribution"]["n_sims"] == 1000
+    assert body["distribution"]["seed"] == 7
+    assert engine_calls == [1000]
+
+
+def test_kernel_result_matches_direct_engine():
+    event = EventInput(**{k: PAYLOAD[k] for k in ("home_team", "away_team", "home_rating", "away_rating", "home_advantage")})
+    config = SimulationConfig(n_simulations=500, seed=11)
+    via_kernel = routes_v2.run_simulation(event, config)
+    direct = routes_v2.simulate_event_v2(event, config)
+    assert via_kernel.mean == direct.mean
+    assert via_kernel.percentiles == direct.percentiles
+
+
+def test_requested_n_simulations_are_never_cut(engine_calls):
+    from app.sim_kernel.actions.mc_run import _MS_PER_RUN
+
+    # A per-run estimate this slow would size a 10000-run request to the deadline
+    _MS_PER_RUN[routes_v2._mc_engine_service] = 1.0
+    try:
+        event = EventInput(home_team="Lakers", away_team="Celtics", home_rating=1500, away_rating=1500)
+        dist = routes_v2.run_simulation(event, SimulationConfig(n_simulations=10000, seed=5))
+    finally:
+        _MS_PER_RUN.pop(routes_v2._mc_engine_service, None)
+    assert dist.n_sims == 10000
+    assert engine_calls == [10000]
+
+
+def test_unseeded_request_stays_unseeded(engine_calls):
+    event = EventInput(home_team="Lakers", away_team="Celtics", home_rating=1500, away_rating=1500)
+    dist = routes_v2.run_simulation(event, SimulationConfig(n_simulations=200))
+    assert dist.seed is None
+    assert engine_calls == [200]
+
+
+def test_falls_back_to_engine_when_kernel_step_fails(engine_calls, monkeypatch):
+    def broken(**kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(routes_v2, "_mc_engine_service", broken)
+    event = EventInput(home_team="Lakers", away_team="Celtics", home_rating=1500, away_rating=1500)
+    dist = routes_v2.run_simulation(event, SimulationConfig(n_simulations=200, seed=3))
+    assert dist.n_sims == 200
+    assert engine_calls == [200]
+
+
+def test_engine_service_stops_at_the_deadline():
+    import time
+
+    event = EventInput(home_team="Lakers", away_team="Celtics", home_rating=1500, away_rating=1500)
+    config = SimulationConfig(n_simulations=10000, seed=5)
+
+    # A deadline that has already passed leaves room for one chunk only
+    result = routes_v2._mc_engine_service(
+        request={**event.model_dump(), "config": config.model_dump()},
+        features=None, rating=None, seed=5, depth="standard", max_runs=10000,
+        deadline=time.perf_counter(),
+    )
+    assert result["n_simulations"] == result["distribution"].n_sims == 100
+
+    # With room to spare, the chunked draw matches the unchunked engine exactly
+    relaxed = routes_v2._mc_engine_service(
+        request={**event.model_dump(), "config": config.model_dump()},
+        features=None, rating=None, seed=5, depth="standard", max_runs=10000,
+        deadline=time.perf_counter() + 60.0,
+    )
+    assert relaxed["distribution"].mean == routes_v2.simulate_event_v2(event, config).mean
+
+
+
+def test_engine_batch_service_simulates_a_slate_in_one_call():
+    from app.core.engine import simulate_outcomes_batch
+    from app.sim_kernel.config import Budget, SimulationConfig as KernelSimulationConfig
+    from app.sim_kernel.kernel import TricksterKernel
+    from app.sim_kernel.state import SimulationState
+    from app.sim_kernel.actions import build_pipeline
+
+    slate = [
+        EventInput(home_team=f"Home {i}", away_team=f"Away {i}", home_rating=1500 + 50 * i, away_rating=1550)
+        for i in range(3)
+    ]
+    kernel = TricksterKernel(services={"mc_engine_batch": routes_v2._mc_engine_batch_service})
+    results = kernel.run_batch(
+        build_pipeline(routes_v2._SIM_ACTIONS),
+        [SimulationState(request=e.model_dump()) for e in slate],
+        KernelSimulationConfig(seed=9, budget=Budget(max_mc_runs=400)),
+    )
+
+    expected = simulate_outcomes_batch(slate, n_simulations=400, seed=9)
+    assert len(results) == 3
+    for i, (state, journal) in enumerate(results):
+        assert state.mc_result["n_simulations"] == 400
+        assert state.mc_result["prob_home"] == expected["prob_home"][i]
+        assert state.mc_result["p50"] == expected["p50"][i]
+        assert [s.status for s in journal.steps] == ["OK", "OK"]
+
+
+def test_engine_stream_service_runs_in_chunks_under_round_robin():
+    from app.core.engine import simulate_outcomes_batch
+    from app.sim_kernel.config import Budget, SimulationConfig as KernelSimulationConfig
+    from app.sim_kernel.kernel import TricksterKernel
+    from app.sim_kernel.state import SimulationState
+    from app.sim_kernel.actions import build_pipeline
+
+    event = EventInput(home_team="Lakers", away_team="Celtics", home_rating=1650, away_rating=1600)
+    request = {**event.model_dump(), "config": {"n_simulations": 1000, "seed": 4}}
+
+    partials = list(routes_v2._mc_engine_stream_service(
+        request=request, features=None, rating=None, seed=1, depth="standard", max_runs=1000, chunk_runs=250,
+    ))
+    assert [p["n_simulations"] for p in partials] == [250, 500, 750, 1000]
+    assert partials[-1]["prob_home"] == simulate_outcomes_batch([event], n_simulations=1000, seed=4)["prob_home"][0]
+
+    kernel = TricksterKernel(services={"mc_engine_stream": routes_v2._mc_engine_stream_service})
+    results, metrics = kernel.run_round_robin(
+        build_pipeline(routes_v2._SIM_ACTIONS),
+        [SimulationState(request=request), SimulationState(request={**request, "config": {"n_simulations": 200, "seed": 4}})],
+        KernelSimulationConfig(scheduler="ROUND_ROBIN", chunk_runs=100, budget=Budget(max_mc_runs=1000)),
+    )
+    assert [state.mc_result["n_simulations"] for state, _ in results] == [1000, 200]
+    assert results[0][0].mc_result == partials[-1]
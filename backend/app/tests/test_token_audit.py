@@ -0,0 +1,222 @@
+"""
+Tests for the global token audit stream and its SQL export.
+"""
+
+import pytest
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, JSON
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.core.token_types import FeatureTier
+from app.core.redis_ledger import RedisTokenLedger
+from app.core.audit_export import AuditStreamExporter, EVENT_TYPE
+
+fakeredis = pytest.importorskip("fakeredis")
+
+Base = declarative_base()
+
+
+class LedgerEntry(Base):
+    __tablename__ = "ledger"
+    id = Column(Integer, primary_key=True)
+    timestamp = Column(DateTime)
+    event_type = Column(String, nullable=False)
+    data = Column(JSON, nullable=False)
+
+
+@pytest.fixture
+def redis_ledger():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    ledger = RedisTokenLedger(client=client)
+    assert ledger.use_redis
+    return ledger
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _consume_many(ledger, users, per_user):
+    for user in users:
+        ledger.set_balance(user, 2 * per_user)
+        for _ in range(per_user):
+            ledger.consume_tokens(user, FeatureTier.FULL_DISTRIBUTION)
+
+
+@pytest.fixture
+def audit_enabled(monkeypatch):
+    from app.api import routes_v2
+
+    monkeypatch.setattr(routes_v2, "TOKEN_AUDIT_ENABLED", True)
+
+
+def test_all_transactions_come_from_audit_stream(redis_ledger):
+    _consume_many(redis_ledger, ["u1", "u2", "u3"], 4)
+    all_txs = list(redis_ledger.iter_transactions(page_size=5))
+    assert len(all_txs) == 12
+    assert {tx.user_id for tx in all_txs} == {"u1", "u2", "u3"}
+
+    with pytest.warns(DeprecationWarning):
+        assert redis_ledger.get_all_transactions() == all_txs
+
+
+def test_both_ledgers_audit_topups_and_denials(redis_ledger):
+    from app.core.tokens import TokenLedger
+    from app.core.token_types import AccessDeniedError
+
+    trails = []
+    for ledger in (TokenLedger(), redis_ledger):
+        ledger.add_tokens("u1", 3)
+        ledger.consume_tokens("u1", FeatureTier.FULL_DISTRIBUTION)
+        with pytest.raises(AccessDeniedError):
+            ledger.consume_tokens("u1", FeatureTier.FULL_DISTRIBUTION)
+        trails.append([
+            (tx.status, tx.feature, tx.cost, tx.balance_before, tx.balance_after)
+            for tx in ledger.iter_transactions()
+        ])
+
+    assert trails[0] == trails[1] == [
+        ("topup", None, -3, 0, 3),
+        ("success", FeatureTier.FULL_DISTRIBUTION, 2, 3, 1),
+        ("denied", FeatureTier.FULL_DISTRIBUTION, 2, 1, 1),
+    ]
+    assert redis_ledger.get_balance("u1") == 1
+
+
+def test_audit_page_size_is_capped_the_same_for_both_ledgers(redis_ledger):
+    from app.core.tokens import TokenLedger
+    from app.core.token_types import AUDIT_PAGE_MAX
+
+    memory_ledger = TokenLedger()
+    for ledger in (memory_ledger, redis_ledger):
+        ledger.set_balance("u1", 2 * (AUDIT_PAGE_MAX + 5))
+        for _ in range(AUDIT_PAGE_MAX + 5):
+            ledger.consume_tokens("u1", FeatureTier.FULL_DISTRIBUTION)
+
+    sizes = [len(ledger.get_audit_page(limit=5000)[0]) for ledger in (memory_ledger, redis_ledger)]
+    assert sizes == [AUDIT_PAGE_MAX, AUDIT_PAGE_MAX]
+    assert len(list(memory_ledger.iter_transactions())) == AUDIT_PAGE_MAX + 5
+
+
+def test_audit_page_cursor_walks_stream_without_gaps(redis_ledger):
+    _consume_many(redis_ledger, ["u1", "u2"], 5)
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = redis_ledger.get_audit_page(cursor=cursor, limit=3)
+        seen.extend(entry_id for entry_id, _ in page)
+        assert len(page) <= 3
+        if cursor is None:
+            break
+    assert len(seen) == 10
+    assert len(set(seen)) == 10
+
+
+def test_audit_stream_is_trimmed_to_maxlen():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    ledger = RedisTokenLedger(client=client, audit_maxlen=5)
+    _consume_many(ledger, ["u1"], 20)
+    # MAXLEN ~ may keep a little more than requested, never the full history
+    assert client.xlen("tokens:audit") < 20
+
+
+def test_audit_admin_endpoint_is_off_by_default():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    r = TestClient(app).get("/api/v2/admin/tokens/audit")
+    assert r.status_code == 403
+
+
+def test_audit_admin_endpoint_pages_in_memory_ledger(audit_enabled):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.core.tokens import get_ledger
+
+    ledger = get_ledger()
+    ledger.set_balance("audit_api_user", 10)
+    ledger.consume_tokens("audit_api_user", FeatureTier.FULL_DISTRIBUTION)
+
+    client = TestClient(app)
+    r = client.get("/api/v2/admin/tokens/audit", params={"limit": 1000})
+    assert r.status_code == 200
+    body = r.json()
+    assert any(e["transaction"]["user_id"] == "audit_api_user" for e in body["entries"])
+
+
+def test_exporter_bulk_writes_and_acks(redis_ledger, session):
+    _consume_many(redis_ledger, ["u1", "u2"], 6)
+    exporter = AuditStreamExporter(redis_ledger, session, model=LedgerEntry, batch_size=5)
+
+    assert exporter.drain() == 12
+    rows = session.query(LedgerEntry).all()
+    assert len(rows) == 12
+    assert all(r.event_type == EVENT_TYPE for r in rows)
+    assert len({r.data["stream_id"] for r in rows}) == 12
+
+    # Caught up: nothing is exported twice
+    assert exporter.drain() == 0
+    _consume_many(redis_ledger, ["u3"], 2)
+    assert exporter.drain() == 2
+    assert session.query(LedgerEntry).count() == 14
+
+
+def test_exporter_redelivers_after_failed_commit(redis_ledger, session):
+    _consume_many(redis_ledger, ["u1"], 3)
+    exporter = AuditStreamExporter(redis_ledger, session, model=LedgerEntry)
+
+    original_commit = session.commit
+
+    def failing_commit():
+        raise RuntimeError("db down")
+
+    session.commit = failing_commit
+    with pytest.raises(RuntimeError):
+        exporter.run_once()
+    session.commit = original_commit
+
+    # A fresh exporter with the same consumer name picks up the pending batch
+    retry = AuditStreamExporter(redis_ledger, session, model=LedgerEntry)
+    assert retry.drain() == 3
+    assert session.query(LedgerEntry).count() == 3
+
+
+def test_in_memory_exporter_retries_batch_after_failed_commit(session):
+    from app.core.tokens import TokenLedger
+
+    ledger = TokenLedger()
+    _consume_many(ledger, ["u1"], 5)
+    exporter = AuditStreamExporter(ledger, session, model=LedgerEntry, batch_size=3)
+
+    original_commit = session.commit
+
+    def failing_commit():
+        raise RuntimeError("db down")
+
+    session.commit = failing_commit
+    with pytest.raises(RuntimeError):
+        exporter.run_once()
+    session.commit = original_commit
+
+    # The cursor did not move past the failed batch
+    assert exporter.drain() == 5
+    assert session.query(LedgerEntry).count() == 5
+
+
+def test_audit_page_rejects_invalid_cursor(redis_ledger):
+    from app.core.tokens import TokenLedger
+
+    for ledger in (TokenLedger(), redis_ledger):
+        with pytest.raises(ValueError):
+            ledger.get_audit_page(cursor="not-a-cursor")
+
+
+def test_audit_admin_endpoint_invalid_cursor_is_400(audit_enabled):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    r = client.get("/api/v2/admin/tokens/audit", params={"cursor": "abc"})
+    assert r.status_code == 400
@@ -463,5 +463,51 @@ def test_add_tokens_top_up(ledger):
     print("TEST 10 PASSED: Top-up works")
 
 
+def _assert_no_overdraft_or_double_charge(ledger):
+    from concurrent.futures import ThreadPoolExecutor
+
+    ledger.set_balance("race_user", 9)  # Room for 4 full-distribution charges
+
+    def consume(_):
+        try:
+            return ledger.consume_tokens("race_user", FeatureTier.FULL_DISTRIBUTION)
+        except AccessDeniedError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        charged = [tx for tx in pool.map(consume, range(40)) if tx is not None]
+    assert len(charged) == 4
+    assert ledger.get_balance("race_user") == 1
+
+    ledger.set_balance("idem_race_user", 10)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        txs = list(pool.map(
+            lambda _: ledger.consume_tokens("idem_race_user", FeatureTier.FULL_DISTRIBUTION, idempotency_key="race-key"),
+            range(20)
+        ))
+    assert len({tx.transaction_id for tx in txs}) == 1
+    assert ledger.get_balance("idem_race_user") == 8
+
+
+# TEST 11: Redis ledger under contention
+def test_redis_ledger_contention_no_overdraft_or_double_charge():
+    """
+    Concurrent consumes never overdraw, and a shared idempotency key charges once.
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from app.core.redis_ledger import RedisTokenLedger
+
+    _assert_no_overdraft_or_double_charge(RedisTokenLedger(client=fakeredis.FakeRedis(decode_responses=True)))
+
+
+# TEST 12: In-memory ledger under contention
+def test_in_memory_ledger_contention_no_overdraft_or_double_charge():
+    """
+    Same guarantees for the in-memory TokenLedger (threaded workers share one instance).
+    """
+    _assert_no_overdraft_or_double_charge(TokenLedger())
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -18,7 +18,9 @@ from app.core.uncertainty import (
     compute_volatility_score,
     compute_data_quality_index,
     compute_confidence_decay,
-    compute_all_uncertainty_metrics
+    compute_all_uncertainty_metrics,
+    compute_uncertainty_batch,
+    UncertaintyBatch
 )
 
 
@@ -377,5 +379,45 @@ def test_synthetic_scenarios():
     print(f"  Scenario B (poor): vol={metrics_b.volatility_score:.1f}, qual={metrics_b.data_quality_index:.1f}")
 
 
+# TEST 8: Batched Metrics
+# scipy warns on the constant row's kurtosis in the scalar reference; the result is still used
+@pytest.mark.filterwarnings("ignore:Precision loss:RuntimeWarning")
+def test_uncertainty_batch_matches_single_event():
+    """
+    M2 Test 8: compute_uncertainty_batch() over (n_events, n_sims) must agree
+    with the scalar compute_volatility_score(), compute_data_quality_index()
+    and compute_confidence_decay() event by event.
+    """
+    rng = np.random.default_rng(321)
+    slate = np.stack([
+        rng.normal(0.5, 0.05, 1000),
+        rng.normal(0.5, 0.25, 1000),
+        rng.standard_t(3, 1000) * 0.1 + 0.5,
+        np.full(1000, 0.4),  # zero variance
+        rng.normal(0.0, 0.01, 1000),  # mean near zero
+    ])
+    features = {"f1": True, "f2": False}
+    ages = [1.0, 45.0, 5.0, 0.0, 20.0]
+
+    batch = compute_uncertainty_batch(slate, features, data_age_days=ages, sample_size=500, event_horizon_days=10.0)
+
+    assert isinstance(batch, UncertaintyBatch)
+    assert len(batch) == 5
+    assert batch.volatility_score.shape == batch.kurtosis.shape == (5,)
+    assert batch.volatility_score[3] == pytest.approx(0.0, abs=1e-9)
+
+    for i in range(5):
+        volatility = compute_volatility_score(slate[i])
+        data_quality = compute_data_quality_index(features, data_age_days=ages[i], sample_size=500)
+        decay = compute_confidence_decay(volatility, ages[i], event_horizon_days=10.0)
+
+        materialized = batch.metrics(i)
+        assert materialized.volatility_score == pytest.approx(volatility, abs=1e-9)
+        assert materialized.data_quality_index == pytest.approx(data_quality, abs=1e-9)
+        assert materialized.confidence_decay == pytest.approx(decay, abs=1e-9)
+
+    print("TEST 8 PASSED: Batched metrics match single-event metrics")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.actions import (
+    SimulationAction,
+    available_actions,
+    build_pipeline,
+    get_action,
+    register_action,
+)
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_builtins_resolve_by_name():
+    assert get_action("monte_carlo") is MonteCarloAction
+    assert [a.name for a in build_pipeline(["ingest", "monte_carlo", "emit"])] == ["ingest", "monte_carlo", "emit"]
+    assert {"ingest", "matchup_graph", "monte_carlo", "emit"} <= set(available_actions())
+
+
+def test_all_lists_every_builtin_class():
+    from app.sim_kernel import actions
+
+    builtin_classes = {target.rpartition(":")[2] for target in actions._BUILTIN.values()}
+    assert all(isinstance(name, str) for name in actions.__all__)
+    assert builtin_classes <= set(actions.__all__)
+    assert all(getattr(actions, name).__name__ == name for name in builtin_classes)
+
+
+def test_unknown_action_raises():
+    with pytest.raises(KeyError, match="nope"):
+        get_action("nope")
+
+
+def test_only_used_actions_are_imported():
+    code = (
+        "import sys\n"
+        "from app.sim_kernel.kernel import TricksterKernel\n"
+        "from app.sim_kernel.actions import build_pipeline\n"
+        "build_pipeline(['ingest', 'monte_carlo', 'emit'])\n"
+        "loaded = {m.rsplit('.', 1)[-1] for m in sys.modules if m.startswith('app.sim_kernel.actions.')}\n"
+        "print(sorted(loaded), 'numpy' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["['base',", "'emit',", "'ingest',", "'mc_run']", "False"]
+
+
+def test_registered_plugin_runs_in_pipeline():
+    @register_action("tag")
+    class TagAction(SimulationAction):
+        name = "tag"
+
+        def run(self, ctx, state, config):
+            state.artifacts["tag"] = ctx.services["tagger"]()
+            return state
+
+    assert get_action("tag") is TagAction
+    kernel = TricksterKernel(services={"tagger": lambda: "hello"})
+    st, journal = kernel.run(build_pipeline(["ingest", "tag"]), SimulationState(request={}), SimulationConfig())
+    assert st.artifacts["tag"] == "hello"
+    assert [s.name for s in journal.steps] == ["ingest", "tag"]
+
+
+def test_lazy_string_registration():
+    register_action("monte_carlo_alias", "app.sim_kernel.actions.mc_run:MonteCarloAction")
+    assert get_action("monte_carlo_alias") is MonteCarloAction
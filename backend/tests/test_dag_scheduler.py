@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.scheduler import DAGScheduler
+from app.sim_kernel.actions.base import SimulationAction
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.feature_extract import FeatureExtractAction
+from app.sim_kernel.actions.rating_baseline import RatingBaselineAction
+from app.sim_kernel.actions.matchup_graph import MatchupGraphAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.explain import ExplainAction
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def _pipeline():
+    return [
+        IngestAction(),
+        FeatureExtractAction(),
+        RatingBaselineAction(),
+        MatchupGraphAction(),
+        MonteCarloAction(),
+        ExplainAction(),
+        EmitAction(),
+    ]
+
+
+def _services(barrier=None):
+    def wait():
+        if barrier is not None:
+            barrier.wait()
+
+    def feature_extractor(request, seed, depth):
+        wait()
+        return {"form": 0.6}
+
+    def rating_provider(request):
+        wait()
+        return {"a": 1500, "b": 1450}
+
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        return {"p": 0.55, "features": features, "rating": rating}
+
+    return {
+        "feature_extractor": feature_extractor,
+        "rating_provider": rating_provider,
+        "mc_engine": mc_engine,
+        "response_mapper": lambda state: {"documents": []},
+    }
+
+
+def test_dag_levels_follow_declared_dependencies():
+    waves = DAGScheduler().levels(_pipeline(), SimulationConfig(scheduler="DAG"))
+    assert [[a.name for a in wave] for wave in waves] == [
+        ["ingest", "feature_extract", "rating_baseline"],
+        ["matchup_graph", "monte_carlo"],
+        ["explain"],
+        ["emit"],
+    ]
+
+
+def test_independent_steps_run_concurrently():
+    # Both providers block until the other arrives: only passes if they overlap.
+    barrier = threading.Barrier(2, timeout=5)
+    kernel = TricksterKernel(services=_services(barrier))
+    st, journal = kernel.run(_pipeline(), SimulationState(request={"a": "A"}), SimulationConfig(scheduler="DAG"))
+
+    assert [s.status for s in journal.steps] == ["OK"] * 7
+    assert st.mc_result == {"p": 0.55, "features": {"form": 0.6}, "rating": {"a": 1500, "b": 1450}}
+
+
+def test_dag_run_matches_fifo_run():
+    fifo_state, fifo_journal = TricksterKernel(services=_services()).run(
+        _pipeline(), SimulationState(request={"a": "A"}), SimulationConfig(scheduler="FIFO")
+    )
+    dag_state, dag_journal = TricksterKernel(services=_services()).run(
+        _pipeline(), SimulationState(request={"a": "A"}), SimulationConfig(scheduler="DAG")
+    )
+
+    assert [s.name for s in dag_journal.steps] == [s.name for s in fifo_journal.steps]
+    # emit's output embeds the run_id, so compare every step before it
+    assert [s.outputs_hash for s in dag_journal.steps[:-1]] == [s.outputs_hash for s in fifo_journal.steps[:-1]]
+    assert dag_state.warnings == fifo_state.warnings
+    assert dag_state.artifacts.keys() == fifo_state.artifacts.keys()
+
+
+def test_warnings_merge_in_list_order():
+    kernel = TricksterKernel(services={})  # nothing wired: every step warns
+    st, _ = kernel.run(
+        [FeatureExtractAction(), RatingBaselineAction()],
+        SimulationState(request={}),
+        SimulationConfig(scheduler="DAG"),
+    )
+    assert st.warnings == ["feature_extractor_not_wired", "rating_provider_not_wired"]
+
+
+def test_undeclared_action_is_a_barrier():
+    class Legacy(SimulationAction):
+        name = "legacy"
+
+        def run(self, ctx, state, config):
+            return state
+
+    waves = DAGScheduler().levels([IngestAction(), Legacy(), RatingBaselineAction()], SimulationConfig())
+    assert [[a.name for a in wave] for wave in waves] == [["ingest"], ["legacy"], ["rating_baseline"]]
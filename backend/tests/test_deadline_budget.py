@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+from app.sim_kernel.config import Budget, SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction, _MS_PER_RUN
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def _state():
+    return SimulationState(request={"fighter_a": "A", "fighter_b": "B"})
+
+
+def test_remaining_budget_is_recorded_per_step():
+    kernel = TricksterKernel(services={"mc_engine": lambda **kw: {"p": 0.5}})
+    _, journal = kernel.run([IngestAction(), MonteCarloAction(), EmitAction()], _state(), SimulationConfig())
+
+    remaining = [s.budget_remaining_ms for s in journal.steps]
+    assert all(r is not None and 0 < r <= 2000 for r in remaining)
+    assert remaining == sorted(remaining, reverse=True)
+
+
+def test_deadline_only_reaches_degradable_actions():
+    seen = {}
+
+    class Probe(IngestAction):
+        def run(self, ctx, state, config):
+            seen[self.name] = ctx.deadline
+            return super().run(ctx, state, config)
+
+    class DegradableProbe(Probe):
+        name = "degradable_probe"
+        degradable = True
+
+    TricksterKernel().run([Probe(), DegradableProbe(), EmitAction()], _state(), SimulationConfig())
+    assert seen["ingest"] is None
+    # One step (emit) still follows, so its reserve is held back from the run deadline
+    assert seen["degradable_probe"] is not None
+
+
+def test_mc_runs_are_cut_to_fit_the_deadline():
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        time.sleep(max_runs * 0.0005)  # 0.5 ms per run
+        return {"p": 0.5, "n_runs": max_runs}
+
+    kernel = TricksterKernel(services={"mc_engine": mc_engine})
+    # Warm-up run teaches the action the service's cost per run
+    kernel.run([MonteCarloAction()], _state(), SimulationConfig(budget=Budget(max_mc_runs=200)))
+
+    cfg = SimulationConfig(budget=Budget(max_ms_total=300, max_mc_runs=1000))
+    st, journal = kernel.run([MonteCarloAction()], _state(), cfg)
+
+    achieved = st.mc_result["achieved_runs"]
+    assert 100 <= achieved < 1000
+    assert st.mc_result["degraded"] is True
+    assert st.degraded is True
+    assert f"deadline_mc_runs:{achieved}/1000" in st.degrade_reason
+    assert journal.steps[0].status == "DEGRADED"
+
+
+def test_deadline_sizing_can_be_disabled():
+    captured = {}
+
+    def mc_engine(request, features, rating, seed, depth, max_runs, deadline=None):
+        captured.update(max_runs=max_runs, deadline=deadline)
+        return {"p": 0.5, "n_runs": max_runs}
+
+    kernel = TricksterKernel(services={"mc_engine": mc_engine})
+    kernel.run([MonteCarloAction()], _state(), SimulationConfig())
+    _MS_PER_RUN[mc_engine] = 1.0  # far too slow for the deadline
+
+    cfg = SimulationConfig(budget=Budget(max_mc_runs=10000, size_mc_to_deadline=False))
+    st, _ = kernel.run([MonteCarloAction()], _state(), cfg)
+    assert captured == {"max_runs": 10000, "deadline": None}
+    assert not st.degraded
+
+
+def test_deadline_aware_service_reports_achieved_runs():
+    captured = {}
+
+    def mc_engine(request, features, rating, seed, depth, max_runs, deadline):
+        captured["deadline"] = deadline
+        return {"p": 0.5, "n_runs": max_runs // 4}  # stopped early
+
+    st, journal = TricksterKernel(services={"mc_engine": mc_engine}).run(
+        [MonteCarloAction()], _state(), SimulationConfig()
+    )
+    assert captured["deadline"] > time.perf_counter()
+    assert st.mc_result["achieved_runs"] == 125
+    assert st.degrade_reason == "deadline_mc_runs:125/500"
+    assert journal.degraded is True
+
+
+def test_full_runs_are_not_degraded():
+    st, journal = TricksterKernel(services={"mc_engine": lambda **kw: {"p": 0.5}}).run(
+        [MonteCarloAction()], _state(), SimulationConfig()
+    )
+    assert st.degraded is False
+    assert journal.steps[0].status == "OK"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.journal import stable_hash
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def _run(mode: str, big_artifact=None):
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        return {"p": 0.5}
+
+    def response_mapper(state):
+        return {"documents": [], "meta": {}}
+
+    kernel = TricksterKernel(services={"mc_engine": mc_engine, "response_mapper": response_mapper})
+    cfg = SimulationConfig(seed=7, journal_hashing=mode)
+    st = SimulationState(request={"fighter_a": "A", "fighter_b": "B"})
+    if big_artifact is not None:
+        st.artifacts["pre_kernel_response"] = big_artifact
+    return kernel.run([IngestAction(), MonteCarloAction(), EmitAction()], st, cfg)
+
+
+def test_hashes_are_lazy_until_inspected():
+    _, journal = _run("shallow")
+    assert all(step.hashes_pending for step in journal.steps)
+
+    mc_step = journal.steps[1]
+    assert len(mc_step.inputs_hash) == 64
+    assert mc_step.outputs_hash == stable_hash({
+        "artifacts.mc": {"p": 0.5},
+        "degrade_reason": None,
+        "degraded": False,
+        "mc_result": {"p": 0.5},
+        "warnings": [],
+    })
+    assert not mc_step.hashes_pending
+
+
+def test_shallow_hash_ignores_undeclared_fields():
+    _, small = _run("shallow")
+    _, big = _run("shallow", big_artifact={"blob": list(range(1000))})
+    # MC does not read artifacts, so its input hash is unchanged
+    assert small.steps[1].inputs_hash == big.steps[1].inputs_hash
+    # Emit reads artifacts, so it sees the difference
+    assert small.steps[2].inputs_hash != big.steps[2].inputs_hash
+
+
+def test_full_hash_covers_whole_state():
+    _, small = _run("full")
+    _, big = _run("full", big_artifact={"blob": [1, 2, 3]})
+    assert small.steps[1].inputs_hash != big.steps[1].inputs_hash
+
+
+def test_hashing_off_and_to_dict():
+    _, journal = _run("off")
+    assert all(step.inputs_hash == "" and step.outputs_hash == "" for step in journal.steps)
+
+    _, journal = _run("shallow")
+    data = journal.to_dict()
+    assert all(len(step["inputs_hash"]) == 64 for step in data["steps"])
+    assert "_lazy_hashes" not in data["steps"][0]
+
+
+class _EagerKernel(TricksterKernel):
+    """Records each digest as it would read at step time, next to the lazy one."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.eager = []
+
+    def _input_digest(self, *args):
+        digest = super()._input_digest(*args)
+        self.eager.append(digest.hexdigest() if digest else digest)
+        return digest
+
+    def _output_digest(self, *args):
+        digest = super()._output_digest(*args)
+        self.eager.append(digest.hexdigest() if digest else digest)
+        return digest
+
+
+def test_lazy_digests_match_step_time_hashes():
+    from app.sim_kernel.actions import build_pipeline
+
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        return {"p": 0.5}
+
+    for mode in ("shallow", "full"):
+        kernel = _EagerKernel(services={"mc_engine": mc_engine})
+        _, journal = kernel.run(
+            build_pipeline(["ingest", "monte_carlo", "emit"]),
+            SimulationState(request={"a": "A"}),
+            SimulationConfig(journal_hashing=mode),
+        )
+        # Emit mutates artifacts["meta"] (written by ingest) after earlier steps were hashed
+        inputs, outputs = kernel.eager[0::2], kernel.eager[1::2]
+        assert [s.inputs_hash for s in journal.steps] == inputs, mode
+        assert [s.outputs_hash for s in journal.steps] == outputs, mode
+
+
+def test_full_hashing_is_the_default():
+    assert SimulationConfig().journal_hashing == "full"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.store import JournalStore
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def _kernel(store, fail=False):
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        if fail:
+            raise RuntimeError("engine down")
+        return {"p": 0.5}
+
+    return TricksterKernel(services={"mc_engine": mc_engine}, sink=store)
+
+
+def _run(kernel, cfg):
+    return kernel.run([IngestAction(), MonteCarloAction(), EmitAction()], SimulationState(request={"a": "A"}), cfg)
+
+
+def test_emit_meta_carries_run_id():
+    st, journal = _run(_kernel(None), SimulationConfig())
+    assert st.artifacts["response"]["meta"]["run_id"] == journal.run_id
+
+
+def test_journals_are_persisted_off_the_request_path(tmp_path):
+    store = JournalStore(str(tmp_path / "journal.db"), batch_size=4)
+    kernel = _kernel(store)
+    journals = [_run(kernel, SimulationConfig())[1] for _ in range(10)]
+    store.flush()
+
+    latencies = store.step_latency_percentiles(config_hash=journals[0].config_hash)
+    assert set(latencies) == {"ingest", "monte_carlo", "emit"}
+    assert latencies["monte_carlo"]["count"] == 10
+    assert latencies["monte_carlo"]["p50"] <= latencies["monte_carlo"]["p99"]
+    store.close()
+
+    # Reopening the file sees the same history
+    reopened = JournalStore(str(tmp_path / "journal.db"))
+    assert reopened.step_latency_percentiles()["emit"]["count"] == 10
+    reopened.close()
+
+
+def test_degraded_rate_and_failures_by_config_hash():
+    store = JournalStore()
+    healthy = SimulationConfig(seed=1)
+    tight = SimulationConfig(seed=2, budget={"max_ms_total": 200})
+    for _ in range(3):
+        _run(_kernel(store), healthy)
+    for _ in range(2):
+        _run(_kernel(store, fail=True), tight)
+    store.flush()
+
+    h_hash = _run(_kernel(None), healthy)[1].config_hash
+    t_hash = _run(_kernel(None), tight)[1].config_hash
+    assert store.degraded_rate(h_hash) == 0.0
+    assert store.degraded_rate(t_hash) == 1.0
+    assert store.degraded_rate() == 2 / 5
+    assert store.failure_counts(t_hash) == {"monte_carlo": 2}
+    assert store.failure_counts(h_hash) == {}
+
+    summary = {row["config_hash"]: row for row in store.summary_by_config()}
+    assert summary[h_hash]["runs"] == 3
+    assert summary[t_hash]["failed_steps"] == 2
+    store.close()
+
+
+def test_full_queue_drops_instead_of_blocking():
+    store = JournalStore(max_queue=1)
+    store._writer = object()  # pretend a writer exists but never drains
+    kernel = _kernel(store)
+    for _ in range(3):
+        _run(kernel, SimulationConfig())
+    assert store.dropped == 2
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.matchup_graph import MatchupGraphAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.emit import EmitAction
+from app.sim_kernel.actions.base import ActionContext, SimulationAction, has_batch
+
+
+def _states(n):
+    return [SimulationState(request={"home": f"T{i}", "away": f"T{i + 1}"}) for i in range(n)]
+
+
+def test_mc_engine_batch_is_called_once_per_slate():
+    calls = []
+
+    def mc_engine_batch(requests, features, ratings, seed, depth, max_runs):
+        calls.append(len(requests))
+        return [{"p": 0.5, "home": r["home"]} for r in requests]
+
+    kernel = TricksterKernel(services={"mc_engine_batch": mc_engine_batch})
+    results = kernel.run_batch([IngestAction(), MonteCarloAction(), EmitAction()], _states(5), SimulationConfig())
+
+    assert calls == [5]
+    assert [st.mc_result["home"] for st, _ in results] == ["T0", "T1", "T2", "T3", "T4"]
+    journals = [j for _, j in results]
+    assert len({j.run_id for j in journals}) == 5
+    assert all([s.name for s in j.steps] == ["ingest", "monte_carlo", "emit"] for j in journals)
+    assert all(j.steps[1].status == "OK" for j in journals)
+
+
+def test_slate_graph_is_built_once():
+    calls = []
+
+    def slate_graph_builder(requests, features, ratings, max_nodes, seed):
+        calls.append(len(requests))
+        return {
+            "nodes": ["A", "B", "C"],
+            "edges": [{"u": "A", "v": "B", "p": 0.6}, {"u": "B", "v": "C", "p": 0.6}, {"u": "C", "v": "A", "p": 0.6}],
+        }
+
+    kernel = TricksterKernel(services={"slate_graph_builder": slate_graph_builder})
+    results = kernel.run_batch([MatchupGraphAction()], _states(4), SimulationConfig())
+
+    assert calls == [4]
+    assert all(st.matchup_graph is results[0][0].matchup_graph for st, _ in results)
+    assert all("non_transitive_cycle_detected" in st.warnings for st, _ in results)
+
+
+def test_failed_batch_call_falls_back_per_state():
+    def mc_engine_batch(**kwargs):
+        raise RuntimeError("vector engine down")
+
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        if request["home"] == "T1":
+            raise ValueError("bad fixture")
+        return {"p": 0.5}
+
+    kernel = TricksterKernel(services={"mc_engine_batch": mc_engine_batch, "mc_engine": mc_engine})
+    results = kernel.run_batch([MonteCarloAction()], _states(3), SimulationConfig())
+
+    steps = [j.steps[0] for _, j in results]
+    assert [s.status for s in steps] == ["OK", "FAIL", "OK"]
+    assert all("batch_fallback:monte_carlo" in s.warnings for s in steps)
+    assert results[0][0].mc_result == {"p": 0.5}
+
+
+class _HalfDoneBatch(SimulationAction):
+    # Mutates the first states of the slate, then fails on a later one.
+    name = "half_done"
+
+    def run(self, ctx, state, config):
+        state.warnings.append("seen")
+        return state
+
+    def run_batch(self, ctx, states, config):
+        for i, state in enumerate(states):
+            if i == 2:
+                raise RuntimeError("slate builder failed")
+            self.run(ctx, state, config)
+        return states
+
+
+def test_fallback_starts_from_untouched_states(caplog):
+    with caplog.at_level("WARNING", logger="app.sim_kernel.kernel"):
+        results = TricksterKernel().run_batch([_HalfDoneBatch()], _states(4), SimulationConfig())
+
+    assert all(st.warnings == ["seen"] for st, _ in results)
+    steps = [j.steps[0] for _, j in results]
+    assert all(s.status == "OK" and s.error_type == "RuntimeError" for s in steps)
+    assert all(s.warnings == ["batch_fallback:half_done"] for s in steps)
+    assert "half_done.run_batch failed (RuntimeError: slate builder failed)" in caplog.text
+
+
+def test_batch_capability_follows_wired_services():
+    assert not has_batch(MonteCarloAction(), ActionContext(services={}))
+    assert has_batch(MonteCarloAction(), ActionContext(services={"mc_engine_batch": object()}))
+    assert not has_batch(MatchupGraphAction(), ActionContext(services={}))
+    assert has_batch(MatchupGraphAction(), ActionContext(services={"slate_graph_builder": object()}))
+    assert not has_batch(IngestAction(), ActionContext(services={}))
+
+    # Without a batch service there is no batched call to fall back from
+    def mc_engine(request, features, rating, seed, depth, max_runs):
+        raise ValueError("bad fixture")
+
+    results = TricksterKernel(services={"mc_engine": mc_engine}).run_batch([MonteCarloAction()], _states(2), SimulationConfig())
+    steps = [j.steps[0] for _, j in results]
+    assert [s.status for s in steps] == ["FAIL", "FAIL"]
+    assert all(s.warnings == ["step_failed:monte_carlo"] for s in steps)
+
+
+def test_batch_without_batch_services_matches_single_runs():
+    services = {"mc_engine": lambda request, **kw: {"p": len(request["home"]) / 10}}
+    actions = [IngestAction(), MonteCarloAction(), EmitAction()]
+    cfg = SimulationConfig(seed=3)
+
+    batch = TricksterKernel(services=services).run_batch(actions, _states(3), cfg)
+    single = [TricksterKernel(services=services).run(actions, st, cfg) for st in _states(3)]
+
+    for (b_state, b_journal), (s_state, s_journal) in zip(batch, single):
+        assert b_state.mc_result == s_state.mc_result
+        # emit's output embeds the run_id, so compare every step before it
+        assert [s.outputs_hash for s in b_journal.steps[:-1]] == [s.outputs_hash for s in s_journal.steps[:-1]]
+        assert b_state.artifacts["response"]["meta"]["run_id"] == b_journal.run_id
@@ -29,3 +29,73 @@ def test_cycle_warning_is_emitted():
     st2, _ = kernel.run(actions, st, cfg)
 
     assert "non_transitive_cycle_detected" in st2.warnings
+
+
+def _edges(pairs, p=0.6):
+    return [{"u": u, "v": v, "p": p} for u, v in pairs]
+
+
+def test_all_triangles_are_listed_once():
+    from app.sim_kernel.cycles import find_non_transitive_cycles
+
+    # A>B>C>A and B>C>D>B share the edge B>C
+    report = find_non_transitive_cycles(
+        ["A", "B", "C", "D"],
+        _edges([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "B")]),
+    )
+    assert sorted(report.triangles) == [("A", "B", "C"), ("B", "C", "D")]
+    assert report.components == [["A", "B", "C", "D"]]
+
+
+def test_transitive_graph_has_no_cycles():
+    from app.sim_kernel.cycles import find_non_transitive_cycles
+
+    report = find_non_transitive_cycles(["A", "B", "C"], _edges([("A", "B"), ("B", "C"), ("A", "C")]))
+    assert not report.has_cycle
+
+
+def test_longer_cycle_found_through_components():
+    from app.sim_kernel.cycles import find_non_transitive_cycles
+
+    report = find_non_transitive_cycles(
+        ["A", "B", "C", "D"], _edges([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+    )
+    assert report.triangles == []
+    assert report.components == [["A", "B", "C", "D"]]
+    assert report.has_cycle
+
+
+def test_triangles_match_brute_force_on_random_graph():
+    import itertools
+    import numpy as np
+    from app.sim_kernel.cycles import adjacency, triangles
+
+    rng = np.random.default_rng(5)
+    nodes = [f"T{i}" for i in range(25)]
+    edges = [{"u": u, "v": v, "p": float(rng.random())} for u, v in itertools.permutations(nodes, 2)]
+    names, A = adjacency(nodes, edges)
+
+    expected = {
+        (i, j, k)
+        for i, j, k in itertools.permutations(range(len(nodes)), 3)
+        if i < j and i < k and A[i, j] and A[j, k] and A[k, i]
+    }
+    found, truncated = triangles(A)
+    assert not truncated
+    assert set(found) == expected and len(found) == len(expected)
+
+
+def test_tournament_sized_graph():
+    # Timing lives in tools/bench_cycle_detection.py
+    import numpy as np
+    from app.sim_kernel.cycles import find_non_transitive_cycles
+
+    rng = np.random.default_rng(1)
+    nodes = [f"T{i}" for i in range(400)]
+    strength = rng.normal(size=len(nodes))
+    edges = [
+        {"u": nodes[i], "v": nodes[j], "p": float(1 / (1 + np.exp(strength[j] - strength[i] + rng.normal(0, 0.5))))}
+        for i in range(len(nodes)) for j in range(len(nodes)) if i != j
+    ]
+    report = find_non_transitive_cycles(nodes, edges, max_triangles=500)
+    assert report.has_cycle and len(report.triangles) == 500 and report.truncated
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.scheduler import RoundRobinScheduler, get_scheduler, jain_index
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def mc_engine_stream(request, features, rating, seed, depth, max_runs, chunk_runs):
+    done = 0
+    while done < request["runs"]:
+        time.sleep(0.001)  # ~1 ms per chunk
+        done += chunk_runs
+        yield {"p": 0.5, "n_runs": done}
+
+
+def _states(sizes):
+    return [SimulationState(request={"runs": n}) for n in sizes]
+
+
+def test_round_robin_is_selected_by_config():
+    scheduler = get_scheduler(SimulationConfig(scheduler="ROUND_ROBIN", quantum_ms=7))
+    assert isinstance(scheduler, RoundRobinScheduler)
+    assert scheduler.quantum_ms == 7
+
+
+def test_large_simulation_does_not_starve_short_ones():
+    kernel = TricksterKernel(services={"mc_engine_stream": mc_engine_stream})
+    cfg = SimulationConfig(scheduler="ROUND_ROBIN", quantum_ms=5, chunk_runs=100)
+    # The giant (200 chunks) arrives first
+    results, metrics = kernel.run_round_robin(
+        [IngestAction(), MonteCarloAction(), EmitAction()], _states([20_000, 100, 100, 100, 100]), cfg
+    )
+
+    giant = metrics.completion_ms[0]
+    shorts = [metrics.completion_ms[i] for i in range(1, 5)]
+    assert max(shorts) < giant / 4
+
+    giant_state, giant_journal = results[0]
+    assert giant_state.mc_result == {"p": 0.5, "n_runs": 20_000}
+    assert [s.name for s in giant_journal.steps] == ["ingest", "monte_carlo", "emit"]
+    assert all(s.status == "OK" for s in giant_journal.steps)
+    # Only time actually spent sampling counts, not time waiting for other states
+    assert giant_journal.steps[1].duration_ms <= giant + 1
+    assert len({j.run_id for _, j in results}) == 5
+
+
+def test_quantum_metrics():
+    class SlowIngest(IngestAction):
+        def run(self, ctx, state, config):
+            time.sleep(0.02)  # not resumable: overruns a 5 ms quantum
+            return super().run(ctx, state, config)
+
+    kernel = TricksterKernel(services={"mc_engine_stream": mc_engine_stream})
+    cfg = SimulationConfig(scheduler="ROUND_ROBIN", quantum_ms=5)
+    _, metrics = kernel.run_round_robin([SlowIngest(), MonteCarloAction()], _states([1000, 1000, 1000]), cfg)
+
+    summary = metrics.summary()
+    assert summary["quanta"] == len(metrics.quanta) >= 6
+    assert summary["overrun_ms_max"] >= 10
+    assert 0 < summary["fairness_min"] <= 1.0
+    assert summary["latency_p50_ms"] <= summary["latency_p99_ms"]
+    assert {q.state_index for q in metrics.quanta} == {0, 1, 2}
+
+
+def test_mc_without_stream_service_runs_whole():
+    kernel = TricksterKernel(services={"mc_engine": lambda **kw: {"p": 0.5}})
+    cfg = SimulationConfig(scheduler="ROUND_ROBIN", quantum_ms=1)
+    results, metrics = kernel.run_round_robin([MonteCarloAction()], _states([1, 1]), cfg)
+    assert all(st.mc_result == {"p": 0.5} and not st.degraded for st, _ in results)
+    assert len(metrics.quanta) == 2
+
+
+def test_jain_index():
+    assert jain_index([5, 5, 5]) == 1.0
+    assert abs(jain_index([9, 0, 0]) - 1 / 3) < 1e-9
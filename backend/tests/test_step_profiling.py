@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+from app.sim_kernel.config import SimulationConfig
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.profiling import PerfProfiler, StepProfiler, profiler_for_request
+from app.sim_kernel.store import JournalStore
+from app.sim_kernel.actions import build_pipeline
+
+
+def mc_engine(request, features, rating, seed, depth, max_runs):
+    buf = bytearray(2_000_000)  # a visible allocation peak
+    deadline = time.process_time() + 0.005
+    while time.process_time() < deadline:  # burn CPU, not just wall time
+        pass
+    return {"p": 0.5, "size": len(buf)}
+
+
+def _run(profiler, scheduler="FIFO"):
+    kernel = TricksterKernel(services={"mc_engine": mc_engine}, profiler=profiler)
+    return kernel.run(
+        build_pipeline(["ingest", "monte_carlo", "emit"]),
+        SimulationState(request={"a": "A"}),
+        SimulationConfig(scheduler=scheduler),
+    )
+
+
+def test_no_profiler_leaves_counters_unset():
+    st, journal = _run(None)
+    assert all(s.wall_ns is None and s.cpu_ns is None for s in journal.steps)
+    assert "profile" not in st.artifacts["response"]["meta"]
+
+
+def test_timing_profile_in_journal_and_meta():
+    st, journal = _run(PerfProfiler())
+    ingest, mc, emit = journal.steps
+    # Sub-millisecond steps still get a non-zero wall time
+    assert 0 < ingest.wall_ns < 1_000_000
+    assert mc.cpu_ns >= 4_000_000
+    assert mc.alloc_peak_bytes is None
+
+    meta = st.artifacts["response"]["meta"]
+    assert [p["name"] for p in meta["profile"]] == ["ingest", "monte_carlo"]
+    assert meta["profile"][1]["cpu_ns"] == mc.cpu_ns
+
+
+def test_memory_profile_records_allocation_peak():
+    _, journal = _run(PerfProfiler(trace_memory=True))
+    mc = journal.steps[1]
+    assert mc.alloc_peak_bytes >= 2_000_000
+    assert journal.steps[0].alloc_peak_bytes < 2_000_000
+
+
+def test_memory_profile_stops_tracing_it_started():
+    assert not tracemalloc.is_tracing()
+    _run(PerfProfiler(trace_memory=True))
+    assert not tracemalloc.is_tracing()
+
+    # Tracing that was already running is left alone
+    tracemalloc.start()
+    try:
+        _run(PerfProfiler(trace_memory=True))
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_batch_run_stops_tracing_it_started():
+    assert not tracemalloc.is_tracing()
+    kernel = TricksterKernel(services={"mc_engine": mc_engine}, profiler=PerfProfiler(trace_memory=True))
+    results = kernel.run_batch(
+        build_pipeline(["ingest", "monte_carlo", "emit"]),
+        [SimulationState(request={"a": "A"}), SimulationState(request={"a": "B"})],
+        SimulationConfig(),
+    )
+    assert all(j.steps[1].alloc_peak_bytes >= 2_000_000 for _, j in results)
+    assert not tracemalloc.is_tracing()
+
+
+def test_round_robin_accumulates_slices():
+    def stream(request, features, rating, seed, depth, max_runs, chunk_runs):
+        for n in range(5):
+            time.sleep(0.002)
+            yield {"p": 0.5, "n": n}
+
+    kernel = TricksterKernel(services={"mc_engine_stream": stream}, profiler=PerfProfiler())
+    results, metrics = kernel.run_round_robin(
+        build_pipeline(["monte_carlo"]),
+        [SimulationState(request={})],
+        SimulationConfig(scheduler="ROUND_ROBIN", quantum_ms=3),
+    )
+    step = results[0][1].steps[0]
+    assert len(metrics.quanta) > 1
+    assert step.wall_ns >= 10_000_000
+
+
+def test_step_profiler_subclasses_must_implement_start_and_stop():
+    class StartOnly(StepProfiler):
+        def start(self):
+            return None
+
+    with pytest.raises(TypeError):
+        StepProfiler()
+    with pytest.raises(TypeError):
+        StartOnly()
+
+
+def test_profiler_for_request():
+    assert profiler_for_request(None, 0.0) is None
+    assert profiler_for_request("off", 1.0, allow_header=True) is None
+    assert profiler_for_request("1", allow_header=True).trace_memory is False
+    assert profiler_for_request("memory", allow_header=True).trace_memory is True
+    # Without the server-side opt-in the header is ignored
+    assert profiler_for_request("memory") is None
+    assert profiler_for_request("memory", 0.5, rng=lambda: 0.1).trace_memory is False
+    assert isinstance(profiler_for_request(None, 0.5, rng=lambda: 0.1), PerfProfiler)
+    assert profiler_for_request(None, 0.5, rng=lambda: 0.9) is None
+
+
+def test_store_ranks_hot_actions():
+    store = JournalStore()
+    store.write([_run(PerfProfiler())[1], _run(None)[1]])
+    hot = store.hot_actions()
+    assert hot[0]["name"] == "monte_carlo"
+    assert hot[0]["profiled"] == 1
+    assert {h["name"] for h in hot} == {"ingest", "monte_carlo", "emit"}
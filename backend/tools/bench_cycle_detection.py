@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: non-transitive cycle detection on tournament-sized matchup graphs.
+
+Builds a dense random matchup graph (every ordered pair of teams, win
+probabilities from noisy team strengths) and times
+find_non_transitive_cycles() on it, reporting the best and median of
+several repeats. Exits with code 1 when the median exceeds --max-ms.
+
+Usage:
+    cd backend && python tools/bench_cycle_detection.py
+    cd backend && python tools/bench_cycle_detection.py --teams 800 --repeats 3 --max-ms 5000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.sim_kernel.cycles import find_non_transitive_cycles
+
+
+def _graph(n, seed=1):
+    rng = np.random.default_rng(seed)
+    nodes = [f"T{i}" for i in range(n)]
+    strength = rng.normal(size=n)
+    edges = [
+        {"u": nodes[i], "v": nodes[j], "p": float(1 / (1 + np.exp(strength[j] - strength[i] + rng.normal(0, 0.5))))}
+        for i in range(n) for j in range(n) if i != j
+    ]
+    return nodes, edges
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=400, help="Nodes in the matchup graph")
+    parser.add_argument("--max-triangles", type=int, default=500, help="Triangle listing cap")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs")
+    parser.add_argument("--max-ms", type=float, default=2000.0, help="Fail when the median run exceeds this")
+    args = parser.parse_args()
+
+    nodes, edges = _graph(args.teams)
+    timings_ms = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        report = find_non_transitive_cycles(nodes, edges, max_triangles=args.max_triangles)
+        timings_ms.append((time.perf_counter() - start) * 1000)
+
+    median = statistics.median(timings_ms)
+    print(f"teams={args.teams} edges={len(edges)} max_triangles={args.max_triangles}")
+    print(f"  triangles={len(report.triangles)} truncated={report.truncated} components={len(report.components)}")
+    print(f"  best={min(timings_ms):8.1f} ms  median={median:8.1f} ms  (limit {args.max_ms:.0f} ms)")
+    return 0 if median <= args.max_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
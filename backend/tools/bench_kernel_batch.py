@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TricksterKernel.run per fixture vs run_batch over a whole slate.
+
+Both paths run Ingest -> MonteCarlo -> Emit over the same synthetic fixtures
+and do the same work per fixture: the base scenario only (no alternative
+scenarios, zeta entropy or spectral calibration). The per-fixture path
+draws it with _generate_distribution_values() once per fixture; the batch
+path wires an mc_engine_batch service that simulates the slate with one
+vectorized simulate_outcomes_batch() call. Journals stay per fixture.
+
+Usage:
+    cd backend && python tools/bench_kernel_batch.py
+    cd backend && python tools/bench_kernel_batch.py --fixtures 5000 --sims 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.api.schemas import EventInput, SimulationConfig as EngineConfig
+from app.core.distribution import SCENARIO_DEFINITIONS
+from app.core.engine import _generate_distribution_values, simulate_outcomes_batch
+from app.sim_kernel.config import Budget, SimulationConfig
+from app.sim_kernel.kernel import TricksterKernel
+from app.sim_kernel.state import SimulationState
+from app.sim_kernel.actions.ingest import IngestAction
+from app.sim_kernel.actions.mc_run import MonteCarloAction
+from app.sim_kernel.actions.emit import EmitAction
+
+
+def _event(request):
+    return EventInput(
+        home_team=request["home_team"],
+        away_team=request["away_team"],
+        home_rating=request["home_rating"],
+        away_rating=request["away_rating"],
+        home_advantage=request["home_advantage"],
+    )
+
+
+def mc_engine(request, features, rating, seed, depth, max_runs):
+    np.random.seed(seed)
+    values = _generate_distribution_values(
+        _event(request), EngineConfig(n_simulations=max_runs, seed=seed), SCENARIO_DEFINITIONS["base"]
+    )
+    return {"mean": float(values.mean()), "p50": float(np.percentile(values, 50))}
+
+
+def mc_engine_batch(requests, features, ratings, seed, depth, max_runs):
+    cols = simulate_outcomes_batch([_event(r) for r in requests], n_simulations=max_runs, seed=seed)
+    return [{"mean": float(m), "p50": float(p)} for m, p in zip(cols["mean"], cols["p50"])]
+
+
+def _slate(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ratings = rng.normal(1500, 150, size=(n, 2)).clip(800, 2400)
+    return [
+        {
+            "home_team": f"Home {i}",
+            "away_team": f"Away {i}",
+            "home_rating": float(h),
+            "away_rating": float(a),
+            "home_advantage": 50.0,
+        }
+        for i, (h, a) in enumerate(ratings)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", type=int, default=2000, help="Fixtures per slate")
+    parser.add_argument("--sims", type=int, default=1000, help="Monte Carlo runs per fixture")
+    args = parser.parse_args()
+
+    slate = _slate(args.fixtures)
+    config = SimulationConfig(seed=42, journal_hashing="off", budget=Budget(max_mc_runs=args.sims, max_ms_total=600_000))
+    actions = [IngestAction(), MonteCarloAction(), EmitAction()]
+
+    kernel = TricksterKernel(services={"mc_engine": mc_engine})
+    start = time.perf_counter()
+    for request in slate:
+        kernel.run(actions, SimulationState(request=request), config)
+    per_state_s = time.perf_counter() - start
+
+    kernel = TricksterKernel(services={"mc_engine_batch": mc_engine_batch})
+    start = time.perf_counter()
+    results = kernel.run_batch(actions, [SimulationState(request=r) for r in slate], config)
+    batch_s = time.perf_counter() - start
+
+    assert len(results) == len(slate) and all(len(j.steps) == len(actions) for _, j in results)
+    print(f"fixtures={args.fixtures} sims={args.sims}")
+    print(f"  run (per fixture): {per_state_s * 1000:10.1f} ms  ({per_state_s / args.fixtures * 1e6:8.1f} us/fixture)")
+    print(f"  run_batch:         {batch_s * 1000:10.1f} ms  ({batch_s / args.fixtures * 1e6:8.1f} us/fixture)")
+    print(f"  speedup:           {per_state_s / batch_s:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request overhead of the backend middleware stack.
+
+Compares the legacy BaseHTTPMiddleware implementations of RequestID +
+Idempotency against the current pure ASGI ones, both wrapping the same
+trivial endpoint. Requests are driven directly through the ASGI interface
+(no sockets, no TestClient) so only middleware cost is measured.
+
+Usage:
+    cd backend && python tools/bench_middleware.py [--requests 20000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from statistics import median
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+
+
+# --- Legacy implementations (pre pure-ASGI port), kept for comparison only ---
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        start_time = time.time()
+        response = await call_next(request)
+        duration_ms = int((time.time() - start_time) * 1000)
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Process-Time"] = str(duration_ms)
+        request.state.duration_ms = duration_ms
+        return response
+
+
+class LegacyIdempotencyMiddleware(BaseHTTPMiddleware):
+    store: dict = {}
+
+    async def dispatch(self, request, call_next):
+        if request.method not in ["POST", "PUT", "PATCH", "DELETE"]:
+            return await call_next(request)
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            return await call_next(request)
+        response = await call_next(request)
+        if 200 <= response.status_code < 300:
+            self.store[key] = (response, datetime.now())
+        return response
+
+
+# --- Harness ---
+
+async def _endpoint(request):
+    return JSONResponse({"ok": True})
+
+
+def _build(stack):
+    app = Starlette(routes=[Route("/bench", _endpoint, methods=["GET", "POST"])])
+    for mw in stack:
+        app.add_middleware(mw)
+    app.middleware_stack = app.build_middleware_stack()
+    return app
+
+
+async def _drive(app, method: str, n: int) -> list[int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": "/bench",
+        "raw_path": b"/bench",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter_ns()
+        await app(dict(scope), receive, send)
+        samples.append(time.perf_counter_ns() - t0)
+    return samples
+
+
+def _report(label: str, samples: list[int], baseline: float) -> float:
+    samples = sorted(samples)
+    p50 = median(samples) / 1000
+    p99 = samples[int(len(samples) * 0.99) - 1] / 1000
+    print(f"  {label:<10} p50={p50:8.1f}us  p99={p99:8.1f}us  overhead={p50 - baseline:8.1f}us")
+    return p50
+
+
+async def main(n: int) -> None:
+    bare = _build([])
+    legacy = _build([LegacyRequestIDMiddleware, LegacyIdempotencyMiddleware])
+    current = _build([RequestIDMiddleware, IdempotencyMiddleware])
+
+    for method in ("GET", "POST"):
+        # Warm-up
+        for app in (bare, legacy, current):
+            await _drive(app, method, min(n, 500))
+
+        print(f"{method} x {n}")
+        base = median(await _drive(bare, method, n)) / 1000
+        print(f"  {'bare':<10} p50={base:8.1f}us")
+        old = _report("legacy", await _drive(legacy, method, n), base)
+        new = _report("asgi", await _drive(current, method, n), base)
+        if new - base > 0:
+            print(f"  speedup (overhead): {(old - base) / (new - base):.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
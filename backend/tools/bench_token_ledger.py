@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-process load test of the token-gated flow.
+
+Drives TokenLedger and RedisTokenLedger directly (no HTTP) from a thread pool
+and reports consume / status / record throughput with p50/p99 latency for each
+concurrency level. Redis runs against fakeredis by default, or a real server
+with --redis-url.
+
+Invariants checked under contention (exit code 1 on violation):
+  - no negative balance: sum of successful charges == starting balance - final
+    balance, and the final balance is never below zero
+  - no double charge: N concurrent consumes sharing one idempotency key charge once
+
+Usage:
+    cd backend && python tools/bench_token_ledger.py
+    cd backend && python tools/bench_token_ledger.py --levels 1,16,256 --ops 2000
+    cd backend && python tools/bench_token_ledger.py --redis-url redis://localhost:6379/15
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.tokens import TokenLedger
+from app.core.redis_ledger import RedisTokenLedger
+from app.core.token_types import AccessDeniedError, FeatureTier, FEATURE_COSTS
+
+FEATURE = FeatureTier.FULL_DISTRIBUTION
+COST = FEATURE_COSTS[FEATURE]
+
+
+@dataclass
+class OpStats:
+    latencies_ns: List[int] = field(default_factory=list)
+    errors: int = 0
+    wall_s: float = 0.0
+
+    def line(self, label: str) -> str:
+        lat = sorted(self.latencies_ns)
+        if not lat:
+            return f"    {label:<8} no samples"
+        p50 = lat[len(lat) // 2] / 1000
+        p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))] / 1000
+        ops = len(lat) / self.wall_s if self.wall_s else 0.0
+        return f"    {label:<8} {ops:>10.0f} ops/s  p50={p50:8.1f}us  p99={p99:8.1f}us  errors={self.errors}"
+
+
+def _run(concurrency: int, n_ops: int, op: Callable[[int], None]) -> OpStats:
+    stats = OpStats()
+    lock = threading.Lock()
+
+    def worker(i: int) -> None:
+        t0 = time.perf_counter_ns()
+        try:
+            op(i)
+        except AccessDeniedError:
+            pass
+        except Exception:
+            with lock:
+                stats.errors += 1
+        dt = time.perf_counter_ns() - t0
+        with lock:
+            stats.latencies_ns.append(dt)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(n_ops)))
+    stats.wall_s = time.perf_counter() - start
+    return stats
+
+
+def bench_throughput(ledger, concurrency: int, n_ops: int, users: int) -> Dict[str, OpStats]:
+    user_ids = [f"bench-{uuid.uuid4().hex[:8]}-{u}" for u in range(users)]
+    for uid in user_ids:
+        ledger.set_balance(uid, n_ops * COST)
+
+    return {
+        "consume": _run(concurrency, n_ops, lambda i: ledger.consume_tokens(user_ids[i % users], FEATURE)),
+        "status": _run(concurrency, n_ops, lambda i: ledger.get_user_status(user_ids[i % users])),
+        "record": _run(concurrency, n_ops, lambda i: ledger.record_analysis(user_ids[i % users])),
+    }
+
+
+def check_no_negative_balance(ledger, concurrency: int, attempts: int, balance: int) -> List[str]:
+    uid = f"contend-{uuid.uuid4().hex[:8]}"
+    ledger.set_balance(uid, balance)
+    charged: List[int] = []
+    lock = threading.Lock()
+
+    def op(_):
+        tx = ledger.consume_tokens(uid, FEATURE)
+        with lock:
+            charged.append(tx.cost)
+
+    _run(concurrency, attempts, op)
+    final = ledger.get_balance(uid)
+    violations = []
+    if final < 0:
+        violations.append(f"negative balance: final={final}")
+    if sum(charged) != balance - final:
+        violations.append(f"charge mismatch: charged={sum(charged)} start={balance} final={final}")
+    if len(charged) > balance // COST:
+        violations.append(f"overdraft: {len(charged)} successes with balance for {balance // COST}")
+    return violations
+
+
+def check_no_double_charge(ledger, concurrency: int, attempts: int) -> List[str]:
+    uid = f"idem-{uuid.uuid4().hex[:8]}"
+    key = f"idem-key-{uuid.uuid4().hex}"
+    start_balance = 10 * COST
+    ledger.set_balance(uid, start_balance)
+    tx_ids = set()
+    lock = threading.Lock()
+
+    def op(_):
+        tx = ledger.consume_tokens(uid, FEATURE, idempotency_key=key)
+        with lock:
+            tx_ids.add(tx.transaction_id)
+
+    _run(concurrency, attempts, op)
+    final = ledger.get_balance(uid)
+    violations = []
+    if start_balance - final != COST:
+        violations.append(f"double charge: {start_balance - final} tokens taken for one key")
+    if len(tx_ids) != 1:
+        violations.append(f"idempotency: {len(tx_ids)} distinct transactions for one key")
+    return violations
+
+
+def _ledgers(redis_url: str, pool_size: int) -> Dict[str, Callable[[], object]]:
+    # Size the connection pool to the highest concurrency level (redis-py defaults to 100)
+    def make_redis():
+        if redis_url:
+            import redis
+            client = redis.from_url(redis_url, decode_responses=True, max_connections=pool_size)
+        else:
+            import fakeredis
+            client = fakeredis.FakeRedis(decode_responses=True, max_connections=pool_size)
+        return RedisTokenLedger(client=client)
+
+    return {"TokenLedger": TokenLedger, "RedisTokenLedger": make_redis}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--levels", default="1,4,16,64,256", help="Comma-separated concurrency levels")
+    parser.add_argument("--ops", type=int, default=2000, help="Operations per op type per level")
+    parser.add_argument("--users", type=int, default=50, help="Distinct users in the throughput phase")
+    parser.add_argument("--redis-url", default=os.getenv("BENCH_REDIS_URL", ""),
+                        help="Real Redis URL (default: fakeredis in-process)")
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",") if x.strip()]
+
+    failed = False
+    for name, factory in _ledgers(args.redis_url, max(levels) + 8).items():
+        ledger = factory()
+        backend = "redis" if getattr(ledger, "use_redis", False) else "memory"
+        print(f"{name} ({backend})")
+        for c in levels:
+            print(f"  concurrency={c}")
+            for op, stats in bench_throughput(ledger, c, args.ops, args.users).items():
+                print(stats.line(op))
+
+            violations = (
+                check_no_negative_balance(ledger, c, attempts=max(4 * c, 50), balance=5 * COST + 1)
+                + check_no_double_charge(ledger, c, attempts=max(2 * c, 20))
+            )
+            for v in violations:
+                print(f"    INVARIANT VIOLATION: {v}")
+            failed = failed or bool(violations)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
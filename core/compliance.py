@@ -0,0 +1,125 @@
+"""
+Compliance Scanner - Shared forbidden-vocabulary engine
+
+One precompiled regex per vocabulary finds every term in a single pass
+over the text. This is the single implementation, used by:
+- oracle.language_guard.language_guard (Spanish, substrings)
+- core.exporter.validate_vocabulary (export guard, substrings)
+- app.core.explain.validate_text_compliance in the backend (English, whole
+  words), which imports it through app.core.compliance
+
+Keep it stdlib-only: the backend imports it without the root requirements.
+
+Build scanners once at import time (module level) and reuse them.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class TermScanner:
+    """
+    Case-insensitive multi-term matcher.
+
+    The alternation sits inside a zero-width lookahead, so the regex engine
+    tries every start position once and reports overlapping terms too
+    ("sure bet" and "bet"). Alternatives are ordered longest first; shorter
+    terms that are a prefix of a longer one at the same position are
+    recovered from a precomputed table.
+
+    Args:
+        terms: Vocabulary (matched case-insensitively)
+        whole_words: Require a word boundary on both sides of a term
+            (``\\bterm\\b``); otherwise match anywhere, as a substring
+    """
+
+    def __init__(self, terms: Iterable[str], whole_words: bool = True):
+        self.terms: List[str] = list(dict.fromkeys(terms))
+        self.whole_words = whole_words
+        self._canonical: Dict[str, str] = {t.lower(): t for t in self.terms}
+        self._max_len = max((len(t) for t in self._canonical), default=0)
+
+        ordered = sorted(self._canonical, key=len, reverse=True)
+        body = "|".join(re.escape(t) for t in ordered)
+        if whole_words:
+            body = rf"\b(?:{body})\b"
+        self._find = re.compile(f"(?=({body}))", re.IGNORECASE)
+        # Consuming form for substitution: leftmost-longest, non-overlapping
+        self._sub = re.compile(body if whole_words else f"(?:{body})", re.IGNORECASE)
+
+        # Shorter terms matched wherever a longer term starting with them matches.
+        self._implied: Dict[str, List[str]] = {}
+        for longer in ordered:
+            for shorter in ordered:
+                if len(shorter) < len(longer) and longer.startswith(shorter):
+                    if not whole_words or not _is_word_char(longer[len(shorter)]):
+                        self._implied.setdefault(longer, []).append(shorter)
+
+    def _iter(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        # (start, lowercased term) for every occurrence, overlaps included
+        for match in self._find.finditer(text, pos, len(text) if endpos is None else endpos):
+            key = match.group(1).lower()
+            yield match.start(), key
+            for shorter in self._implied.get(key, ()):
+                yield match.start(), shorter
+
+    def findall(self, text: str, spans: Optional[Sequence[Tuple[int, int]]] = None) -> List[str]:
+        """
+        Every distinct term present in ``text``, in order of first occurrence.
+
+        With ``spans`` ([start, end) offsets, e.g. interpolated values in a
+        pre-validated template), only terms overlapping a span are reported,
+        and only a window of the longest term length around each span is
+        scanned.
+        """
+        found: Dict[str, None] = {}
+        if spans is None:
+            for _, key in self._iter(text):
+                found[key] = None
+        else:
+            pad = self._max_len
+            for start, end in spans:
+                # endpos one char past the widest match, so the trailing \b sees real text
+                for at, key in self._iter(text, max(0, start - pad), min(len(text), end + pad + 1)):
+                    if at < end and at + len(key) > start:
+                        found[key] = None
+        return [self._canonical[k] for k in found]
+
+    def search(self, text: str) -> Optional[str]:
+        """The first term found in ``text``, or None."""
+        match = self._find.search(text)
+        return self._canonical[match.group(1).lower()] if match else None
+
+    def sub(self, repl: Union[str, Mapping[str, str], Callable[[str], str]], text: str) -> str:
+        """
+        Replace every term in one pass.
+
+        ``repl`` may be a string, a mapping from term to replacement (terms
+        missing from the mapping are removed), or a callable taking the
+        canonical term.
+        """
+        if isinstance(repl, str):
+            return self._sub.sub(lambda m: repl, text)
+        if isinstance(repl, Mapping):
+            lookup = repl
+            return self._sub.sub(lambda m: lookup.get(self._canonical[m.group(0).lower()], ""), text)
+        return self._sub.sub(lambda m: repl(self._canonical[m.group(0).lower()]), text)
+
+
+def iter_strings(data) -> Iterable[str]:
+    """Every string key and value in a nested dict/list structure (iterative walk)."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            for k, v in reversed(list(item.items())):
+                stack.append(v)
+                stack.append(k)
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
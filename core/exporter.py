@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 from typing import Dict, Any, List
 from pydantic import BaseModel, Field
 
+from core.compliance import TermScanner, iter_strings
+
 class ExportedReport(BaseModel):
     """Strict schema for exported reports (Sprint W1.1)"""
     app_version: str
@@ -18,6 +20,7 @@ class ExportedReport(BaseModel):
     audit: Dict[str, Any] # determinism_signature, created_at_utc, inputs_hashes
 
 PROHIBITED_TERMS = ["bet", "value", "opportunity", "roi", "pick", "profit", "win"]
+PROHIBITED_SCANNER = TermScanner(PROHIBITED_TERMS, whole_words=False)
 
 class ExportGuardError(Exception):
     """Raised when prohibited vocabulary is detected in export."""
@@ -25,21 +28,15 @@ class ExportGuardError(Exception):
 
 def validate_vocabulary(data: Any):
     """
-    Recursively scans data for prohibited terms.
+    Scans every string key and value in data for prohibited terms.
     Task W1.3 - Vocabulary Guard.
+
+    All strings are joined (NUL-separated, so no term spans two of them)
+    and scanned in one pass.
     """
-    if isinstance(data, str):
-        lower_text = data.lower()
-        for term in PROHIBITED_TERMS:
-            if term in lower_text:
-                raise ExportGuardError(f"Prohibited term '{term}' detected in export content.")
-    elif isinstance(data, dict):
-        for k, v in data.items():
-            validate_vocabulary(k)
-            validate_vocabulary(v)
-    elif isinstance(data, list):
-        for item in data:
-            validate_vocabulary(item)
+    term = PROHIBITED_SCANNER.search("\0".join(iter_strings(data)))
+    if term is not None:
+        raise ExportGuardError(f"Prohibited term '{term}' detected in export content.")
 
 class ReportExporter:
     """
@@ -1,14 +1,86 @@
-import json
+import numpy as np
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+from .registry import get_registry
+
+DEFAULT_MAX_POINTS = 200
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling of a series to ``n_out`` points.
+
+    Keeps the first and last points and, from each of the ``n_out - 2``
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Bucket means
+    are computed up front; only the per-bucket argmax walks the buckets.
+
+    Returns:
+        Sorted indices of the kept points (all indices when len(x) <= n_out)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / sizes
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / sizes
+    # The bucket after the last one is the final point
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs(
+            (x[a] - next_x[b]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[b] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        kept[b + 1] = a
+    return kept
+
+
 class ChartBuilder:
-    def __init__(self, policy_path: str):
-        with open(policy_path, 'r') as f:
-            self.policy = json.load(f)
+    def __init__(self, policy_path: Optional[str] = None, max_points: Optional[int] = None):
+        self.policy_path = policy_path
+        self._max_points = max_points
+
+    @property
+    def policy(self) -> Dict[str, Any]:
+        # Served from the contract registry; re-read only when the file changes
+        registry = get_registry()
+        if self.policy_path is None:
+            return registry.get("chart_policy")
+        return registry.load(self.policy_path)
+
+    @property
+    def max_points(self) -> int:
+        if self._max_points is not None:
+            return self._max_points
+        return int(self.policy.get("max_points", DEFAULT_MAX_POINTS))
+
+    def build_series(self, series: Dict[str, Any]) -> Dict[str, Any]:
+        """Chart series downsampled (LTTB) to the point budget, with JSON-ready x/y lists."""
+        x = np.asarray(series.get("x", []), dtype=np.float64)
+        y = np.asarray(series.get("y", []), dtype=np.float64)
+        keep = lttb_indices(x, y, self.max_points)
+        return {
+            "name": series.get("name"),
+            "x": np.round(x[keep], 6).tolist(),
+            "y": np.round(y[keep], 6).tolist()
+        }
 
     def build_chart(self, verdict: Dict[str, Any], sim_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Enforces EXACTLY ONE chart policy. 
+        Enforces EXACTLY ONE chart policy.
         Returns empty/disabled chart if verdict says no.
         """
         if not verdict.get("value_detected", False):
@@ -19,8 +91,8 @@ class ChartBuilder:
             }
 
         # Value detected -> Build the single chart
-        series = sim_data.get("chart_series", {})
-        
+        series = self.build_series(sim_data.get("chart_series", {}))
+
         return {
             "enabled": True,
             "type": "DENSITY",
@@ -31,7 +103,8 @@ class ChartBuilder:
             }
         }
 
-def get_chart_builder():
-    import os
-    policy_path = os.path.join(os.path.dirname(__file__), "contracts", "chart_policy.json")
-    return ChartBuilder(policy_path)
+
+@lru_cache(maxsize=None)
+def get_chart_builder() -> ChartBuilder:
+    """Shared builder over contracts/chart_policy.json."""
+    return ChartBuilder()
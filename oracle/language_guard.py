@@ -1,4 +1,4 @@
-import re
+from core.compliance import TermScanner
 
 FORBIDDEN_TERMS = [
     "apuesta", "apostar", "pick", "ganador", "recomendado", "recomendación",
@@ -13,31 +13,27 @@ ALLOWED_REPLACEMENTS = {
     "apuesta": "decisión"
 }
 
+# Substring matching (no word boundaries): "apuestas" is caught via "apuesta"
+FORBIDDEN_SCANNER = TermScanner(FORBIDDEN_TERMS, whole_words=False)
+
 def language_guard(text: str) -> str:
     """
     Deterministic guard: remove/replace forbidden terms; 
     if cannot sanitize, hard-fail.
     """
-    original_text = text
-    
-    # 1. Try to replace terms that have direct mappings
-    for term, replacement in ALLOWED_REPLACEMENTS.items():
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        text = pattern.sub(replacement, text)
-        
-    # 2. For other forbidden terms, try to remove them if they still exist
-    for term in FORBIDDEN_TERMS:
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        if pattern.search(text):
-            # Check if it was already replaced (case where term is key in ALLOWED_REPLACEMENTS)
-            if term not in ALLOWED_REPLACEMENTS:
-                text = pattern.sub("", text)
+    # 1-2. One pass: terms with a direct mapping are replaced, all others removed.
+    # Removal can join fragments into a new term ("lo" + "stake" + "ck"), so repeat
+    # while anything is left, a bounded number of times.
+    term = FORBIDDEN_SCANNER.search(text)
+    for _ in range(len(FORBIDDEN_TERMS)):
+        if term is None:
+            break
+        text = FORBIDDEN_SCANNER.sub(ALLOWED_REPLACEMENTS, text)
+        term = FORBIDDEN_SCANNER.search(text)
 
     # 3. Final verification - Hard fail if any forbidden term remains
-    lower_text = text.lower()
-    for term in FORBIDDEN_TERMS:
-        if term in lower_text:
-            raise ValueError(f"Language guard failure: Forbidden term '{term}' detected and could not be sanitized in text: {text[:100]}...")
+    if term is not None:
+        raise ValueError(f"Language guard failure: Forbidden term '{term}' detected and could not be sanitized in text: {text[:100]}...")
 
     return text
 
@@ -7,9 +7,35 @@ from typing import Dict, Any, List
 from core.utils import generate_event_key
 from sim.scenario import Scenario
 from core.db.models import RiskProfileEnum
+from .cache import LRUCache
 from .language_guard import language_guard
 from .telemetry import log_oracle_request
 
+# sim_result per (event_key, risk_profile, stake, features, seed). event_key is
+# date-scoped, so entries naturally stop matching the next day.
+SIM_RESULT_CACHE = LRUCache(maxsize=1024)
+# Outcome arrays per (event_key, features, seed, n_sims); shared by requests
+# that differ only in stake or risk profile (PLS does not depend on stake).
+OUTCOME_CACHE = LRUCache(maxsize=256)
+DEFAULT_SEED = 42
+
+
+def _parse_seed(value: Any) -> int:
+    """Request seed as a non-negative int (DEFAULT_SEED when absent); ValueError otherwise."""
+    if value is None:
+        return DEFAULT_SEED
+    if isinstance(value, int) and not isinstance(value, bool):
+        seed = value
+    elif isinstance(value, float) and value.is_integer():
+        seed = int(value)
+    elif isinstance(value, str) and value.strip().isdigit():
+        seed = int(value)
+    else:
+        raise ValueError(f"Invalid seed {value!r}: must be a non-negative integer.")
+    if seed < 0:
+        raise ValueError(f"Invalid seed {value!r}: must be a non-negative integer.")
+    return seed
+
 def evaluate_oracle_request(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main Oracle Composer Pipeline (Hardware-aligned v2).
@@ -23,6 +49,7 @@ def evaluate_oracle_request(request: Dict[str, Any]) -> Dict[str, Any]:
     opponent = request.get("opponent")
     profile_str = request.get("risk_profile", "NEUTRAL")
     stake = request.get("stake", 100.0)
+    seed = _parse_seed(request.get("seed"))
     
     # Validation
     if not primary or not opponent:
@@ -36,20 +63,28 @@ def evaluate_oracle_request(request: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     event_key = generate_event_key(sport, "PRO_LEAGUE", primary, opponent, datetime.now(timezone.utc))
-    snapshot_id = f"snap_{request_id[:8]}"
-    snapshot_data = {"primary": primary, "opponent": opponent, "features": features}
+    cache_key = (event_key, profile_str, stake, tuple(sorted(features.items())), seed)
+    sim_result = SIM_RESULT_CACHE.get(cache_key)
+    cache_hit = sim_result is not None
 
     # 2. Execute Simulation (Risk-First Engine)
-    scenario = Scenario(
-        event_key=event_key,
-        risk_profile=profile_str,
-        stake=stake,
-        features=features,
-        snapshot_id=snapshot_id,
-        snapshot_data=snapshot_data
-    )
-    
-    sim_result = scenario.evaluate() # Uses adaptive sims
+    if not cache_hit:
+        snapshot_id = f"snap_{request_id[:8]}"
+        snapshot_data = {"primary": primary, "opponent": opponent, "features": features}
+        scenario = Scenario(
+            event_key=event_key,
+            risk_profile=profile_str,
+            stake=stake,
+            features=features,
+            snapshot_id=snapshot_id,
+            snapshot_data=snapshot_data,
+            seed=seed,
+            outcome_cache=OUTCOME_CACHE
+        )
+        sim_result = scenario.evaluate() # Uses adaptive sims
+        SIM_RESULT_CACHE[cache_key] = sim_result
+    # Cached results keep the snapshot they were computed from
+    snapshot_id = sim_result["snapshot_id"]
     pls_percent = sim_result["pls"] * 100
     zone = sim_result["zone"]
 
@@ -87,7 +122,7 @@ def evaluate_oracle_request(request: Dict[str, Any]) -> Dict[str, Any]:
             "fragility": sim_result["fragility"]
         },
         "details": {
-            "tail_percentiles": sim_result["tail_percentiles"],
+            "tail_percentiles": dict(sim_result["tail_percentiles"]),
             "n_sims": sim_result["n_sims"],
             "signature": sim_result["determinism_signature"]
         },
@@ -97,7 +132,8 @@ def evaluate_oracle_request(request: Dict[str, Any]) -> Dict[str, Any]:
         },
         "audit": {
             "timing_ms": (time.time() - t_start) * 1000,
-            "snapshot_id": snapshot_id
+            "snapshot_id": snapshot_id,
+            "cache_hit": cache_hit
         }
     }
     
@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ORACLE_DIR = os.path.dirname(__file__)
+DEFAULT_ROOTS = (os.path.join(ORACLE_DIR, "contracts"), os.path.join(ORACLE_DIR, "config"))
+
+
+class ContractRegistry:
+    """
+    Shared cache of the Oracle's JSON contracts and config files.
+
+    Each file is parsed once. Every lookup stats the file and re-parses
+    it only when its mtime or size changed, so edited policies are picked
+    up without a restart and unchanged ones cost one os.stat(). Callers
+    get the cached object and must treat it as read-only.
+
+    Args:
+        roots: Directories searched, in order, for ``<name>.json``
+    """
+
+    def __init__(self, roots: Sequence[str] = DEFAULT_ROOTS):
+        self.roots = list(roots)
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> str:
+        """Path of contract ``name`` (file stem, e.g. "chart_policy")."""
+        for root in self.roots:
+            candidate = os.path.join(root, f"{name}.json")
+            if os.path.exists(candidate):
+                return candidate
+        raise KeyError(f"Unknown contract '{name}'. Available: {self.names()}")
+
+    def names(self) -> List[str]:
+        """Every contract name under the registry roots."""
+        found: Dict[str, None] = {}
+        for root in self.roots:
+            if os.path.isdir(root):
+                for entry in sorted(os.listdir(root)):
+                    if entry.endswith(".json"):
+                        found[entry[:-5]] = None
+        return list(found)
+
+    def get(self, name: str) -> Any:
+        """Parsed contract ``name``, reloaded if the file changed on disk."""
+        return self.load(self.path(name))
+
+    def load(self, path: str) -> Any:
+        """Parsed JSON at ``path`` (any file, cached by absolute path)."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != stamp:
+                with open(path, 'r') as f:
+                    entry = (stamp, json.load(f))
+                self._entries[path] = entry
+        return entry[1]
+
+    def clear(self, path: Optional[str] = None) -> None:
+        """Drop one cached file (or all), forcing a re-read on next access."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> ContractRegistry:
+    """Process-wide registry over oracle/contracts and oracle/config."""
+    return ContractRegistry()
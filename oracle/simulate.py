@@ -1,22 +1,77 @@
 import numpy as np
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional
 from app.core.engine import simulate_event_v2
 from app.api.schemas import EventInput, SimulationConfig
 
+CHART_POINTS = 100
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def density_series(
+    samples: np.ndarray,
+    points: int = CHART_POINTS,
+    method: str = "kde",
+    bandwidth: Optional[float] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Density of samples in [0, 1] on a fixed grid, as float32 arrays.
+
+    "kde" is a binned Gaussian kernel density estimate: samples are
+    counted once onto the grid points and the kernel is applied as a
+    (points x points) matrix product, so the cost is O(n + points^2)
+    rather than O(n * points). "hist" is a normalized fixed-bin histogram
+    reported at the bin centers.
+
+    Args:
+        samples: Simulated values in [0, 1]
+        points: Grid size (bins for "hist")
+        method: "kde" or "hist"
+        bandwidth: KDE bandwidth; defaults to Scott's rule, floored at the grid spacing
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if method == "hist":
+        counts, edges = np.histogram(samples, bins=points, range=(0.0, 1.0), density=True)
+        x = 0.5 * (edges[:-1] + edges[1:])
+        return {"x": x.astype(np.float32), "y": counts.astype(np.float32)}
+    if method != "kde":
+        raise ValueError(f"Unknown density method '{method}'. Must be 'kde' or 'hist'")
+
+    x = np.linspace(0.0, 1.0, points)
+    step = x[1] - x[0]
+    n = samples.size
+    if bandwidth is None:
+        bandwidth = 1.06 * samples.std() * n ** (-1 / 5) if n > 1 else 0.0
+    bandwidth = max(bandwidth, step)
+
+    # Nearest grid point per sample (values outside [0, 1] land on the ends)
+    nearest = np.clip(np.rint(samples / step), 0, points - 1).astype(np.intp)
+    counts = np.bincount(nearest, minlength=points)
+    u = (x[:, None] - x[None, :]) / bandwidth
+    kernel = np.exp(-0.5 * u * u)
+    y = kernel @ counts / (max(n, 1) * bandwidth * _SQRT_2PI)
+    return {"x": x.astype(np.float32), "y": y.astype(np.float32)}
+
+
 def run_oracle_simulation(
-    sport: str, 
-    primary: str, 
-    opponent: str, 
+    sport: str,
+    primary: str,
+    opponent: str,
     n_sims: int = 1000,
-    seed: int = None
+    seed: int = None,
+    density: str = "kde"
 ) -> Dict[str, Any]:
     """
     Wrapper for the existing TRICKSTER engine.
     Normalizes outputs into the distribution representation required by the Oracle.
+
+    raw_distribution is the engine's own sample array (what VerdictEngine
+    analyzes); chart_series x/y are the float32 density_series() arrays.
+    Both stay numpy arrays; ChartBuilder.build_series rounds and converts
+    the series to lists when the chart is serialized.
     """
     start_time = time.time()
-    
+
     # 1. Map Oracle inputs to Engine inputs (Mapping placeholder for MVP)
     # In a real scenario, we'd fetch ratings from data adapters.
     event = EventInput(
@@ -26,34 +81,20 @@ def run_oracle_simulation(
         away_rating=1500.0,  # Placeholder
         sport=sport.lower()
     )
-    
+
     config = SimulationConfig(
         n_simulations=n_sims,
         seed=seed
     )
-    
-    # 2. Execute V2 Engine
-    dist_obj = simulate_event_v2(event, config)
-    
-    # 3. Extract the raw distribution values (simulated percentages)
-    # The engine uses a base scenario distribution.
-    # We'll regenerate a simple normal distribution around the mean for the MVP 
-    # if raw values aren't directly exposed in the return object (it returns stats).
-    # However, the engine _generate_distribution_values exists.
-    
-    # For MVP, we'll use the mean and stdev to represent the density.
-    # In a production version, we'd pass the full array.
-    
-    # Generate synthetic series for the chart based on engine stats
-    x = np.linspace(0, 1, 100).tolist()
-    # Simple probability density function (Gaussian)
-    y = [
-        float(1/(dist_obj.stdev * np.sqrt(2 * np.pi)) * np.exp(- (xi - dist_obj.mean)**2 / (2 * dist_obj.stdev**2)))
-        for xi in x
-    ]
+
+    # 2. Execute V2 Engine, keeping the sample buffer the stats came from
+    dist_obj, samples = simulate_event_v2(event, config, return_samples=True)
+
+    # 3. Chart density from the real samples
+    series = density_series(samples, method=density)
 
     return {
-        "raw_distribution": [dist_obj.mean], # Mocking distribution array
+        "raw_distribution": samples,
         "stats": {
             "mean": dist_obj.mean,
             "stdev": dist_obj.stdev,
@@ -61,8 +102,8 @@ def run_oracle_simulation(
         },
         "chart_series": {
             "name": f"Distribución {primary}",
-            "x": x,
-            "y": y
+            "x": series["x"],
+            "y": series["y"]
         },
         "execution_ms": (time.time() - start_time) * 1000
     }
@@ -1,14 +1,281 @@
-import logging
+import atexit
 import json
-from typing import Dict, Any
+import logging
+import logging.handlers
+import os
+import queue
+import sqlite3
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Sequence
 
 logger = logging.getLogger("oracle.telemetry")
 
+# Upper bounds (ms) of the timing histogram buckets; the last bucket is open-ended
+TIMING_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler over a bounded queue that never blocks the caller.
+
+    When the queue is full the oldest pending record is dropped (ring
+    buffer) and counted in ``dropped``. Records are enqueued as-is: the
+    payload travels on ``record.extra`` and is serialized only by the
+    listener thread.
+    """
+
+    def __init__(self, q: "queue.Queue[logging.LogRecord]"):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+
+class TelemetryStats:
+    """Running aggregates of oracle requests (request counts, zones, timing histogram)."""
+
+    def __init__(self, buckets_ms: Sequence[float] = TIMING_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.cache_hits = 0
+            self.zones: Dict[str, int] = {}
+            self.timing_counts = [0] * (len(self.buckets_ms) + 1)
+            self.timing_sum_ms = 0.0
+            self.timing_max_ms = 0.0
+            self.n_sims_total = 0
+
+    def add(self, event: Dict[str, Any]) -> None:
+        timing = float(event["performance"]["timing_ms"])
+        zone = event["verdict"]["risk_zone"]
+        with self._lock:
+            self.requests += 1
+            self.cache_hits += bool(event.get("cache_hit"))
+            self.zones[zone] = self.zones.get(zone, 0) + 1
+            self.timing_counts[bisect_left(self.buckets_ms, timing)] += 1
+            self.timing_sum_ms += timing
+            self.timing_max_ms = max(self.timing_max_ms, timing)
+            self.n_sims_total += int(event["performance"]["n_sims"])
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"le_{b:g}" for b in self.buckets_ms] + ["inf"]
+            return {
+                "requests": self.requests,
+                "cache_hits": self.cache_hits,
+                "zones": dict(self.zones),
+                "timing_ms": {
+                    "histogram": dict(zip(labels, self.timing_counts)),
+                    "mean": self.timing_sum_ms / self.requests if self.requests else 0.0,
+                    "max": self.timing_max_ms
+                },
+                "n_sims_total": self.n_sims_total
+            }
+
+
+class TelemetrySink:
+    """
+    Batched persistence of telemetry events: JSONL by default, SQLite
+    when the path ends in .db/.sqlite/.sqlite3.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        if path.endswith((".db", ".sqlite", ".sqlite3")):
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS oracle_requests ("
+                " request_id TEXT, event_key TEXT, risk_zone TEXT, pls_score REAL, fragility REAL,"
+                " n_sims INTEGER, timing_ms REAL, cache_hit INTEGER, payload TEXT)"
+            )
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        if self._conn is not None:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO oracle_requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            e.get("request_id"), e.get("event_key"), e["verdict"]["risk_zone"],
+                            e["verdict"]["pls_score"], e["verdict"]["fragility"],
+                            e["performance"]["n_sims"], e["performance"]["timing_ms"],
+                            int(bool(e.get("cache_hit"))), json.dumps(e, default=str)
+                        )
+                        for e in events
+                    ],
+                )
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(e, default=str) + "\n" for e in events)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class TelemetryListener(logging.handlers.QueueListener):
+    """
+    Background consumer of the telemetry queue.
+
+    Aggregates every event into ``stats`` and writes events to the sink in
+    batches: a batch is written when it reaches ``batch_size`` or when the
+    queue drains, so bursts become a few large writes and idle periods
+    still persist promptly. Each record is then passed on to the handlers
+    of the ``oracle.telemetry`` logger's ancestors (normally the app's root
+    handler), as propagation would have done, but from this thread.
+    """
+
+    def __init__(
+        self,
+        q: "queue.Queue[logging.LogRecord]",
+        stats: TelemetryStats,
+        sink: Optional[TelemetrySink] = None,
+        batch_size: int = 256
+    ):
+        super().__init__(q)
+        self.stats = stats
+        self.sink = sink
+        self.batch_size = max(1, int(batch_size))
+        self._pending: List[Dict[str, Any]] = []
+
+    def handle(self, record: logging.LogRecord) -> None:
+        event = getattr(record, "extra", None)
+        if not isinstance(event, dict):
+            return
+        try:
+            self.stats.add(event)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"Malformed telemetry event skipped: {e}")
+        if self.sink is not None:
+            self._pending.append(event)
+            if len(self._pending) >= self.batch_size or self.queue.empty():
+                self._write_pending()
+        self._forward(record, event)
+
+    def _forward(self, record: logging.LogRecord, event: Dict[str, Any]) -> None:
+        parent = logger.parent
+        if parent is None or record.levelno < parent.getEffectiveLevel():
+            return
+        # Same line as the synchronous logger used to emit; record.extra stays
+        # on the record for app.logging.JSONFormatter to merge
+        record.msg = f"ORACLE_METRIC: {json.dumps(event, default=str)}"
+        record.args = None
+        while parent is not None:
+            for handler in parent.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            if not parent.propagate:
+                break
+            parent = parent.parent
+
+    def stop(self) -> None:
+        super().stop()
+        if self._pending:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        batch, self._pending = self._pending, []
+        try:
+            self.sink.write(batch)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Telemetry sink write failed ({len(batch)} events dropped): {e}")
+
+
+class OracleTelemetry:
+    """
+    In-process telemetry pipeline: RingQueueHandler on the
+    ``oracle.telemetry`` logger feeding a TelemetryListener thread.
+    Propagation is switched off while running; the listener forwards
+    records to the ancestor handlers instead, off the request path.
+
+    Args:
+        path: JSONL or SQLite file for batched events (None = aggregate only)
+        max_queue: Pending events held before the oldest are dropped
+        batch_size: Events per sink write
+    """
+
+    def __init__(self, path: Optional[str] = None, max_queue: int = 10_000, batch_size: int = 256):
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max_queue)
+        self.handler = RingQueueHandler(self.queue)
+        self.stats = TelemetryStats()
+        self.sink = TelemetrySink(path) if path else None
+        self.listener = TelemetryListener(self.queue, self.stats, self.sink, batch_size)
+        self._started = False
+
+    def start(self) -> "OracleTelemetry":
+        if not self._started:
+            self.listener.start()
+            logger.addHandler(self.handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            self._started = True
+        return self
+
+    def flush(self) -> None:
+        """Block until every queued event has been aggregated and written."""
+        if self._started:
+            self.queue.join()
+
+    def stop(self) -> None:
+        if self._started:
+            logger.removeHandler(self.handler)
+            logger.propagate = True
+            self.listener.stop()
+            self._started = False
+        if self.sink is not None:
+            self.sink.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats.snapshot(), "dropped": self.handler.dropped}
+
+
+_telemetry: Optional[OracleTelemetry] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry() -> OracleTelemetry:
+    """Process-wide telemetry pipeline; events persist to $ORACLE_TELEMETRY_PATH when set."""
+    global _telemetry
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                _telemetry = OracleTelemetry(os.getenv("ORACLE_TELEMETRY_PATH")).start()
+                atexit.register(_telemetry.stop)
+    return _telemetry
+
+
 def log_oracle_request(output: Dict[str, Any]):
     """
     Structured logging for Oracle requests (v2 Risk-First).
     Excludes PII/secrets.
+
+    Only enqueues the event (never blocks); serialization, aggregation
+    and persistence happen on the telemetry listener thread.
     """
+    get_telemetry()
     telemetry = {
         "event": "oracle_request_v2",
         "request_id": output.get("request_id"),
@@ -21,7 +288,10 @@ def log_oracle_request(output: Dict[str, Any]):
         "performance": {
             "n_sims": output["details"]["n_sims"],
             "timing_ms": output["audit"]["timing_ms"]
-        }
+        },
+        "cache_hit": output["audit"].get("cache_hit", False)
     }
-    
-    logger.info(f"ORACLE_METRIC: {json.dumps(telemetry)}")
+
+    # Carried on record.extra (app.logging.JSONFormatter merges it as-is); the
+    # listener forwards it to the root handlers as "ORACLE_METRIC: {json}"
+    logger.info("ORACLE_METRIC", extra={"extra": telemetry})
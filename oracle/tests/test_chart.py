@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+# Set up paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from oracle.chart import ChartBuilder, get_chart_builder, lttb_indices
+from oracle.registry import ContractRegistry, get_registry
+
+
+class TestContractRegistry(unittest.TestCase):
+
+    def test_covers_contracts_and_config(self):
+        names = get_registry().names()
+        self.assertIn("chart_policy", names)
+        self.assertIn("verdict_defaults", names)
+        self.assertIs(get_registry().get("chart_policy"), get_registry().get("chart_policy"))
+        with self.assertRaises(KeyError):
+            get_registry().get("missing_contract")
+
+    def test_reloads_on_change(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "policy.json")
+            with open(path, "w") as f:
+                json.dump({"max_points": 50}, f)
+            registry = ContractRegistry([root])
+            first = registry.get("policy")
+            self.assertIs(registry.get("policy"), first)
+
+            with open(path, "w") as f:
+                json.dump({"max_points": 500}, f)
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            self.assertEqual(registry.get("policy"), {"max_points": 500})
+
+
+class TestChartBuilder(unittest.TestCase):
+
+    def test_lttb_keeps_ends_and_extremes(self):
+        x = np.linspace(0, 1, 10_000)
+        y = np.exp(-((x - 0.3) ** 2) / 0.001)
+        keep = lttb_indices(x, y, 100)
+        self.assertEqual(len(keep), 100)
+        self.assertEqual((keep[0], keep[-1]), (0, len(x) - 1))
+        self.assertTrue(np.all(np.diff(keep) > 0))
+        self.assertAlmostEqual(float(y[keep].max()), 1.0, delta=0.01)
+        np.testing.assert_array_equal(lttb_indices(x[:50], y[:50], 100), np.arange(50))
+
+    def test_chart_series_downsampled_to_budget(self):
+        self.assertIs(get_chart_builder(), get_chart_builder())
+        x = np.linspace(0, 1, 2000, dtype=np.float32)
+        sim_data = {"chart_series": {"name": "s", "x": x, "y": np.sin(x)}}
+        chart = ChartBuilder(max_points=64).build_chart({"value_detected": True}, sim_data)
+        series = chart["data"]["series"]
+        self.assertEqual(len(series), 1)
+        self.assertEqual(len(series[0]["x"]), 64)
+        self.assertIsInstance(series[0]["y"][0], float)
+
+        disabled = get_chart_builder().build_chart({"value_detected": False}, sim_data)
+        self.assertFalse(disabled["enabled"])
+        self.assertEqual(disabled["data"]["series"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+
+# Set up paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from oracle.pipeline import evaluate_oracle_request, SIM_RESULT_CACHE, OUTCOME_CACHE
+
+
+class TestPipelineCache(unittest.TestCase):
+
+    def setUp(self):
+        SIM_RESULT_CACHE.clear()
+        OUTCOME_CACHE.clear()
+        self.request = {
+            "sport": "FOOTBALL",
+            "primary": "Team A",
+            "opponent": "Team B",
+            "risk_profile": "CONSERVATIVE",
+            "stake": 100.0,
+            "rating_diff": -300.0
+        }
+
+    def test_repeated_request_reuses_result(self):
+        first = evaluate_oracle_request(self.request)
+        second = evaluate_oracle_request(self.request)
+        self.assertFalse(first["audit"]["cache_hit"])
+        self.assertTrue(second["audit"]["cache_hit"])
+        self.assertEqual(second["verdict"], first["verdict"])
+        self.assertEqual(second["details"], first["details"])
+        self.assertEqual(second["audit"]["snapshot_id"], first["audit"]["snapshot_id"])
+        self.assertNotEqual(second["request_id"], first["request_id"])
+
+    def test_seed_is_validated(self):
+        self.assertEqual(
+            evaluate_oracle_request(dict(self.request, seed="7"))["details"],
+            evaluate_oracle_request(dict(self.request, seed=7))["details"]
+        )
+        for bad in ("abc", [1], {"a": 1}, -1, 1.5, True):
+            with self.assertRaises(ValueError):
+                evaluate_oracle_request(dict(self.request, seed=bad))
+
+    def test_stake_change_reuses_outcomes(self):
+        first = evaluate_oracle_request(self.request)
+        simulated = len(OUTCOME_CACHE)
+        hits = OUTCOME_CACHE.hits
+
+        other = evaluate_oracle_request(dict(self.request, stake=5000.0))
+        self.assertFalse(other["audit"]["cache_hit"])
+        self.assertEqual(len(OUTCOME_CACHE), simulated)
+        self.assertGreater(OUTCOME_CACHE.hits, hits)
+        self.assertEqual(other["verdict"], first["verdict"])
+        # The signature still covers the stake
+        self.assertNotEqual(other["details"]["signature"], first["details"]["signature"])
+
+    def test_features_and_seed_are_part_of_the_key(self):
+        evaluate_oracle_request(self.request)
+        self.assertFalse(evaluate_oracle_request(dict(self.request, rating_diff=250.0))["audit"]["cache_hit"])
+        self.assertFalse(evaluate_oracle_request(dict(self.request, seed=7))["audit"]["cache_hit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
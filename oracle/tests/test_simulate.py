@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import json
+
+import numpy as np
+
+# Set up paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "backend")))
+
+from oracle.chart import ChartBuilder
+from oracle.simulate import run_oracle_simulation, density_series
+from oracle.verdict_engine import get_engine
+
+# np.trapz was renamed np.trapezoid in numpy 2.0
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+class TestOracleSimulation(unittest.TestCase):
+
+    def test_returns_engine_samples(self):
+        result = run_oracle_simulation("FOOTBALL", "Team A", "Team B", n_sims=2000, seed=11)
+        samples = result["raw_distribution"]
+        self.assertEqual(len(samples), 2000)
+        self.assertAlmostEqual(float(np.mean(samples)), result["stats"]["mean"], places=9)
+
+        verdict = get_engine().analyze(samples, "FAST")
+        self.assertNotIn("INSUFFICIENT_DATA", verdict["reason_codes"])
+
+    def test_chart_series_is_serialized_by_the_chart_builder(self):
+        series = run_oracle_simulation("FOOTBALL", "Team A", "Team B", n_sims=500, seed=11)["chart_series"]
+        self.assertEqual(series["x"].dtype, np.float32)
+        self.assertEqual(series["y"].dtype, np.float32)
+
+        built = ChartBuilder().build_series(series)
+        self.assertIsInstance(built["x"], list)
+        self.assertEqual(len(built["x"]), len(built["y"]))
+        self.assertEqual(json.loads(json.dumps(built)), built)
+
+    def test_density_series_is_float32(self):
+        series = density_series(np.random.default_rng(0).uniform(size=500))
+        self.assertEqual(series["x"].dtype, np.float32)
+        self.assertEqual(series["y"].dtype, np.float32)
+
+    def test_density_methods(self):
+        samples = np.random.default_rng(0).normal(0.5, 0.1, 5000)
+        kde = density_series(samples)
+        hist = density_series(samples, method="hist")
+        # Both integrate to ~1 and peak near the mean
+        self.assertAlmostEqual(float(trapezoid(kde["y"], kde["x"])), 1.0, places=2)
+        self.assertAlmostEqual(float(hist["y"].sum() * (hist["x"][1] - hist["x"][0])), 1.0, places=4)
+        self.assertAlmostEqual(float(kde["x"][np.argmax(kde["y"])]), 0.5, delta=0.03)
+        with self.assertRaises(ValueError):
+            density_series(samples, method="spline")
+
+
+if __name__ == "__main__":
+    unittest.main()
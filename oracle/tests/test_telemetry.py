@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import json
+import logging
+import sqlite3
+import tempfile
+
+# Set up paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from oracle.telemetry import OracleTelemetry, log_oracle_request
+
+
+def _output(i, zone="GREEN", timing_ms=12.0):
+    return {
+        "request_id": f"r{i}",
+        "event_key": "k",
+        "verdict": {"risk_zone": zone, "pls_score": 0.1, "fragility": 0.2},
+        "details": {"n_sims": 1000},
+        "audit": {"timing_ms": timing_ms, "cache_hit": i % 2 == 0}
+    }
+
+
+class TestOracleTelemetry(unittest.TestCase):
+
+    def test_aggregates_counters(self):
+        telemetry = OracleTelemetry().start()
+        try:
+            for i in range(10):
+                log_oracle_request(_output(i, zone="RED" if i < 3 else "GREEN", timing_ms=i * 100))
+            telemetry.flush()
+            snap = telemetry.snapshot()
+        finally:
+            telemetry.stop()
+        self.assertEqual(snap["requests"], 10)
+        self.assertEqual(snap["cache_hits"], 5)
+        self.assertEqual(snap["zones"], {"RED": 3, "GREEN": 7})
+        self.assertEqual(sum(snap["timing_ms"]["histogram"].values()), 10)
+        self.assertEqual(snap["timing_ms"]["histogram"]["le_5"], 1)
+        self.assertEqual(snap["timing_ms"]["max"], 900)
+        self.assertEqual(snap["dropped"], 0)
+
+    def test_batches_to_jsonl_and_sqlite(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name in ("events.jsonl", "events.db"):
+                path = os.path.join(root, name)
+                telemetry = OracleTelemetry(path, batch_size=4).start()
+                for i in range(9):
+                    log_oracle_request(_output(i))
+                telemetry.stop()
+                if name.endswith(".jsonl"):
+                    with open(path) as f:
+                        rows = [json.loads(line) for line in f]
+                    self.assertEqual([r["request_id"] for r in rows], [f"r{i}" for i in range(9)])
+                else:
+                    conn = sqlite3.connect(path)
+                    self.assertEqual(conn.execute("SELECT COUNT(*) FROM oracle_requests").fetchone()[0], 9)
+                    conn.close()
+
+    def test_forwards_metric_to_root_handlers(self):
+        class Capture(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.records = []
+
+            def emit(self, record):
+                self.records.append(record)
+
+        root = logging.getLogger()
+        capture, level = Capture(), root.level
+        root.addHandler(capture)
+        root.setLevel(logging.INFO)
+        telemetry = OracleTelemetry().start()
+        try:
+            log_oracle_request(_output(1))
+            telemetry.flush()
+        finally:
+            telemetry.stop()
+            root.removeHandler(capture)
+            root.setLevel(level)
+        metrics = [r for r in capture.records if r.name == "oracle.telemetry"]
+        self.assertTrue(metrics)
+        message = metrics[0].getMessage()
+        self.assertTrue(message.startswith("ORACLE_METRIC: "))
+        self.assertEqual(json.loads(message[len("ORACLE_METRIC: "):])["request_id"], "r1")
+        self.assertEqual(metrics[0].extra["verdict"]["risk_zone"], "GREEN")
+
+    def test_full_queue_drops_oldest_without_blocking(self):
+        telemetry = OracleTelemetry(max_queue=5)
+        for i in range(12):
+            telemetry.handler.handle(_record(i))
+        self.assertEqual(telemetry.handler.dropped, 7)
+        self.assertEqual([r.extra["request_id"] for r in list(telemetry.queue.queue)], [f"r{i}" for i in range(7, 12)])
+
+
+def _record(i):
+    record = logging.LogRecord("oracle.telemetry", logging.INFO, __file__, 0, "ORACLE_METRIC", None, None)
+    record.extra = {"request_id": f"r{i}"}
+    return record
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Set up paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from oracle.verdict_engine import get_engine, histogram_rows, load_config, DEFAULT_CONFIG_PATH
+
+
+class TestVerdictEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = get_engine()
+        rng = np.random.default_rng(7)
+        n = 1600
+        self.slate = np.vstack([
+            rng.normal(0.62, 0.05, n),                       # clear edge
+            rng.normal(0.50, 0.05, n),                       # no edge
+            np.concatenate([rng.normal(0.2, 0.02, n // 3),  # three separated modes
+                            rng.normal(0.5, 0.02, n // 3),
+                            rng.normal(0.8, 0.02, n - 2 * (n // 3))]),
+            np.full(n, 0.4),                                 # constant row
+        ])
+
+    def test_config_parsed_once(self):
+        self.assertIs(get_engine(), self.engine)
+        self.assertIs(load_config(DEFAULT_CONFIG_PATH), self.engine.config)
+
+    def test_batch_matches_single_analysis(self):
+        prices = [None, 2.5, 0.45, 1.9]
+        for mode in ("FAST", "ORACLE"):
+            batch = self.engine.analyze_batch(self.slate, mode, prices)
+            for row, price, result in zip(self.slate, prices, batch):
+                self.assertEqual(result, self.engine.analyze(list(row), mode, price))
+
+        reasons = [r["reason_codes"] for r in self.engine.analyze_batch(self.slate, "ORACLE")]
+        self.assertEqual(reasons[0], [])
+        self.assertIn("NO_EDGE", reasons[1])
+        self.assertIn("MULTIMODAL_CHAOS", reasons[2])
+
+    def test_batch_histograms_match_numpy(self):
+        for row, counts in zip(self.slate, histogram_rows(self.slate)):
+            np.testing.assert_array_equal(counts, np.histogram(row, bins=20)[0])
+
+    def test_batch_insufficient_data(self):
+        results = self.engine.analyze_batch(self.slate[:, :500], "ORACLE")
+        self.assertEqual([r["reason_codes"] for r in results], [["INSUFFICIENT_DATA"]] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
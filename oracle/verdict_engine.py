@@ -1,47 +1,94 @@
-import json
+import os
 import numpy as np
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Union
+
+from .registry import get_registry
+
+HIST_BINS = 20
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config", "verdict_defaults.json")
+
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    """Parsed verdict config, via the contract registry (re-read only when the file changes)."""
+    return get_registry().load(config_path)
+
+
+def count_peaks(hist: np.ndarray) -> np.ndarray:
+    """Strict local maxima of histogram counts along the last axis (end bins excluded)."""
+    hist = np.asarray(hist)
+    inner = hist[..., 1:-1]
+    return np.count_nonzero((inner > hist[..., :-2]) & (inner > hist[..., 2:]), axis=-1)
+
+
+def histogram_rows(samples: np.ndarray, bins: int = HIST_BINS) -> np.ndarray:
+    """
+    np.histogram(row, bins=bins) for every row of a 2-D matrix at once.
+
+    Each row is binned over its own [min, max] range, with the same edge
+    handling as numpy (last bin closed, constant rows widened by 0.5).
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    n_rows = samples.shape[0]
+    first = samples.min(axis=1)
+    last = samples.max(axis=1)
+    constant = first == last
+    first = np.where(constant, first - 0.5, first)
+    last = np.where(constant, last + 0.5, last)
+    edges = np.linspace(first, last, bins + 1, axis=1)
+
+    # Bin index from the uniform spacing, as numpy does ...
+    scaled = samples - first[:, None]
+    scaled *= (bins / (last - first))[:, None]
+    idx = scaled.astype(np.intp)
+    np.minimum(idx, bins - 1, out=idx)
+    # ... then corrected against the actual edges, which only moves values
+    # within rounding distance of an edge
+    scaled -= idx
+    scaled -= 0.5
+    rows, cols = np.nonzero(np.abs(scaled, out=scaled) > 0.5 - 1e-9)
+    near = idx[rows, cols]
+    values = samples[rows, cols]
+    near -= values < edges[rows, near]
+    near += (values >= edges[rows, near + 1]) & (near != bins - 1)
+    idx[rows, cols] = near
+
+    idx += (np.arange(n_rows) * bins)[:, None]
+    return np.bincount(idx.ravel(), minlength=n_rows * bins).reshape(n_rows, bins)
+
 
 class VerdictEngine:
-    def __init__(self, config_path: str):
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        self.config_path = config_path
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return load_config(self.config_path)
 
     def analyze(self, distribution: List[float], mode: str, reference_price: Optional[float] = None) -> Dict[str, Any]:
         """
         Implements deterministic verdict logic based on simulation distribution.
         """
+        distribution = np.asarray(distribution, dtype=np.float64)
         samples = len(distribution)
-        min_samples = self.config[f"min_samples_{mode.lower()}"]
-        
-        value_detected = False
-        value_strength = "NONE"
-        confidence = "LOW"
-        reason_codes = []
-        kill_switches = []
-        chart_enabled = False
+        config = self.config
+        min_samples = config[f"min_samples_{mode.lower()}"]
 
         # 1. Sample Check
         if samples < min_samples:
-            reason_codes.append("INSUFFICIENT_DATA")
-            return self._compose_result(False, "NONE", "LOW", reason_codes, kill_switches, False)
+            return self._compose_result(False, "NONE", "LOW", ["INSUFFICIENT_DATA"], [], False)
 
         # 2. Distribution Metrics
-        mean = np.mean(distribution)
-        std = np.std(distribution)
-        variance = np.var(distribution)
+        mean = distribution.mean()
+        std = distribution.std()
         # Simplified normalized variance for the purpose of the MVP
-        norm_variance = std / mean if mean != 0 else 1.0 
-        
+        norm_variance = std / mean if mean != 0 else 1.0
+
         # 3. Multimodality (Simplified peak detection)
-        hist, bins = np.histogram(distribution, bins=20)
-        peaks = 0
-        for i in range(1, len(hist)-1):
-            if hist[i] > hist[i-1] and hist[i] > hist[i+1]:
-                peaks += 1
-        
+        hist, _ = np.histogram(distribution, bins=HIST_BINS)
+        peaks = int(count_peaks(hist))
+
         # 4. Edge Calculation
-        edge = 0.0
         if reference_price:
             # Assume reference_price is implied probability if < 1.0, else decimal odds
             implied_prob = 1.0 / reference_price if reference_price > 1.0 else reference_price
@@ -50,37 +97,83 @@ class VerdictEngine:
             # Baseline edge check (relative to 50% for binary scenarios if no ref)
             edge = abs(mean - 0.5)
 
-        edge_min = self.config[f"edge_min_{mode.lower()}"]
-
-        # 5. Rule Enforcement
-        if edge < edge_min:
-            reason_codes.append("NO_EDGE")
-        
-        if norm_variance > self.config["max_variance"]:
-            reason_codes.append("HIGH_VARIANCE")
-            
-        if peaks > self.config["max_multimodality"]:
-            reason_codes.append("MULTIMODAL_CHAOS")
-
-        # 6. Final Verdict
-        if not reason_codes:
-            value_detected = True
-            chart_enabled = True
-            confidence = "HIGH" if mode == "ORACLE" else "MEDIUM"
-            
-            if edge > edge_min * 3:
-                value_strength = "HIGH"
-            elif edge > edge_min * 2:
-                value_strength = "MEDIUM"
-            else:
-                value_strength = "LOW"
-        else:
-            value_detected = False
-            chart_enabled = False
-            value_strength = "NONE"
-            confidence = "LOW"
+        return self._verdict(mode, edge, self._reason_codes(config, mode, edge, norm_variance, peaks), config)
 
-        return self._compose_result(value_detected, value_strength, confidence, reason_codes, kill_switches, chart_enabled)
+    def analyze_batch(
+        self,
+        distributions: np.ndarray,
+        mode: str,
+        reference_prices: Union[None, float, Sequence[Optional[float]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        analyze() for every row of a (n_events, n_samples) matrix in one call.
+
+        Metrics, histograms, peak counts and rule checks are computed for all
+        rows together; only the result dicts are built per row.
+
+        Args:
+            distributions: 2-D sample matrix, one simulated distribution per row
+            mode: "FAST" or "ORACLE"
+            reference_prices: One price for all rows, or one per row (None/0 = no reference)
+
+        Returns:
+            One analyze()-shaped result per row
+        """
+        distributions = np.asarray(distributions, dtype=np.float64)
+        if distributions.ndim != 2:
+            raise ValueError("analyze_batch expects a 2-D (n_events, n_samples) matrix")
+        n_rows, samples = distributions.shape
+        if n_rows == 0:
+            return []
+
+        config = self.config
+        if samples < config[f"min_samples_{mode.lower()}"]:
+            return [self._compose_result(False, "NONE", "LOW", ["INSUFFICIENT_DATA"], [], False) for _ in range(n_rows)]
+
+        mean = distributions.mean(axis=1)
+        std = distributions.std(axis=1)
+        safe_mean = np.where(mean != 0, mean, 1.0)
+        norm_variance = np.where(mean != 0, std / safe_mean, 1.0)
+        peaks = count_peaks(histogram_rows(distributions))
+
+        if reference_prices is None or np.isscalar(reference_prices):
+            reference_prices = [reference_prices] * n_rows
+        ref = np.array([price or 0.0 for price in reference_prices], dtype=np.float64)
+        has_ref = ref != 0
+        safe_ref = np.where(has_ref, ref, 1.0)
+        implied_prob = np.where(safe_ref > 1.0, 1.0 / safe_ref, safe_ref)
+        edge = np.where(has_ref, mean - implied_prob, np.abs(mean - 0.5))
+
+        reasons = self._reason_codes(config, mode, edge, norm_variance, peaks)
+        return [
+            self._verdict(mode, edge[i], [code for code, flags in reasons.items() if flags[i]], config)
+            for i in range(n_rows)
+        ]
+
+    def _reason_codes(self, config: Dict[str, Any], mode: str, edge, norm_variance, peaks):
+        # Rule enforcement; works on scalars and on per-row arrays
+        flags = {
+            "NO_EDGE": edge < config[f"edge_min_{mode.lower()}"],
+            "HIGH_VARIANCE": norm_variance > config["max_variance"],
+            "MULTIMODAL_CHAOS": peaks > config["max_multimodality"],
+        }
+        if np.ndim(edge) == 0:
+            return [code for code, flag in flags.items() if flag]
+        return flags
+
+    def _verdict(self, mode: str, edge: float, reason_codes: List[str], config: Dict[str, Any]) -> Dict[str, Any]:
+        if reason_codes:
+            return self._compose_result(False, "NONE", "LOW", reason_codes, [], False)
+
+        edge_min = config[f"edge_min_{mode.lower()}"]
+        confidence = "HIGH" if mode == "ORACLE" else "MEDIUM"
+        if edge > edge_min * 3:
+            value_strength = "HIGH"
+        elif edge > edge_min * 2:
+            value_strength = "MEDIUM"
+        else:
+            value_strength = "LOW"
+        return self._compose_result(True, value_strength, confidence, reason_codes, [], True)
 
     def _compose_result(self, detected, strength, conf, reasons, kills, chart) -> Dict[str, Any]:
         return {
@@ -92,7 +185,8 @@ class VerdictEngine:
             "chart_enabled": chart
         }
 
-def get_engine():
-    import os
-    config_path = os.path.join(os.path.dirname(__file__), "config", "verdict_defaults.json")
-    return VerdictEngine(config_path)
+
+@lru_cache(maxsize=None)
+def get_engine() -> VerdictEngine:
+    """Shared engine over the default config."""
+    return VerdictEngine(DEFAULT_CONFIG_PATH)
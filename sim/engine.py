@@ -46,26 +46,30 @@ class MonteCarloEngine:
         logit = (rating_diff + home_advantage) / 400.0
         p_win = 1.0 / (1.0 + np.exp(-logit))
         
-        outcomes = []
-        for _ in range(n_sims):
-            is_win = rng.random() < p_win
+        # Pre-sized buffer. Draws stay interleaved (uniform, then normal) per
+        # sim so the stream, and every seeded result, is unchanged.
+        outcomes = np.empty(n_sims, dtype=np.float64)
+        draw = rng.random
+        normal = rng.normal
+        for i in range(n_sims):
+            is_win = draw() < p_win
             
             if is_win:
-                gain = rng.normal(0.5, 0.2) # Adjusted for more realistic variance
+                gain = normal(0.5, 0.2) # Adjusted for more realistic variance
             else:
-                gain = rng.normal(-0.5, 0.3)
+                gain = normal(-0.5, 0.3)
             
-            outcomes.append(float(np.clip(gain, -1.0, 1.0)))
+            outcomes[i] = gain
             
-        return outcomes
+        return np.clip(outcomes, -1.0, 1.0, out=outcomes).tolist()
 
 def calculate_pls(outcomes: List[float]) -> float:
     """
     PLS (Probability of Large Loss)
     Large loss = >= 30% loss (outcome <= -0.3)
     """
-    large_losses = [o for o in outcomes if o <= -0.3]
-    return len(large_losses) / len(outcomes)
+    outcomes = np.asarray(outcomes, dtype=np.float64)
+    return int(np.count_nonzero(outcomes <= -0.3)) / len(outcomes)
 
 def get_risk_zone(pls: float, profile: str) -> str:
     """
@@ -1,5 +1,5 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from sim.engine import MonteCarloEngine, calculate_pls, get_risk_zone
 
@@ -12,6 +12,13 @@ class Scenario:
     snapshot_id: str
     snapshot_data: Dict[str, Any]
     seed: int = 42
+    # Optional shared map (get / item assignment) of outcome arrays keyed on
+    # (event_key, features, seed, n_sims). Outcomes do not depend on stake or
+    # risk profile, so scenarios differing only in those reuse one simulation.
+    outcome_cache: Optional[Any] = field(default=None, repr=False, compare=False)
+    
+    def features_key(self) -> tuple:
+        return tuple(sorted(self.features.items()))
     
     def evaluate(self, n_sims: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -26,7 +33,13 @@ class Scenario:
         target_sims = n_sims if n_sims is not None else 1000
         
         def run_pass(count):
-            outcomes = engine.run_simulation(self.features, n_sims=count)
+            key = (self.event_key, self.features_key(), self.seed, count)
+            outcomes = self.outcome_cache.get(key) if self.outcome_cache is not None else None
+            if outcomes is None:
+                outcomes = np.asarray(engine.run_simulation(self.features, n_sims=count))
+                outcomes.flags.writeable = False
+                if self.outcome_cache is not None:
+                    self.outcome_cache[key] = outcomes
             pls = calculate_pls(outcomes)
             zone = get_risk_zone(pls, self.risk_profile)
             return outcomes, pls, zone
@@ -46,17 +59,18 @@ class Scenario:
             self.stake
         )
         
-        tail_negative = [o for o in outcomes if o < 0]
-        fragility = float(np.std(tail_negative)) if tail_negative else 0.0
+        tail_negative = outcomes[outcomes < 0]
+        fragility = float(np.std(tail_negative)) if tail_negative.size else 0.0
+        p5, p10, p25 = np.percentile(outcomes, [5, 10, 25])
         
         return {
             "pls": pls,
             "zone": zone,
             "fragility": fragility,
             "tail_percentiles": {
-                "p5": float(np.percentile(outcomes, 5)),
-                "p10": float(np.percentile(outcomes, 10)),
-                "p25": float(np.percentile(outcomes, 25))
+                "p5": float(p5),
+                "p10": float(p10),
+                "p25": float(p25)
             },
             "n_sims": int(len(outcomes)),
             "determinism_signature": signature,
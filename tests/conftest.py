@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The simulation kernel and ratings live in the backend package (backend/app).
+# Appended, not prepended, so root-level packages keep precedence.
+_BACKEND = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+if _BACKEND not in sys.path:
+    sys.path.append(_BACKEND)
@@ -0,0 +1,14 @@
+from app.core import compliance as backend_compliance
+from core.compliance import TermScanner, iter_strings
+from oracle.language_guard import language_guard
+
+
+def test_backend_uses_the_root_scanner():
+    """app.core.compliance re-exports core.compliance; there is no second copy."""
+    assert backend_compliance.TermScanner is TermScanner
+    assert backend_compliance.iter_strings is iter_strings
+
+
+def test_language_guard_uses_shared_scanner():
+    assert language_guard("Las odds del partido") == "Las precio de referencia del partido"
+    assert list(iter_strings({"a": ["b", {"c": "d"}]})) == ["a", "b", "c", "d"]
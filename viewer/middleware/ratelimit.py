@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import time
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Tuple
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 
@@ -14,24 +15,52 @@ class Bucket:
 
 
 class RateLimitMiddleware:
+    """
+    Token-bucket limiter keyed by client IP, plus X-User-ID when present.
+
+    Buckets live in an LRU map capped at ``max_keys`` and are local to
+    each process. The viewer ships on its own (viewer/ only, no Redis), so
+    it does not use the backend's shared TokenBucketLimiter; with several
+    workers, each one enforces ``rps``/``burst`` separately.
+    """
+
     def __init__(
         self,
         app: ASGIApp,
         rps: float = 5.0,
         burst: float = 20.0,
         paths: Tuple[str, ...] = ("/reports", "/reports/", "/health", "/attestation"),
+        max_keys: int = 10_000,
     ):
         self.app = app
         self.rps = float(rps)
         self.burst = float(burst)
         self.paths = paths
-        self.buckets: Dict[str, Bucket] = {}
+        self.max_keys = int(max_keys)
+        self.buckets: "OrderedDict[str, Bucket]" = OrderedDict()
 
     def _refill(self, b: Bucket, now: float) -> None:
         elapsed = max(0.0, now - b.last_refill)
         b.tokens = min(self.burst, b.tokens + elapsed * self.rps)
         b.last_refill = now
 
+    def _allow_local(self, key: str) -> bool:
+        now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = Bucket(tokens=self.burst, last_refill=now)
+            self.buckets[key] = bucket
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+
+        self._refill(bucket, now)
+        if bucket.tokens < 1.0:
+            return False
+        bucket.tokens -= 1.0
+        return True
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         if scope["type"] != "http":
             await self.app(scope, receive, send)
@@ -42,18 +71,15 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Simple IP key logic from scope
+        # Always charge the client IP; X-User-ID is unauthenticated, so it only adds a bucket
         client = scope.get("client")
-        key = client[0] if client else "unknown"
-        
-        now = time.time()
-        bucket = self.buckets.get(key)
-        if bucket is None:
-            bucket = Bucket(tokens=self.burst, last_refill=now)
-            self.buckets[key] = bucket
+        keys = ["ip:" + (client[0] if client else "unknown")]
+        for name, value in scope.get("headers", []):
+            if name == b"x-user-id" and value:
+                keys.append("user:" + value.decode("latin-1"))
+                break
 
-        self._refill(bucket, now)
-        if bucket.tokens < 1.0:
+        if not all([self._allow_local(key) for key in keys]):
             # 429 Error
             await send({
                 "type": "http.response.start",
@@ -66,5 +92,4 @@ class RateLimitMiddleware:
             })
             return
 
-        bucket.tokens -= 1.0
         await self.app(scope, receive, send)
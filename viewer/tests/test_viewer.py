@@ -84,3 +84,40 @@ def test_invalid_report_format_422(tmp_reports_dir, monkeypatch):
     client = TestClient(app)
     r = client.get("/api/reports/bad")
     assert r.status_code in (404, 422)
+
+def test_ratelimit_buckets_are_lru_bounded():
+    from middleware.ratelimit import RateLimitMiddleware
+
+    async def ok(scope, receive, send):
+        pass
+
+    mw = RateLimitMiddleware(ok, rps=0.001, burst=1, max_keys=2)
+    assert mw._allow_local("user:a") is True
+    assert mw._allow_local("user:a") is False
+    mw._allow_local("user:b")
+    mw._allow_local("user:c")
+    assert list(mw.buckets) == ["user:b", "user:c"]
+    # Evicted key starts with a fresh bucket
+    assert mw._allow_local("user:a") is True
+
+def test_ratelimit_rotating_user_id_still_charges_ip():
+    import asyncio
+    from middleware.ratelimit import RateLimitMiddleware
+
+    async def ok(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    mw = RateLimitMiddleware(ok, rps=0.001, burst=2)
+
+    async def status_for(user_id):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/health", "client": ("10.0.0.1", 1), "headers": [(b"x-user-id", user_id)]}
+        await mw(scope, None, send)
+        return sent[0]["status"]
+
+    codes = [asyncio.run(status_for(f"u{i}".encode())) for i in range(3)]
+    assert codes == [200, 200, 429]